@@ -22,17 +22,21 @@ from src.game import Game
 async def main():
     """Async main function for web compatibility"""
     game = Game()
+    # Blocking in pygame.event.wait would freeze the browser; idle frames sleep in asyncio
+    game.controller.pacer.blocking = False
 
     running = True
     while running:
         # Handle events
-        for event in pygame.event.get():
+        events = game.controller.pacer.get_events()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 break
+            game.controller.managers["render"].handle_window_event(event)
 
             # Delegate event handling to game
-            game.controller.current_time = pygame.time.get_ticks()
+            game.controller.current_time = game.controller.sim_clock.ticks()
 
             # Handle debug events first if in gameplay modes
             from src.utils.settings import GameMode
@@ -57,6 +61,8 @@ async def main():
                         game.controller.player_color = color
 
             elif game.controller.game_mode == GameMode.TRAINING:
+                if game.controller.handle_speed_button(event):
+                    continue
                 if game.controller.systems["circle"] and game.controller.event_handler:
                     game.controller.event_handler.handle_events(event)
 
@@ -84,7 +90,7 @@ async def main():
         # Update game state
         from src.utils.settings import GameMode
         if game.controller.game_mode in [GameMode.ONLINE, GameMode.WAITING]:
-            new_mode, new_color = game.controller.managers["network"].handle_network_messages(
+            new_mode, new_color = game.controller.network_manager.handle_network_messages(
                 game.controller.game_mode,
                 game.controller.systems["circle"],
                 game.controller.player_color,
@@ -94,7 +100,7 @@ async def main():
                 game.controller.player_color = new_color
 
             if game.controller.game_mode == GameMode.ONLINE:
-                game.controller.managers["network"].handle_online_moves(
+                game.controller.network_manager.handle_online_moves(
                     game.controller.systems["circle"]
                 )
 
@@ -109,22 +115,28 @@ async def main():
 
         # Update training stats before rendering
         game.controller.update_training_stats()
+        game.controller.update_search_stats()
+        game.controller.update_frame_stats()
+
+        # Render frame; while fast-forwarding only every Nth frame is drawn
+        rendered = game.controller.sim_clock.next_frame()
+        changed = True
+        if rendered:
+            changed = game.controller.managers["render"].render_frame(
+                game.controller.game_mode,
+                game.controller.systems,
+            )
 
-        # Render frame
-        game.controller.managers["render"].render_frame(
-            game.controller.game_mode,
-            game.controller.systems,
-        )
-
-        game.controller.clock.tick(60)
+        busy = bool(events) or changed or game.controller.is_busy()
+        game.controller.pacer.end_frame(busy, tick=rendered)
 
-        # This is crucial for Pygbag - yield control to browser
-        await asyncio.sleep(0)
+        # This is crucial for Pygbag - yield control to browser; idle frames sleep longer
+        await asyncio.sleep(game.controller.pacer.idle_delay())
 
     # Cleanup
     from src.utils.settings import GameMode
     if game.controller.game_mode == GameMode.ONLINE:
-        game.controller.managers["network"].network_manager.shutdown()
+        game.controller.network_manager.shutdown()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+from importlib import import_module
+from importlib.util import find_spec
+import sys
+import threading
+from ..utils.settings import AI_BACKEND, BLUE
+
+STRATEGIC = "strategic"
+WEB = "web"
+BACKENDS = (STRATEGIC, WEB)
+
+
+def resolve_backend(backend=AI_BACKEND) -> str:
+    """Pick the AI backend; "auto" uses the web player in the browser or without TensorFlow."""
+    if backend == "auto":
+        if sys.platform == "emscripten":
+            return WEB
+        if find_spec("numpy") is None or find_spec("tensorflow") is None:
+            return WEB
+        return STRATEGIC
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown AI backend {backend!r}, expected one of {BACKENDS} or 'auto'")
+    return backend
+
+
+def warm_up(backend=AI_BACKEND):
+    """Import the strategic player's TensorFlow stack on a background thread, once."""
+    module = f"{__package__}.strategic_ai_player"
+    if resolve_backend(backend) != STRATEGIC or module in sys.modules:
+        return
+    # An import started here makes create_ai_player wait for it instead of importing twice
+    threading.Thread(target=import_module, args=(module,), daemon=True).start()
+
+
+def create_ai_player(circle_system, color=BLUE, save_manager=None, backend=AI_BACKEND):
+    """Create an AI player; the strategic player's TensorFlow stack is only imported here."""
+    if resolve_backend(backend) == WEB:
+        from .web_ai_player import WebAIPlayer
+
+        player = WebAIPlayer(circle_system, color=color)
+    else:
+        from .strategic_ai_player import StrategicAIPlayer
+
+        player = StrategicAIPlayer(circle_system, color=color)
+
+    if save_manager is not None:
+        player.initialize_save_manager(save_manager)
+    return player
@@ -19,9 +19,3 @@ class AnimationController:
     def reset_animation_duration(self):
         """Reset animation duration to default for all handlers"""
         self.set_animation_duration(self.default_rotation_duration)
-
-    def wait_for_animations(self):
-        """Wait for all animations to complete before proceeding."""
-        while self.system.is_any_circle_animating():
-            self.system.animation_handler.update()
-            self.system.update()
@@ -0,0 +1,209 @@
+from dataclasses import dataclass, field
+from typing import Dict, Generator, List, Optional, Tuple
+from ..utils.settings import ENDGAME_EMPTY_THRESHOLD, ENDGAME_MAX_DEPTH
+from ..utils.board.fast_board import FastBoard
+
+WIN = 1
+DRAW = 0
+LOSS = -1
+
+# Transposition table bound flags
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+# How many nodes to search between two should_stop checks and yields
+STOP_CHECK_INTERVAL = 64
+
+
+class _SearchAborted(Exception):
+    """Raised inside the search when the caller asks to stop."""
+
+
+@dataclass
+class EndgameResult:
+    """Outcome of an endgame search from the point of view of the side to move."""
+
+    outcome: str  # "win", "loss", "draw" or "unknown"
+    line: List[Tuple[str, int]] = field(default_factory=list)  # Moves until the turn passes
+    depth: int = 0
+    nodes: int = 0
+
+    @property
+    def is_proven(self) -> bool:
+        return self.outcome != "unknown"
+
+
+class EndgameSolver:
+    """
+    Exact alpha-beta solver for positions with only a few grey small circles left.
+
+    Searches placements and rotations on a FastBoard with the TurnHandler.get_winner rule
+    as the terminal test. Scores are WIN/DRAW/LOSS for the side to move; a placement keeps
+    the same player to move, so the score is only negated when the turn passes. Results
+    are stored in a transposition table keyed by position, and proven wins and losses are
+    reused at any depth.
+    """
+
+    def __init__(self, empty_threshold=ENDGAME_EMPTY_THRESHOLD, max_depth=ENDGAME_MAX_DEPTH):
+        self.empty_threshold = empty_threshold
+        self.max_depth = max_depth
+        # position key -> (value, depth, flag, best move, complete)
+        self.transposition_table: Dict[bytes, tuple] = {}
+        self._reset_counters()
+        self._truncated = False
+        self._path = set()
+        self._should_stop = None
+
+    def applies(self, board: FastBoard) -> bool:
+        """Check whether the position is small enough for the solver."""
+        return board.empty_count() <= self.empty_threshold
+
+    def solve(self, board: FastBoard, should_stop_callback=None) -> EndgameResult:
+        """Iteratively deepen until the position is proven or the depth/time limit is hit."""
+        steps = self.solve_steps(board, should_stop_callback)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def solve_steps(self, board: FastBoard, should_stop_callback=None):
+        """
+        Same as solve, as a generator for run_search_slice.
+
+        Yields every STOP_CHECK_INTERVAL nodes and returns the EndgameResult.
+        """
+        self._reset_counters()
+        self._should_stop = should_stop_callback
+        result = EndgameResult("unknown")
+
+        for depth in range(1, self.max_depth + 1):
+            self._truncated = False
+            self._path = set()
+            try:
+                value = yield from self._search(board, depth, LOSS, WIN)
+            except _SearchAborted:
+                break
+
+            result.depth = depth
+            result.line = self._principal_line(board)
+            if value == WIN:
+                result.outcome = "win"
+            elif value == LOSS:
+                result.outcome = "loss"
+            elif not self._truncated:
+                result.outcome = "draw"
+            if result.is_proven:
+                break
+
+        result.nodes = self.nodes
+        self._should_stop = None
+        return result
+
+    def clear(self):
+        self.transposition_table.clear()
+
+    def _reset_counters(self):
+        self.nodes = 0
+        self.table_hits = 0
+        self.table_lookups = 0
+        self.expanded_nodes = 0
+        self.children = 0
+
+    def _search(
+        self, board: FastBoard, depth: int, alpha: int, beta: int
+    ) -> Generator[None, None, int]:
+        self.nodes += 1
+        if self.nodes % STOP_CHECK_INTERVAL == 0:
+            if self._should_stop and self._should_stop():
+                raise _SearchAborted()
+            yield
+
+        winner = board.winner()
+        if winner:
+            return WIN if winner == board.turn_name else LOSS
+
+        key = board.position_key()
+        if key in self._path:
+            # Repeated position on the current line: a draw only along this path, so
+            # nothing above it may be stored as complete or reported as a proven draw
+            self._truncated = True
+            return DRAW
+
+        entry = self.transposition_table.get(key)
+        self.table_lookups += 1
+        best_move = None
+        if entry:
+            self.table_hits += 1
+            value, entry_depth, flag, best_move, complete = entry
+            if value != DRAW and flag == EXACT:
+                return value
+            if entry_depth >= depth:
+                if flag == EXACT or (flag == LOWER and value >= beta) or (
+                    flag == UPPER and value <= alpha
+                ):
+                    if not complete:
+                        self._truncated = True
+                    return value
+
+        if depth == 0:
+            self._truncated = True
+            return DRAW
+
+        moves = board.valid_moves()
+        if not moves:
+            return DRAW  # Nobody can move any more
+        self.expanded_nodes += 1
+        self.children += len(moves)
+        if best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+        original_alpha = alpha
+        truncated_before = self._truncated
+        self._truncated = False
+        best_value = LOSS - 1
+        self._path.add(key)
+        try:
+            for move in moves:
+                child = board.copy()
+                child.play(move)
+                if child.turn == board.turn:
+                    value = yield from self._search(child, depth - 1, alpha, beta)
+                else:
+                    value = -(yield from self._search(child, depth - 1, -beta, -alpha))
+
+                if value > best_value:
+                    best_value = value
+                    best_move = move
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+        finally:
+            self._path.discard(key)
+
+        if best_value <= original_alpha:
+            flag = UPPER
+        elif best_value >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        complete = not self._truncated
+        self.transposition_table[key] = (best_value, depth, flag, best_move, complete)
+        self._truncated = self._truncated or truncated_before
+        return best_value
+
+    def _principal_line(self, board: FastBoard) -> List[Tuple[str, int]]:
+        """Follow the stored best moves until the turn passes to the opponent."""
+        line = []
+        board = board.copy()
+        turn = board.turn
+        while board.turn == turn and board.winner() is None:
+            entry = self.transposition_table.get(board.position_key())
+            move: Optional[Tuple[str, int]] = entry[3] if entry else None
+            if move is None:
+                break
+            line.append(move)
+            board.play(move)
+        return line
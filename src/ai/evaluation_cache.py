@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+from ..utils.settings import EVAL_CACHE_PATH, EVAL_CACHE_MEMORY_ENTRIES
+
+
+@dataclass
+class CachedEvaluation:
+    """Stored search result for a position, from the point of view of the side to move."""
+
+    score: float
+    depth: int  # Plies the search looked ahead
+    best_move: List[Tuple[str, int]]  # Fast board moves played before the turn passes
+    complete: bool = False  # The search ran to the end instead of being cut off by its budget
+
+    def replaces(self, other: "CachedEvaluation") -> bool:
+        """Whether this result is worth more than other: complete first, then deeper."""
+        return (self.complete, self.depth) >= (other.complete, other.depth)
+
+
+def position_hash(board) -> bytes:
+    """Canonical hash of a fast board position (colors, side to move and phase)."""
+    return hashlib.blake2b(board.position_key(), digest_size=16).digest()
+
+
+class EvaluationCache:
+    """
+    Persistent position -> (score, depth, best move, complete) cache shared across sessions.
+
+    Backed by a SQLite file and read through an in-memory LRU. Writes are queued and
+    committed by a background thread so the game loop never waits on the disk.
+    """
+
+    _shared: Dict[str, "EvaluationCache"] = {}
+    _SENTINEL = None
+
+    def __init__(self, path=EVAL_CACHE_PATH, memory_entries=EVAL_CACHE_MEMORY_ENTRIES):
+        self.path = path
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[bytes, CachedEvaluation]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS evaluations ("
+            "key BLOB PRIMARY KEY, score REAL, depth INTEGER, best_move TEXT, "
+            "complete INTEGER DEFAULT 0)"
+        )
+        columns = [row[1] for row in self._connection.execute("PRAGMA table_info(evaluations)")]
+        if "complete" not in columns:
+            # Files written before the flag existed; their entries count as incomplete
+            self._connection.execute(
+                "ALTER TABLE evaluations ADD COLUMN complete INTEGER DEFAULT 0"
+            )
+        self._connection.commit()
+
+        self._writes = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    @classmethod
+    def shared(cls, path=EVAL_CACHE_PATH) -> "EvaluationCache":
+        """Get the cache instance for a file, so every AI player uses the same one."""
+        if path not in cls._shared:
+            cls._shared[path] = cls(path)
+        return cls._shared[path]
+
+    @classmethod
+    def close_shared(cls):
+        """Flush and close every shared cache."""
+        for cache in cls._shared.values():
+            cache.close()
+        cls._shared.clear()
+
+    def get(self, key: bytes) -> Optional[CachedEvaluation]:
+        """Look a position up in memory first, then on disk."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            row = self._connection.execute(
+                "SELECT score, depth, best_move, complete FROM evaluations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            score, depth, best_move, complete = row
+            moves = [tuple(move) for move in json.loads(best_move)]
+            entry = CachedEvaluation(score, depth, moves, bool(complete))
+            self._remember(key, entry)
+            return entry
+
+    def put(
+        self,
+        key: bytes,
+        score: float,
+        depth: int,
+        best_move: List[Tuple[str, int]],
+        complete: bool = False,
+    ):
+        """Store a result unless a better one is already known; the disk write is deferred."""
+        entry = CachedEvaluation(score, depth, list(best_move), complete)
+        with self._lock:
+            known = self._memory.get(key)
+            if known is not None and not entry.replaces(known):
+                return
+            self._remember(key, entry)
+        self._writes.put((key, entry))
+
+    def close(self):
+        """Write out all queued entries and stop the writer thread."""
+        if self._writer.is_alive():
+            self._writes.put(self._SENTINEL)
+            self._writer.join()
+        self._connection.close()
+
+    def _remember(self, key: bytes, entry: CachedEvaluation):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write_loop(self):
+        connection = sqlite3.connect(self.path)
+        running = True
+        while running:
+            batch = [self._writes.get()]
+            # Drain whatever else is queued so it goes into the same transaction
+            while not self._writes.empty():
+                batch.append(self._writes.get())
+
+            rows = []
+            for item in batch:
+                if item is self._SENTINEL:
+                    running = False
+                    continue
+                key, entry = item
+                rows.append(
+                    (key, entry.score, entry.depth, json.dumps(entry.best_move), entry.complete)
+                )
+
+            if rows:
+                # Keep the better of the stored and the new result, as CachedEvaluation.replaces
+                connection.executemany(
+                    "INSERT INTO evaluations (key, score, depth, best_move, complete) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET score = excluded.score, "
+                    "depth = excluded.depth, best_move = excluded.best_move, "
+                    "complete = excluded.complete "
+                    "WHERE excluded.complete > evaluations.complete "
+                    "OR (excluded.complete = evaluations.complete "
+                    "AND excluded.depth >= evaluations.depth)",
+                    rows,
+                )
+                connection.commit()
+        connection.close()
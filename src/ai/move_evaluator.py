@@ -1,4 +1,5 @@
 from ..utils.settings import RED, BLUE
+from ..utils.board.fast_board import RED_CELL, BLUE_CELL
 
 
 class MoveEvaluator:
@@ -7,11 +8,21 @@ class MoveEvaluator:
     def __init__(self, circle_system, color):
         self.system = circle_system
         self.color = color
+        self.evaluations = 0  # Positions evaluated since the last reset, for node budgets
 
     def evaluate_position(self):
         """Evaluate the current position based on circle count difference"""
-        blue_count = sum(1 for circle in self.system.small_circles if circle.color == BLUE)
-        red_count = sum(1 for circle in self.system.small_circles if circle.color == RED)
+        self.evaluations += 1
+        red_count, blue_count = self.system.board_stats.small
+        if self.color == RED:
+            return red_count - blue_count
+        return blue_count - red_count
+
+    def evaluate_board(self, board):
+        """evaluate_position for a FastBoard searched instead of the live board"""
+        self.evaluations += 1
+        red_count = board.count(RED_CELL)
+        blue_count = board.count(BLUE_CELL)
         if self.color == RED:
             return red_count - blue_count
         return blue_count - red_count
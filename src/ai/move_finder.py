@@ -1,57 +1,98 @@
-from ..utils.settings import RED, PHASE_ROTATION
-from .neural_network import NeuralNetwork
+from ..utils.settings import RED
+from ..utils.board.board_topology import BoardTopology
+from ..utils.board.fast_board import FastBoard, fast_move_for, find_live_circle
+from .neural_network import NeuralNetwork, TRAIN_BATCH_SIZE
+from .search_stats import (
+    SearchStats,
+    MOVE_GENERATION,
+    RULES,
+    EVALUATION,
+    RESTORE,
+    LEARNING,
+)
 import random
-import numpy as np
 
 
 class MoveFinder:
-    """Finds and evaluates possible moves"""
+    """Finds and evaluates possible moves on FastBoard copies of the live position"""
 
-    def __init__(self, circle_system, color, animation_controller, state_manager, move_evaluator):
+    def __init__(self, circle_system, color, move_evaluator, seed=None, learn=True):
         self.system = circle_system
         self.color = color
-        self.animation_controller = animation_controller
-        self.state_manager = state_manager
         self.move_evaluator = move_evaluator
         self.player_color = "red" if color == RED else "blue"
-        self.neural_network = NeuralNetwork()
+        self.rng = random.Random(seed)
+        self.learn = learn  # Train the placement network on the searched moves
+        self.search_complete = False  # The last search evaluated every move before stopping
+        self.neural_network = NeuralNetwork(seed, read_only=not learn)
         self.neural_network.load_model()
-
-    def find_best_rotation_only(self, update_best_move_callback=None, should_stop_callback=None):
-        """Evaluate all valid rotation moves when no placement is possible"""
-        valid_rotations = self.system.move_handler.get_valid_moves()
-        random.shuffle(valid_rotations)
+        self.neural_network.warm_up()
+        BoardTopology.for_system(circle_system)  # Built here rather than in a search slice
+
+    def search_best_rotation_only(
+        self, update_best_move_callback=None, should_stop_callback=None, stats=None
+    ):
+        """Evaluate all valid rotation moves when no placement is possible.
+
+        A generator: yields after every evaluated move and returns the best rotation. The
+        live board is never changed, so the game loop can render between any two yields.
+        """
+        stats = stats or SearchStats()
+        stats.depth = max(stats.depth, 1)
+        board = FastBoard.from_system(self.system)
+        with stats.timed(MOVE_GENERATION):
+            valid_rotations = board.valid_rotations()
+        stats.record_expansion(len(valid_rotations))
+        self.rng.shuffle(valid_rotations)
 
         print(f"[AI] Evaluating {len(valid_rotations)} possible rotation moves")
 
         best_rotation = None
         best_score = float("-inf")
+        stopped = False
 
         for rotation in valid_rotations:
             # Check if we should stop searching
             if should_stop_callback and should_stop_callback():
+                stopped = True
                 break
 
-            if self.system.move_handler.make_rotation_move(rotation, self.player_color):
-                self.animation_controller.wait_for_animations()
-                score = self.move_evaluator.evaluate_position()
-
-                if score > best_score:
-                    best_score = score
-                    best_rotation = rotation
-                    # Update the best move found so far
-                    if update_best_move_callback:
-                        update_best_move_callback((None, rotation), score)
-
-            self.state_manager.load_state()
-            self.animation_controller.wait_for_animations()
-
+            with stats.timed(RESTORE):
+                rotated = board.copy()
+            with stats.timed(RULES):
+                rotated.play(rotation)
+            with stats.timed(EVALUATION):
+                score = self.move_evaluator.evaluate_board(rotated)
+            stats.nodes += 1
+
+            if score > best_score:
+                best_score = score
+                best_rotation = find_live_circle(self.system, rotation)
+                # Update the best move found so far
+                if update_best_move_callback:
+                    update_best_move_callback((None, best_rotation), score)
+            yield
+
+        self.search_complete = not stopped
         print(f"[AI] Rotation analysis complete. Best score: {best_score}")
         return best_rotation
 
-    def find_best_move(self, update_best_move_callback=None, should_stop_callback=None):
-        """Evaluate all valid combinations of placement and rotation moves"""
-        unvisited_placements = self.system.move_handler.get_valid_moves()
+    def search_best_move(
+        self, update_best_move_callback=None, should_stop_callback=None, stats=None
+    ):
+        """Evaluate all valid combinations of placement and rotation moves.
+
+        A generator like search_best_rotation_only; returns the best (placement, rotation).
+        The network is trained on the evaluated moves after the search, in batches of its own.
+        """
+        stats = stats or SearchStats()
+        if self.system.move_handler.skip_blocked_placement():
+            print("[AI] No valid placement moves available, switching to rotation phase")
+            return None
+
+        with stats.timed(MOVE_GENERATION):
+            unvisited_placements = self.system.move_handler.get_valid_moves()
+        stats.record_expansion(len(unvisited_placements))
         small_circles = self.system.circle_manager.small_circles
         input_layer = []
         for small_circle in small_circles:
@@ -63,16 +104,15 @@ class MoveFinder:
                 input_layer.append(-1)
 
         # as input has to be 272 nodes, we need to add 272 - len(small_circles) nodes
-        added_nodes = 0
         for _ in range(272 - len(small_circles)):
             input_layer.append(0)
-            added_nodes += 1
 
-        print("added nodes: ", added_nodes)
+        with stats.timed(EVALUATION):
+            output_layer = self.neural_network.evaluate(
+                input_layer
+            )  # Output layer is a list of scores for each placement from 0 to 1, 1 being the best possible move to play
 
-        output_layer = self.neural_network.evaluate(
-            input_layer
-        )  # Output layer is a list of scores for each placement from 0 to 1, 1 being the best possible move to play
+        yield
 
         dict_of_circle_scores = {}  # Key will be circle id, value will be score
 
@@ -86,84 +126,75 @@ class MoveFinder:
 
         unvisited_placements = [x[0] for x in sorted_unvisited_placements]
 
-        print(
-            "Best move placing on circle: ",
-            unvisited_placements[0].id,
-            ", with score: ",
-            sorted_unvisited_placements[0][1],
-        )
-
-        if self.system.game_state.phase == PHASE_ROTATION:
-            print("[AI] No valid placement moves available, switching to rotation phase")
-            return None
-
+        board = FastBoard.from_system(self.system)
         best_combination = None
         best_score = float("-inf")
-        rewards = []
-        prev_score = self.move_evaluator.evaluate_position()
-        placement_rotations = {}
+        score_differences = []  # One training sample per evaluated move
+        with stats.timed(EVALUATION):
+            prev_score = self.move_evaluator.evaluate_board(board)
+        stats.depth = max(stats.depth, 2)
+        stopped = False
+
+        for current_placement in unvisited_placements:
+            placement_move = fast_move_for(self.system, current_placement)
+            if placement_move is None:
+                continue
+            with stats.timed(RESTORE):
+                placed = board.copy()
+            with stats.timed(RULES):
+                placed.play(placement_move)
+            with stats.timed(MOVE_GENERATION):
+                rotations = placed.valid_rotations()
+            stats.record_expansion(len(rotations))
+            yield
+
+            for current_rotation in rotations:
+                # Check if we should stop searching
+                if should_stop_callback and should_stop_callback():
+                    stopped = True
+                    break
+
+                with stats.timed(RESTORE):
+                    rotated = placed.copy()
+                with stats.timed(RULES):
+                    rotated.play(current_rotation)
+                with stats.timed(EVALUATION):
+                    score = self.move_evaluator.evaluate_board(rotated)
+                stats.nodes += 1
+                score_differences.append(score - prev_score)
+                if score > best_score:
+                    best_score = score
+                    best_combination = (
+                        current_placement,
+                        find_live_circle(self.system, current_rotation),
+                    )
+                    # Update the best move found so far
+                    if update_best_move_callback:
+                        update_best_move_callback(best_combination, score)
+                yield
 
-        while unvisited_placements:
-            # Check if we should stop searching
-            if should_stop_callback and should_stop_callback():
+            if stopped:
                 print(f"[AI] Max think time reached, returning best move found so far:", best_score)
                 break
 
-            current_placement = unvisited_placements[0]
-
-            if current_placement not in placement_rotations:
-                if not self.system.move_handler.make_placement_move(
-                    current_placement, self.player_color
-                ):
-                    unvisited_placements.remove(current_placement)
-                    continue
+        self.search_complete = not stopped
+        if self.learn and score_differences:
+            yield from self._train(input_layer, output_layer, score_differences, stats)
+        return best_combination
 
-                self.animation_controller.wait_for_animations()
-                placement_rotations[current_placement] = (
-                    self.system.move_handler.get_valid_moves().copy()
+    def save_learning(self):
+        """Write the network to disk if searches trained it since the last save"""
+        if self.neural_network.unsaved_changes:
+            self.neural_network.save_model()
+
+    def _train(self, input_layer, output_layer, score_differences, stats):
+        """Train the network on the searched moves, one batch per slice."""
+        for start in range(0, len(score_differences), TRAIN_BATCH_SIZE):
+            with stats.timed(LEARNING):
+                self.neural_network.learn(
+                    input_layer,
+                    output_layer,
+                    score_differences[start : start + TRAIN_BATCH_SIZE],
+                    save=False,
                 )
-
-                self.state_manager.load_state()
-                self.animation_controller.wait_for_animations()
-
-            if not placement_rotations[current_placement]:
-                unvisited_placements.remove(current_placement)
-                continue
-
-            current_rotation = placement_rotations[current_placement][0]
-
-            if self.system.move_handler.make_placement_move(current_placement, self.player_color):
-                self.animation_controller.wait_for_animations()
-
-                if self.system.move_handler.make_rotation_move(current_rotation, self.player_color):
-                    self.animation_controller.wait_for_animations()
-                    score = self.move_evaluator.evaluate_position()
-                    # print(
-                    #     "Score: ",
-                    #     score,
-                    #     "Prev score: ",
-                    #     prev_score,
-                    #     "Having place in circle with id: ",
-                    #     current_placement.id,
-                    #     "And rotation: ",
-                    #     current_rotation.id,
-                    # )
-                    score_difference = score - prev_score
-                    reward = self.neural_network.learn(input_layer, output_layer, score_difference)
-                    rewards.append(reward)
-                    if score > best_score:
-                        best_score = score
-                        best_combination = (current_placement, current_rotation)
-                        # Update the best move found so far
-                        if update_best_move_callback:
-                            update_best_move_callback(best_combination, score)
-
-            placement_rotations[current_placement].remove(current_rotation)
-
-            self.state_manager.load_state()
-            self.animation_controller.wait_for_animations()
-
-        print(
-            f"Sample of 3 rewards [min, median, max]: {[float(min(rewards)), float(np.median(rewards)), float(max(rewards))]}"
-        )
-        return best_combination
+            yield
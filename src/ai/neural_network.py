@@ -2,31 +2,50 @@ import numpy as np
 from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import Dense, Dropout
 from tensorflow.keras.optimizers import Adam
+from tensorflow.keras.initializers import GlorotUniform
+import json
 import os
+from ..utils.settings import WEB_AI_WEIGHTS_PATH
+
+# Samples per training step; shorter batches are padded with zero-weight rows, so every
+# step has the same shape and the traced training function is reused
+TRAIN_BATCH_SIZE = 32
 
 
 class NeuralNetwork:
-    def __init__(self):
+    def __init__(self, seed=None, read_only=False):
+        self.seed = seed  # Seeds weight init and dropout per layer, not the global RNGs
+        self.read_only = read_only  # Never trained or saved, so the model file stays as is
         self.logarithmic_base = 1.5
         self.model = None
         self.input_size = 272
         self.output_size = 272
         self.model_path = "game_model.keras"  # Changed extension to .keras
+        self.unsaved_changes = False  # Trained since the model was last saved
 
     def create_model(self):
         """Create a new neural network model. Input 272 nodes, output 272"""
         self.model = Sequential(
             [
                 # Input layer
-                Dense(544, activation="relu", input_shape=(self.input_size,)),
-                Dropout(0.2),
+                Dense(
+                    544,
+                    activation="relu",
+                    input_shape=(self.input_size,),
+                    kernel_initializer=self._initializer(0),
+                ),
+                Dropout(0.2, seed=self._layer_seed(1)),
                 # Hidden layers
-                Dense(272, activation="relu"),
-                Dropout(0.2),
-                Dense(136, activation="relu"),
-                Dense(272, activation="relu"),
+                Dense(272, activation="relu", kernel_initializer=self._initializer(2)),
+                Dropout(0.2, seed=self._layer_seed(3)),
+                Dense(136, activation="relu", kernel_initializer=self._initializer(4)),
+                Dense(272, activation="relu", kernel_initializer=self._initializer(5)),
                 # Output layer - using sigmoid to get values between 0 and 1
-                Dense(self.output_size, activation="sigmoid"),
+                Dense(
+                    self.output_size,
+                    activation="sigmoid",
+                    kernel_initializer=self._initializer(6),
+                ),
             ]
         )
 
@@ -36,11 +55,18 @@ class NeuralNetwork:
 
         return self.model
 
+    def _layer_seed(self, layer):
+        return None if self.seed is None else self.seed + layer
+
+    def _initializer(self, layer):
+        """Kernel initializer of a layer: Keras' default, seeded when the network is"""
+        return GlorotUniform(seed=self._layer_seed(layer))
+
     def load_model(self):
-        """Load a pre-trained model"""
+        """Load a pre-trained model; read-only networks skip the optimizer"""
         if os.path.exists(self.model_path):
             try:
-                self.model = load_model(self.model_path)
+                self.model = load_model(self.model_path, compile=not self.read_only)
                 return True
             except Exception as e:
                 print(f"Error loading model: {e}")
@@ -49,9 +75,10 @@ class NeuralNetwork:
 
     def save_model(self):
         """Save the current model"""
-        if self.model is not None:
+        if self.model is not None and not self.read_only:
             try:
                 self.model.save(self.model_path)  # Using native Keras format
+                self.unsaved_changes = False
                 return True
             except Exception as e:
                 print(f"Error saving model: {e}")
@@ -66,18 +93,9 @@ class NeuralNetwork:
         # Convert input to numpy array and reshape
         input_array = np.array(input_layer).reshape(1, -1)
 
-        # Get model predictions
-        predictions = self.model.predict(input_array, verbose=0)
-        output_layer = predictions[0].tolist()
-
-        print(
-            "Input layer (min, median, max):",
-            [min(input_layer), int(np.median(input_layer)), max(input_layer)],
-        )
-        print(
-            "Output layer (min, median, max):",
-            [min(output_layer), float(np.median(output_layer)), max(output_layer)],
-        )
+        # Get model predictions; calling the model skips predict()'s per-call batching setup
+        predictions = self.model(input_array, training=False)
+        output_layer = np.asarray(predictions)[0].tolist()
 
         return output_layer
 
@@ -96,32 +114,74 @@ class NeuralNetwork:
 
         return sign * normalized
 
-    def learn(self, input_layer, output_layer, reward):
-        """Train the model with the input and output layer"""
+    def export_placement_weights(self, path=WEB_AI_WEIGHTS_PATH):
+        """Write the placement scores for the empty board as the web AI's weight table"""
+        if self.model is None:
+            self.create_model()
+
+        scores = self.model.predict(np.zeros((1, self.input_size)), verbose=0)[0]
+        with open(path, "w") as f:
+            json.dump({"small": [round(float(score), 6) for score in scores]}, f)
+        return path
+
+    def learn(self, input_layer, output_layer, rewards, save=True):
+        """
+        Train the model with the input and output layer, one target per reward.
+
+        The rewards (up to TRAIN_BATCH_SIZE) are trained as one batch; save=False leaves
+        saving to the caller. Returns the scaled rewards.
+        """
         if self.model is None:
             self.create_model()
 
-        # Scale the reward
-        scaled_reward = self.scale_reward(reward)
+        # Scale the rewards
+        scaled_rewards = np.array([self.scale_reward(reward) for reward in rewards])
 
-        # Prepare input data
-        X = np.array(input_layer).reshape(1, -1)
+        # Prepare input data: every sample starts from the same position
+        X = np.zeros((TRAIN_BATCH_SIZE, self.input_size))
+        X[: len(rewards)] = np.array(input_layer)
 
         # Scale the output layer by the reward
         # If reward is positive, we want to encourage these moves
         # If reward is negative, we want to discourage these moves
-        scaled_output = np.array(output_layer) * (1 + scaled_reward)
+        scaled_output = np.array(output_layer)[None, :] * (1 + scaled_rewards[:, None])
         # Clip values to ensure they stay between 0 and 1
-        scaled_output = np.clip(scaled_output, 0, 1)
-        y = scaled_output.reshape(1, -1)
+        y = np.zeros((TRAIN_BATCH_SIZE, self.output_size))
+        y[: len(rewards)] = np.clip(scaled_output, 0, 1)
 
-        # Train the model for one epoch
-        history = self.model.fit(X, y, epochs=1, verbose=0)
+        sample_weight = np.zeros(TRAIN_BATCH_SIZE)
+        sample_weight[: len(rewards)] = 1.0
+        self.model.train_on_batch(X, y, sample_weight=sample_weight)
+        self.unsaved_changes = True
 
         # save the model after training
-        self.save_model()
+        if save:
+            self.save_model()
+
+        return scaled_rewards
 
-        return scaled_reward
+    def warm_up(self):
+        """
+        Run the model and its training step once, so the first search does not stall.
+
+        TensorFlow traces both on their first call, which takes seconds. The training step
+        runs with zero sample weights, and the weights and optimizer state it touches are
+        put back, so warming up does not train the model.
+        """
+        if self.model is None:
+            self.create_model()
+        X = np.zeros((TRAIN_BATCH_SIZE, self.input_size))
+        self.model(X[:1], training=False)
+        if self.read_only:
+            return
+        weights = self.model.get_weights()
+        optimizer_state = [variable.numpy() for variable in self.model.optimizer.variables]
+        self.model.train_on_batch(
+            X, np.zeros((TRAIN_BATCH_SIZE, self.output_size)), sample_weight=np.zeros(len(X))
+        )
+        self.model.set_weights(weights)
+        for variable, value in zip(self.model.optimizer.variables, optimizer_state):
+            variable.assign(value)
 
     def get_model_summary(self):
         """Return a string representation of the model architecture"""
@@ -134,3 +194,11 @@ class NeuralNetwork:
         buffer = StringIO()
         self.model.summary(print_fn=lambda x: buffer.write(x + "\n"))
         return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    network = NeuralNetwork()
+    if network.load_model():
+        print(f"Wrote {network.export_placement_weights()}")
+    else:
+        print(f"No trained model at {network.model_path}")
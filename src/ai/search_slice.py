@@ -0,0 +1,19 @@
+import time
+
+
+def run_search_slice(search, slice_time):
+    """
+    Advance a search generator for about slice_time seconds.
+
+    Searches yield whenever the live board is back at the searched position, so the game
+    loop can update and render between two slices. Returns (True, result) once the
+    generator has returned its result, (False, None) while it still has work left.
+    """
+    deadline = time.perf_counter() + slice_time
+    try:
+        while True:
+            next(search)
+            if time.perf_counter() >= deadline:
+                return False, None
+    except StopIteration as done:
+        return True, done.value
@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+import json
+import time
+
+# Sections the think time is split into
+MOVE_GENERATION = "movegen"
+RULES = "rules"
+EVALUATION = "eval"
+RESTORE = "restore"
+LEARNING = "learn"  # Training the placement network on the searched moves
+SECTIONS = (MOVE_GENERATION, RULES, EVALUATION, RESTORE, LEARNING)
+
+
+class SearchStats:
+    """Counters and timings collected during a single AI search"""
+
+    def __init__(self, player_color=None, phase=None):
+        self.player_color = player_color
+        self.phase = phase
+        self.source = "search"  # "search", "endgame", "cache" or "web"
+        self.position = None  # Position notation of the searched position, when logged
+        self.nodes = 0
+        self.depth = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+        self.expanded_nodes = 0
+        self.children = 0
+        self.section_times = {section: 0.0 for section in SECTIONS}
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @contextmanager
+    def timed(self, section):
+        """Add the time spent in the with-block to a section"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.section_times[section] += time.perf_counter() - start
+
+    def record_expansion(self, move_count):
+        """Record that a position was expanded into move_count children"""
+        self.expanded_nodes += 1
+        self.children += move_count
+
+    def record_cache_lookup(self, hit):
+        self.cache_lookups += 1
+        if hit:
+            self.cache_hits += 1
+
+    def exclude(self, seconds):
+        """Leave out time the search was paused, e.g. the frames drawn between its slices"""
+        self.start_time += seconds
+
+    def finish(self):
+        self.end_time = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def branching_factor(self) -> float:
+        """Average number of moves per expanded position"""
+        return self.children / self.expanded_nodes if self.expanded_nodes else 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cache_hits / self.cache_lookups if self.cache_lookups else 0.0
+
+    def to_dict(self):
+        return {
+            "player": self.player_color,
+            "phase": self.phase,
+            "position": self.position,
+            "source": self.source,
+            "nodes": self.nodes,
+            "elapsed": round(self.elapsed, 4),
+            "nodes_per_second": round(self.nodes_per_second, 1),
+            "depth": self.depth,
+            "branching_factor": round(self.branching_factor, 2),
+            "cache_hits": self.cache_hits,
+            "cache_lookups": self.cache_lookups,
+            "section_times": {k: round(v, 4) for k, v in self.section_times.items()},
+        }
+
+    def summary_lines(self):
+        """Short text lines for the debug overlay"""
+        times = ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in self.section_times.items())
+        return [
+            f"AI {self.player_color} ({self.source}): {self.nodes} nodes, "
+            f"{self.nodes_per_second:.0f} nodes/s",
+            f"depth {self.depth}, branching {self.branching_factor:.1f}, "
+            f"cache {self.cache_hits}/{self.cache_lookups}",
+            times,
+        ]
+
+
+class SearchStatsLog:
+    """Appends finished search statistics to a JSON-lines file"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, stats: SearchStats):
+        record = stats.to_dict()
+        record["timestamp"] = time.time()
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
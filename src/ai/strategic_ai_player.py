@@ -5,12 +5,22 @@ from ..utils.settings import (
     AI_THINKING_TIME,
     AIThinkingState,
     AI_MAX_THINK_TIME,
+    AI_NODE_BUDGET,
+    AI_RANDOM_SEED,
+    AI_STATS_LOG_PATH,
+    AI_SEARCH_SLICE_TIME,
+    EVAL_CACHE_ENABLED,
+    ENDGAME_THINK_SHARE,
 )
+from ..utils.board.fast_board import FastBoard, PLACE, find_live_circle, fast_move_for
+from ..utils.board.position_notation import encode_position
 from .animation_controller import AnimationController
+from .endgame_solver import EndgameSolver
+from .evaluation_cache import EvaluationCache, position_hash
 from .move_evaluator import MoveEvaluator
 from .move_finder import MoveFinder
-from .state_manager import StateManager
-import pygame
+from .search_slice import run_search_slice
+from .search_stats import SearchStats, SearchStatsLog
 import time
 
 
@@ -18,33 +28,61 @@ class StrategicAIPlayer:
     """Main AI player class that coordinates the game playing strategy"""
 
     def __init__(
-        self, circle_system, color=BLUE, max_think_time=AI_MAX_THINK_TIME
+        self,
+        circle_system,
+        color=BLUE,
+        max_think_time=AI_MAX_THINK_TIME,
+        max_nodes=AI_NODE_BUDGET,
+        seed=AI_RANDOM_SEED,
+        slice_time=AI_SEARCH_SLICE_TIME,
     ):  # 5 seconds default max
         self.system = circle_system
         self.color = color
         self.player_color = "red" if color == RED else "blue"
         self.thinking_state = AIThinkingState()
         self.max_think_time = max_think_time  # Maximum time in seconds to think
+        self.max_nodes = max_nodes  # Node budget per search; overrides max_think_time when set
+        self.seed = seed
+        self.slice_time = slice_time  # Search time per make_move call, so frames keep coming
         self.search_start_time = None
         self.best_move_so_far = None
         self.best_score_so_far = float("-inf")
 
         # Initialize components
         self.animation_controller = AnimationController(circle_system)
-        self.state_manager = None
         self.move_evaluator = MoveEvaluator(circle_system, color)
+        self.endgame_solver = EndgameSolver()
+        self.move_finder = None  # Created by initialize_save_manager
+        # A node budget or seed asks for reproducible searches, which must not depend on
+        # what earlier sessions left in the persistent cache or trained into the network
+        self.reproducible = max_nodes is not None or seed is not None
+        self.evaluation_cache = (
+            EvaluationCache.shared() if EVAL_CACHE_ENABLED and not self.reproducible else None
+        )
+        self.search_key = None  # Cache key of the position the current search started from
+        self.search_stats = None  # Statistics of the search in progress
+        self.last_search_stats = None  # Statistics of the last finished search
+        self.search = None  # Paused search generator, resumed by every make_move call
+        self.search_phase = None
+        self.search_signature = None  # Game state the paused search expects to find
+        self.slice_end_time = None
+        self.stats_log = SearchStatsLog(AI_STATS_LOG_PATH) if AI_STATS_LOG_PATH else None
 
     def initialize_save_manager(self, save_manager):
-        """Initialize the save manager for state management"""
-        self.state_manager = StateManager(save_manager)
+        """Create the move finder; it searches board copies, so it needs no saved states"""
         self.move_finder = MoveFinder(
             self.system,
             self.color,
-            self.animation_controller,
-            self.state_manager,
             self.move_evaluator,
+            seed=self.seed,
+            learn=not self.reproducible,
         )
 
+    def save_learning(self):
+        """Save what the searches trained into the network; called between games"""
+        if self.move_finder:
+            self.move_finder.save_learning()
+
     def start_thinking(self, current_time: int, phase: str = "placement"):
         """Start the thinking timer"""
         self.thinking_state.thinking_start_time = current_time
@@ -61,7 +99,7 @@ class StrategicAIPlayer:
             return True
         return (
             current_time - self.thinking_state.thinking_start_time >= AI_THINKING_TIME
-            or self.should_stop_search()
+            or self._think_time_elapsed()
         )
 
     def update_best_move(self, move, score):
@@ -70,12 +108,34 @@ class StrategicAIPlayer:
             self.best_score_so_far = score
             self.best_move_so_far = move
 
+    @property
+    def nodes_searched(self) -> int:
+        """Positions evaluated by the heuristic search and the endgame solver this search"""
+        return self.move_evaluator.evaluations + self.endgame_solver.nodes
+
     def should_stop_search(self) -> bool:
-        """Check if we should stop the move search based on max think time"""
+        """Check if we should stop the move search based on the node budget or max think time"""
+        if self.max_nodes is not None:
+            return self.nodes_searched >= self.max_nodes
+        return self._think_time_elapsed()
+
+    def _think_time_elapsed(self, share=1.0) -> bool:
         # Guard against None search_start_time
         if self.search_start_time is None:
             return False
-        return time.time() - self.search_start_time >= self.max_think_time
+        return time.time() - self.search_start_time >= self.max_think_time * share
+
+    def _endgame_budget_spent(self) -> bool:
+        """The endgame solver's own limit, a share of the node budget or think time"""
+        if self.max_nodes is not None:
+            return self.endgame_solver.nodes >= self.max_nodes * ENDGAME_THINK_SHARE
+        return self._think_time_elapsed(ENDGAME_THINK_SHARE)
+
+    def _reset_search_budget(self):
+        """Give the heuristic search the full budget, whatever the endgame solver used"""
+        self.search_start_time = time.time()
+        self.move_evaluator.evaluations = 0
+        self.endgame_solver.nodes = 0
 
     def finish_thinking(self):
         """Reset thinking state and ensure animations are reset"""
@@ -86,47 +146,203 @@ class StrategicAIPlayer:
         # Make sure animation durations are reset when thinking finishes
         self.animation_controller.reset_animation_duration()
 
+    def _solve_endgame(self):
+        """
+        Solve the position exactly when few grey circles remain; returns a move pair or None.
+
+        A generator like the heuristic searches, so the solver runs in slices too.
+        """
+        board = FastBoard.from_system(self.system)
+        if not self.endgame_solver.applies(board):
+            return None
+
+        result = yield from self.endgame_solver.solve_steps(
+            board, should_stop_callback=self._endgame_budget_spent
+        )
+        solver = self.endgame_solver
+        stats = self.search_stats
+        stats.nodes += result.nodes
+        stats.depth = max(stats.depth, result.depth)
+        stats.cache_hits += solver.table_hits
+        stats.cache_lookups += solver.table_lookups
+        stats.expanded_nodes += solver.expanded_nodes
+        stats.children += solver.children
+        print(
+            f"[AI] Endgame solver: {result.outcome} at depth {result.depth} "
+            f"({result.nodes} nodes)"
+        )
+        # A lost position is left to the heuristic search, which still plays for material
+        if result.outcome not in ("win", "draw") or not result.line:
+            return None
+
+        stats.source = "endgame"
+        return self._live_move_pair(result.line)
+
+    def _live_move_pair(self, line):
+        """Turn a list of fast board moves into the (placement, rotation) pair make_move plays"""
+        placement = None
+        rotation = None
+        for move in line:
+            circle = find_live_circle(self.system, move)
+            if circle is None:
+                return None
+            if move[0] == PLACE:
+                placement = circle
+            else:
+                rotation = circle
+        return placement, rotation
+
+    def _lookup_cached_move(self):
+        """Reuse the stored result of an earlier search of this position, if any"""
+        if not self.evaluation_cache:
+            return None
+        board = FastBoard.from_system(self.system)
+        self.search_key = position_hash(board)
+        cached = self.evaluation_cache.get(self.search_key)
+        required_depth = 1 if board.phase == PHASE_ROTATION else 2
+        usable = (
+            cached is not None
+            and cached.complete
+            and cached.depth >= required_depth
+            and cached.best_move
+        )
+        self.search_stats.record_cache_lookup(bool(usable))
+        if not usable:
+            return None
+        self.search_stats.source = "cache"
+        self.search_stats.depth = cached.depth
+        print(f"[AI] Position found in evaluation cache (score {cached.score})")
+        return self._live_move_pair(cached.best_move)
+
+    def _store_search_result(self, move_pair, score, depth):
+        """Save the outcome of a complete search in the persistent evaluation cache"""
+        if not self.evaluation_cache or self.search_key is None or score == float("-inf"):
+            return
+        if not self.move_finder.search_complete:
+            return  # Cut short by the budget; the best move so far is not worth reusing
+        line = [fast_move_for(self.system, circle) for circle in move_pair if circle]
+        if line and None not in line:
+            self.evaluation_cache.put(
+                self.search_key, score, depth, line, complete=True
+            )
+
+    def _finish_search_stats(self):
+        """Close the statistics of the search that just ended and log them"""
+        self.search_stats.finish()
+        self.last_search_stats = self.search_stats
+        if self.stats_log:
+            self.stats_log.write(self.search_stats)
+
+    def _start_search(self):
+        """Create the search generator for the turn"""
+        self.search_phase = self.system.game_state.phase
+        self.search = self._search_turn()
+        self.system.game_state.ai_thinking = True
+        self.slice_end_time = None
+
+    def _search_turn(self):
+        """
+        The whole search of a turn: endgame solver, cache lookup, then the heuristic search.
+
+        Returns the move pair to play, or None.
+        """
+        planned_move = yield from self._solve_endgame()
+        if not planned_move:
+            planned_move = self._lookup_cached_move()
+        if planned_move:
+            return planned_move
+
+        self._reset_search_budget()
+        if self.search_phase == PHASE_ROTATION:
+            print("[AI] Rotation phase - evaluating rotation moves only")
+            search = self.move_finder.search_best_rotation_only
+        else:
+            search = self.move_finder.search_best_move
+        result = yield from search(
+            update_best_move_callback=self.update_best_move,
+            should_stop_callback=self.should_stop_search,
+            stats=self.search_stats,
+        )
+
+        # Use either the final best move or the best move found so far
+        final_move = result or self.best_move_so_far
+        if not final_move:
+            return None
+        # The heuristic search looks one turn ahead: a rotation, or a placement and rotation
+        if self.search_phase == PHASE_ROTATION:
+            final_move = (None, final_move[1] if isinstance(final_move, tuple) else final_move)
+            depth = 1
+        else:
+            depth = 2
+        self._store_search_result(final_move, self.best_score_so_far, depth)
+        return final_move
+
+    def _advance_search(self, current_time):
+        """Search for one slice; the frames drawn in between do not count as think time"""
+        if self.slice_end_time is not None:
+            paused = time.time() - self.slice_end_time
+            self.search_start_time += paused
+            self.search_stats.exclude(paused)
+        finished, result = run_search_slice(self.search, self.slice_time)
+        self.slice_end_time = time.time()
+        self.search_signature = self._search_signature()
+        if finished:
+            self.search = None
+            self._complete_search(result, current_time)
+
+    def _complete_search(self, move, current_time):
+        if move:
+            placement, rotation = move
+            self.thinking_state.next_move = move
+            self.start_thinking(current_time, "placement" if placement else "rotation")
+
+        if not self.thinking_state.is_thinking:
+            self.system.game_state.ai_thinking = False
+        self._finish_search_stats()
+
+    def _abandon_search(self):
+        self.search.close()
+        self.search = None
+        self.system.game_state.ai_thinking = False
+        self.animation_controller.reset_animation_duration()
+
+    def _search_signature(self):
+        game_state = self.system.game_state
+        return game_state.turn, game_state.phase, self.system.board_stats.total
+
     def make_move(self):
         """Make a move based on the current game state."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.system.clock.ticks()
+
+        if self.search is not None and self._search_signature() != self.search_signature:
+            # The game moved on (reset, load, mode change) while the search was paused
+            self._abandon_search()
 
         if (
             not self.system.is_any_circle_animating()
             and self.system.game_state.turn == self.player_color
         ):
             # Start a new search - initialize timing and best move tracking
-            if not self.thinking_state.is_thinking and not self.thinking_state.next_move:
-                self.state_manager.save_state()
-                # Set quick animation for AI thinking
+            if (
+                self.search is None
+                and not self.thinking_state.is_thinking
+                and not self.thinking_state.next_move
+            ):
+                # The AI's own move plays without animation
                 self.animation_controller.set_animation_duration(0.0)
                 self.search_start_time = time.time()
                 self.best_move_so_far = None
                 self.best_score_so_far = float("-inf")
+                self.move_evaluator.evaluations = 0
+                self.endgame_solver.nodes = 0
+                self.search_stats = SearchStats(self.player_color, self.system.game_state.phase)
+                if self.stats_log:
+                    self.search_stats.position = encode_position(FastBoard.from_system(self.system))
+
+                self._start_search()
 
-                if self.system.game_state.phase == PHASE_ROTATION:
-                    print("[AI] Rotation phase - evaluating rotation moves only")
-                    best_rotation = self.move_finder.find_best_rotation_only(
-                        update_best_move_callback=self.update_best_move,
-                        should_stop_callback=self.should_stop_search,
-                    )
-                    # Use either the final best move or the best move found so far
-                    final_move = best_rotation or self.best_move_so_far
-                    if final_move:
-                        self.thinking_state.next_move = (
-                            None,
-                            final_move[1] if isinstance(final_move, tuple) else final_move,
-                        )
-                        self.start_thinking(current_time, "rotation")
-                else:
-                    best_combination = self.move_finder.find_best_move(
-                        update_best_move_callback=self.update_best_move,
-                        should_stop_callback=self.should_stop_search,
-                    )
-                    # Use either the final best move or the best move found so far
-                    final_move = best_combination or self.best_move_so_far
-                    if final_move:
-                        self.thinking_state.next_move = final_move
-                        self.start_thinking(current_time, "placement")
+            if self.search is not None:
+                self._advance_search(current_time)
 
             # If we're thinking and the time has elapsed
             elif self.thinking_state.is_thinking and self.is_thinking_complete(current_time):
@@ -0,0 +1,255 @@
+from typing import List, Optional
+import json
+import random
+import time
+from ..utils.settings import (
+    BLUE,
+    RED,
+    PHASE_PLACEMENT,
+    AI_THINKING_TIME,
+    AI_MAX_THINK_TIME,
+    AI_RANDOM_SEED,
+    AIThinkingState,
+    WEB_AI_SLICE_TIME,
+    WEB_AI_WEIGHTS_PATH,
+)
+from ..utils.board.board_topology import BoardTopology
+from ..utils.board.fast_board import (
+    FastBoard,
+    PLACE,
+    RED_CELL,
+    BLUE_CELL,
+    TURN_CELLS,
+    find_live_circle,
+)
+from .search_slice import run_search_slice
+from .search_stats import SearchStats, RULES
+
+# Material weights of the evaluation, per circle tier
+SMALL_WEIGHT = 1
+MEDIUM_WEIGHT = 4
+LARGE_WEIGHT = 24
+WIN_SCORE = 10000
+
+
+def load_weight_table(topology: BoardTopology, path=WEB_AI_WEIGHTS_PATH) -> List[float]:
+    """
+    Placement weight per small slot.
+
+    The table is the network's output for the empty board, written by
+    NeuralNetwork.export_placement_weights; on the empty board every slot is a valid
+    placement, so output i scores slot i. Without an exported table, slots shared by more
+    medium circles are preferred.
+    """
+    try:
+        with open(path) as f:
+            weights = json.load(f)["small"]
+        if len(weights) >= topology.small_count:
+            return [float(w) for w in weights[: topology.small_count]]
+        print(f"[AI] Weight table {path} has {len(weights)} entries, using the default")
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return [float(len(parents)) for parents in topology.small_parents]
+
+
+def evaluate_board(board: FastBoard, cell: int) -> int:
+    """Material balance for cell across all three tiers; a won game outweighs everything."""
+    opponent = BLUE_CELL if cell == RED_CELL else RED_CELL
+    winner = board.winner()
+    if winner:
+        return WIN_SCORE if TURN_CELLS[winner] == cell else -WIN_SCORE
+    return (
+        SMALL_WEIGHT * (board.small.count(cell) - board.small.count(opponent))
+        + MEDIUM_WEIGHT * (board.medium.count(cell) - board.medium.count(opponent))
+        + LARGE_WEIGHT * (board.large.count(cell) - board.large.count(opponent))
+    )
+
+
+class WebAIPlayer:
+    """
+    AI player for the browser build.
+
+    Searches every placement and rotation of the current turn on a FastBoard, scoring them
+    by material with placements ordered by a small exported weight table, so it needs no
+    NumPy or TensorFlow. The search is a generator that make_move advances for
+    WEB_AI_SLICE_TIME per call; the async main loop keeps rendering between slices.
+    """
+
+    def __init__(
+        self,
+        circle_system,
+        color=BLUE,
+        max_think_time=AI_MAX_THINK_TIME,
+        slice_time=WEB_AI_SLICE_TIME,
+        seed=AI_RANDOM_SEED,
+    ):
+        self.system = circle_system
+        self.color = color
+        self.player_color = "red" if color == RED else "blue"
+        self.thinking_state = AIThinkingState()
+        self.max_think_time = max_think_time
+        self.slice_time = slice_time
+        self.random = random.Random(seed)
+        self.weights = None
+        self.search = None  # Generator of the search in progress
+        self.search_start_time = None
+        self.slice_end_time = None
+        self.best_move_so_far = None
+        self.best_score_so_far = float("-inf")
+        self.search_stats = None
+        self.last_search_stats = None
+
+    def initialize_save_manager(self, save_manager):
+        """The web AI never plays moves on the live board, so it needs no saved states"""
+
+    def save_learning(self):
+        """The web AI does not learn, so there is nothing to save"""
+
+    def is_thinking(self) -> bool:
+        return self.thinking_state.is_thinking
+
+    def make_move(self):
+        """Advance the search by one slice, or play the chosen move once it is ready."""
+        if (
+            self.system.is_any_circle_animating()
+            or self.system.game_state.turn != self.player_color
+        ):
+            return False
+
+        if self.search is None and not self.thinking_state.next_move:
+            self._start_search()
+        if self.search is not None:
+            self._advance_search()
+            return False
+
+        current_time = self.system.clock.ticks()
+        if current_time - self.thinking_state.thinking_start_time < AI_THINKING_TIME:
+            return False
+        return self._play_next_move(current_time)
+
+    def _start_search(self):
+        board = FastBoard.from_system(self.system)
+        if self.weights is None:
+            self.weights = load_weight_table(board.topology)
+        self.thinking_state.is_thinking = True
+        self.thinking_state.thinking_start_time = self.system.clock.ticks()
+        self.system.game_state.ai_thinking = True
+        self.search_start_time = time.perf_counter()
+        self.slice_end_time = None
+        self.best_move_so_far = None
+        self.best_score_so_far = float("-inf")
+        self.search_stats = SearchStats(self.player_color, board.phase)
+        self.search_stats.source = "web"
+        self.search = self._search_turn(board)
+
+    def _advance_search(self):
+        """Run one slice of the search; the time between slices does not count as thinking."""
+        if self.slice_end_time is not None:
+            paused = time.perf_counter() - self.slice_end_time
+            self.search_start_time += paused
+            self.search_stats.exclude(paused)
+        with self.search_stats.timed(RULES):
+            finished, _ = run_search_slice(self.search, self.slice_time)
+        self.slice_end_time = time.perf_counter()
+
+        if finished:
+            self._finish_search()
+        elif (
+            self.slice_end_time - self.search_start_time >= self.max_think_time
+            and self.best_move_so_far
+        ):
+            print("[AI] Max think time reached, returning best move found so far")
+            self._finish_search()
+
+    def _search_turn(self, board: FastBoard):
+        """Score every (placement, rotation) pair of the turn; yields after each one."""
+        cell = board.turn
+        stats = self.search_stats
+        placements = board.valid_placements() if board.phase == PHASE_PLACEMENT else []
+        stats.depth = 2 if placements else 1
+        if not placements:
+            rotations = board.valid_rotations()
+            stats.record_expansion(len(rotations))
+            for move in rotations:
+                self._score(board, None, move, cell)
+                yield
+            return
+
+        weights = self.weights
+        placements.sort(key=lambda s: weights[s], reverse=True)
+        stats.record_expansion(len(placements))
+        for slot in placements:
+            placed = board.copy()
+            placed.place(slot)
+            rotations = [] if placed.winner() else placed.valid_rotations()
+            stats.record_expansion(len(rotations))
+            if not rotations:
+                self._score(placed, (PLACE, slot), None, cell, played=True)
+                yield
+            for move in rotations:
+                self._score(placed, (PLACE, slot), move, cell)
+                yield
+
+    def _score(self, board, placement, rotation, cell, played=False):
+        """Evaluate one candidate turn and keep it if it beats the best so far."""
+        if not played:
+            board = board.copy()
+            board.play(rotation)
+        self.search_stats.nodes += 1
+        # Random tie-break, so equal moves do not always resolve to the lowest slot
+        score = evaluate_board(board, cell) + self.random.random() * 0.5
+        if score > self.best_score_so_far:
+            self.best_score_so_far = score
+            self.best_move_so_far = (placement, rotation)
+
+    def _finish_search(self):
+        self.search.close()
+        self.search = None
+        self.search_stats.finish()
+        self.last_search_stats = self.search_stats
+        move = self._live_move_pair(self.best_move_so_far)
+        if move:
+            self.thinking_state.next_move = move
+            self.thinking_state.phase = "placement" if move[0] else "rotation"
+        else:
+            self._finish_thinking()
+            print("[AI] No valid moves found!")
+
+    def _live_move_pair(self, moves) -> Optional[tuple]:
+        if not moves:
+            return None
+        placement, rotation = (find_live_circle(self.system, m) if m else None for m in moves)
+        if (moves[0] and placement is None) or (moves[1] and rotation is None):
+            return None
+        return placement, rotation
+
+    def _play_next_move(self, current_time):
+        placement, rotation = self.thinking_state.next_move
+        move_handler = self.system.move_handler
+
+        if self.thinking_state.phase == "placement" and placement:
+            if move_handler.make_placement_move(placement, self.player_color):
+                self.thinking_state.next_move = (None, rotation)
+                self.thinking_state.phase = "rotation"
+                self.thinking_state.thinking_start_time = current_time
+                if rotation is None:
+                    self._finish_thinking()
+                return True
+
+        elif self.thinking_state.phase == "rotation" and rotation:
+            large = hasattr(rotation, "medium_circles")
+            if move_handler.make_rotation_move(
+                rotation, self.player_color, contained_circles_only=large
+            ):
+                self._finish_thinking()
+                return True
+
+        self._finish_thinking()
+        print("[AI] No valid moves found!")
+        return False
+
+    def _finish_thinking(self):
+        self.thinking_state.next_move = None
+        self.thinking_state.thinking_start_time = None
+        self.thinking_state.is_thinking = False
+        self.system.game_state.ai_thinking = False
@@ -1,12 +1,19 @@
 import math
+from typing import Optional
+from ..utils.clock import SimulationClock
 from ..utils.settings import DEFAULT_ROTATION_DURATION
 
 
 class BaseAnimationController:
     """Base class for animation controllers with common utilities."""
 
-    def __init__(self, rotation_duration: float = DEFAULT_ROTATION_DURATION):
+    def __init__(
+        self,
+        rotation_duration: float = DEFAULT_ROTATION_DURATION,
+        clock: Optional[SimulationClock] = None,
+    ):
         self._rotation_duration = rotation_duration
+        self.clock = clock or SimulationClock.shared()
 
     @property
     def rotation_duration(self) -> float:
@@ -1,47 +1,39 @@
 import math
-import time
-from typing import Dict, Tuple, Union
-from ..utils.circle_classes import MediumCircle, SmallCircle
+from typing import List, Optional
+from ..utils.clock import SimulationClock
 from .base_animation_controller import BaseAnimationController
+from .rotation_kernel import RotationKernel
 from ..utils.settings import DEFAULT_ROTATION_DURATION
 
 
 class CenterRotationController(BaseAnimationController):
     """Handles center rotation animations."""
 
-    def __init__(self, circle_system, rotation_duration: float = DEFAULT_ROTATION_DURATION):
-        super().__init__(rotation_duration)
+    def __init__(
+        self,
+        circle_system,
+        rotation_duration: float = DEFAULT_ROTATION_DURATION,
+        clock: Optional[SimulationClock] = None,
+    ):
+        super().__init__(rotation_duration, clock)
         self.system = circle_system
         self.is_rotating = False
         self.rotation_start = 0
-        self.initial_angles: Dict[Union[MediumCircle, SmallCircle], Tuple] = {}
+        self.kernel: Optional[RotationKernel] = None
 
     def start_rotation(self) -> None:
         """Initialize center rotation animation for all circles."""
         self.is_rotating = True
-        self.rotation_start = time.time()
-        self.initial_angles.clear()
-        center = self.system.center
+        self.rotation_start = self.clock.now()
 
-        # Calculate initial angles for medium circles
+        # The medium circles and the small circles inside them all turn around the center
+        circles = list(self.system.medium_circles)
         for medium_circle in self.system.medium_circles:
-            dx = medium_circle.pos[0] - center[0]
-            dy = medium_circle.pos[1] - center[1]
-            self.initial_angles[medium_circle] = (
-                math.atan2(dy, dx),
-                math.sqrt(dx**2 + dy**2),
-            )
+            circles.extend(self.system.circle_manager.get_circles_inside(medium_circle))
+        self.kernel = RotationKernel(self.system.center, dict.fromkeys(circles))
 
-            # Calculate initial angles for small circles inside each medium circle
-            circles_inside = self.system.circle_manager.get_circles_inside(medium_circle)
-            for small_circle in circles_inside:
-                dx_small = small_circle.pos[0] - medium_circle.pos[0]
-                dy_small = small_circle.pos[1] - medium_circle.pos[1]
-                self.initial_angles[small_circle] = (
-                    math.atan2(dy_small, dx_small),
-                    math.sqrt(dx_small**2 + dy_small**2),
-                    medium_circle,
-                )
+    def moving_circles(self) -> List:
+        return self.kernel.circles if self.is_rotating and self.kernel else []
 
     def update(self, current_time: float) -> None:
         """Update center rotation animation."""
@@ -59,34 +51,9 @@ class CenterRotationController(BaseAnimationController):
     def _complete_rotation(self, target_rotation: float) -> None:
         """Complete the center rotation animation."""
         self.is_rotating = False
-        center = self.system.center
-
-        for obj, data in self.initial_angles.items():
-            if isinstance(obj, MediumCircle):
-                initial_angle, distance = data
-                final_angle = initial_angle + target_rotation
-                obj.pos[0] = center[0] + math.cos(final_angle) * distance
-                obj.pos[1] = center[1] + math.sin(final_angle) * distance
-            else:  # SmallCircle
-                initial_angle, distance, parent_circle = data
-                final_angle = initial_angle + target_rotation
-                obj.pos[0] = parent_circle.pos[0] + math.cos(final_angle) * distance
-                obj.pos[1] = parent_circle.pos[1] + math.sin(final_angle) * distance
+        self.kernel.rotate(target_rotation)
 
     def _update_rotation(self, elapsed: float, target_rotation: float) -> None:
         """Update the center rotation animation."""
         progress = self._calculate_animation_progress(elapsed, self.rotation_duration)
-        current_rotation = target_rotation * progress
-        center = self.system.center
-
-        for obj, data in self.initial_angles.items():
-            if isinstance(obj, MediumCircle):
-                initial_angle, distance = data
-                current_angle = initial_angle + current_rotation
-                obj.pos[0] = center[0] + math.cos(current_angle) * distance
-                obj.pos[1] = center[1] + math.sin(current_angle) * distance
-            else:
-                initial_angle, distance, parent_circle = data
-                current_angle = initial_angle + current_rotation
-                obj.pos[0] = parent_circle.pos[0] + math.cos(current_angle) * distance
-                obj.pos[1] = parent_circle.pos[1] + math.sin(current_angle) * distance
+        self.kernel.rotate(target_rotation * progress)
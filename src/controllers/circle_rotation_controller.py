@@ -1,19 +1,26 @@
 import math
-import time
-from typing import List, Dict
+from typing import List, Dict, Optional
 from ..utils.circle_classes import MediumCircle, SmallCircle
+from ..utils.clock import SimulationClock
 from .base_animation_controller import BaseAnimationController
+from .rotation_kernel import RotationKernel
 from ..utils.settings import DEFAULT_ROTATION_DURATION
 
 
 class CircleRotationController(BaseAnimationController):
     """Handles individual circle rotation animations."""
 
-    def __init__(self, circle_system, rotation_duration: float = DEFAULT_ROTATION_DURATION):
-        super().__init__(rotation_duration)
+    def __init__(
+        self,
+        circle_system,
+        rotation_duration: float = DEFAULT_ROTATION_DURATION,
+        clock: Optional[SimulationClock] = None,
+    ):
+        super().__init__(rotation_duration, clock)
         self.system = circle_system
         self.pending_post_rotation = False
         self._animating_circles: Dict[MediumCircle, float] = {}  # Tracks active animations
+        self._kernels: Dict[MediumCircle, RotationKernel] = {}
 
     @property
     def rotation_duration(self) -> float:
@@ -25,7 +32,7 @@ class CircleRotationController(BaseAnimationController):
         old_duration = self._rotation_duration
         self._rotation_duration = duration
 
-        current_time = time.time()
+        current_time = self.clock.now()
         # Adjust animation timing for all active animations
         for circle, start_time in self._animating_circles.items():
             if circle.is_animating:
@@ -43,17 +50,31 @@ class CircleRotationController(BaseAnimationController):
     ) -> None:
         """Start rotation animation for a specific medium circle."""
         medium_circle.is_animating = True
-        start_time = time.time()
+        start_time = self.clock.now()
         medium_circle.animation_start = start_time
         medium_circle.target_rotation = math.pi / 4
-        medium_circle.initial_angles = {}
         self.pending_post_rotation = True
         self._animating_circles[medium_circle] = start_time
+        self._kernels[medium_circle] = self._kernel(medium_circle, circles_inside)
 
-        for circle in circles_inside:
-            dx = circle.pos[0] - medium_circle.pos[0]
-            dy = circle.pos[1] - medium_circle.pos[1]
-            medium_circle.initial_angles[circle] = (math.atan2(dy, dx), math.sqrt(dx**2 + dy**2))
+    def apply_rotation(
+        self, medium_circle: MediumCircle, circles_inside: List[SmallCircle]
+    ) -> None:
+        """Move the circles straight to where the rotation ends, without animating."""
+        self._kernel(medium_circle, circles_inside).rotate(math.pi / 4)
+
+    @staticmethod
+    def _kernel(medium_circle, circles_inside) -> RotationKernel:
+        return RotationKernel(medium_circle.pos, dict.fromkeys(circles_inside))
+
+    def moving_circles(self) -> List[SmallCircle]:
+        """Small circles of every medium circle that is still rotating"""
+        return [
+            circle
+            for medium_circle, kernel in self._kernels.items()
+            if medium_circle.is_animating
+            for circle in kernel.circles
+        ]
 
     def update(self, current_time: float) -> None:
         """Update individual circle rotation animations."""
@@ -72,21 +93,14 @@ class CircleRotationController(BaseAnimationController):
         # Clean up completed animations
         for circle in completed_circles:
             del self._animating_circles[circle]
+            del self._kernels[circle]
 
     def _complete_rotation(self, medium_circle: MediumCircle) -> None:
         """Complete rotation animation for a specific medium circle."""
         medium_circle.is_animating = False
-        for circle, (initial_angle, distance) in medium_circle.initial_angles.items():
-            final_angle = initial_angle + medium_circle.target_rotation
-            circle.pos[0] = medium_circle.pos[0] + math.cos(final_angle) * distance
-            circle.pos[1] = medium_circle.pos[1] + math.sin(final_angle) * distance
+        self._kernels[medium_circle].rotate(medium_circle.target_rotation)
 
     def _update_rotation(self, medium_circle: MediumCircle, elapsed: float) -> None:
         """Update rotation animation for a specific medium circle."""
         progress = self._calculate_animation_progress(elapsed, self.rotation_duration)
-        current_rotation = medium_circle.target_rotation * progress
-
-        for circle, (initial_angle, distance) in medium_circle.initial_angles.items():
-            current_angle = initial_angle + current_rotation
-            circle.pos[0] = medium_circle.pos[0] + math.cos(current_angle) * distance
-            circle.pos[1] = medium_circle.pos[1] + math.sin(current_angle) * distance
+        self._kernels[medium_circle].rotate(medium_circle.target_rotation * progress)
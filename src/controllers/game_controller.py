@@ -1,10 +1,21 @@
+import time
 import pygame
 from ..systems.menu_system import MenuSystem
-from ..utils.settings import HEIGHT, WIDTH, GameMode, RED, BLUE
+from ..utils.clock import SimulationClock
+from ..utils.frame_pacer import FramePacer
+from ..utils.settings import (
+    HEIGHT,
+    WIDTH,
+    GameMode,
+    RED,
+    BLUE,
+    FAST_FORWARD_SCALE,
+    FAST_FORWARD_FRAME_SKIP,
+    FRAME_STATS_LOG_INTERVAL,
+)
 from ..handlers.event_handler import EventHandler
-from ..managers.network.network_manager import GameNetworkManager
 from ..managers.render_manager import RenderManager
-from ..ai.strategic_ai_player import StrategicAIPlayer
+from ..ai.ai_backend import create_ai_player
 from ..renderers.original_ui_renderer import GameUI
 
 
@@ -30,9 +41,8 @@ class GameController:
 
         self.systems = {"circle": None, "menu": self.menu_system}
 
-        # Initialize managers with screen
+        # Initialize managers with screen; the network stack starts with online play
         self.managers = {
-            "network": GameNetworkManager(),
             "render": RenderManager(self.screen, self.original_ui),
         }
 
@@ -42,24 +52,104 @@ class GameController:
 
         self.event_handler = EventHandler(self.systems["circle"], self, self.original_ui)
         self.clock = pygame.time.Clock()
+        # Simulated time of the game, fast-forwarded or paused from the training speed button
+        self.sim_clock = SimulationClock.shared()
+        self.pacer = FramePacer(self.clock)
+        self._frame_stats_shown = self._frame_stats_logged = time.perf_counter()
+
+    @property
+    def network_manager(self):
+        return self.menu_system.network_manager
+
+    @property
+    def speed_state(self) -> str:
+        """Speed of the simulated time, as one of the speed button states"""
+        if self.sim_clock.paused:
+            return "pause"
+        return "fast_forward" if self.sim_clock.scale > 1 else "normal"
+
+    def set_speed_state(self, state: str):
+        if state == "pause":
+            self.sim_clock.pause()
+            return
+        self.sim_clock.resume()
+        if state == "fast_forward":
+            self.sim_clock.set_speed(FAST_FORWARD_SCALE, FAST_FORWARD_FRAME_SKIP)
+        else:
+            self.sim_clock.set_speed(1)
+
+    def handle_speed_button(self, event) -> bool:
+        """Cycle normal, fast forward and pause when the training speed button is clicked"""
+        if self.game_mode != GameMode.TRAINING or event.type != pygame.MOUSEBUTTONDOWN:
+            return False
+        ui_renderer = self.managers["render"].game_renderer.ui_renderer
+        if not ui_renderer.get_button_rect().collidepoint(event.pos):
+            return False
+        next_state = {"normal": "fast_forward", "fast_forward": "pause", "pause": "normal"}
+        self.set_speed_state(next_state[self.speed_state])
+        return True
 
     def update_ai_players(self):
         """Update AI players in training mode"""
+        if self.sim_clock.paused:
+            return
         if self.game_mode == GameMode.TRAINING and self.systems["circle"]:
             if self.systems["circle"].game_state.turn == "red":
                 self.red_ai.make_move()
             else:
                 self.blue_ai.make_move()
 
+    def save_ai_learning(self):
+        """Save the AI players' trained networks; a save takes a frame, so only between games"""
+        for name in ("ai_player", "red_ai", "blue_ai"):
+            player = getattr(self, name, None)
+            if player:
+                player.save_learning()
+
     def update_training_stats(self):
         """Update training stats in render manager"""
         if self.game_mode == GameMode.TRAINING and self.systems["circle"]:
             stats = {
-                "speed_state": "normal",  # Default state, could be modified if needed
+                "speed_state": self.speed_state,
                 "games_played": 0,  # Could keep track if needed
             }
             self.managers["render"].update_training_stats(stats)
 
+    def update_search_stats(self):
+        """Pass the statistics of the most recent AI search to the debug overlay"""
+        if self.game_mode == GameMode.TRAINING:
+            players = [self.red_ai, self.blue_ai]
+        elif self.game_mode == GameMode.AI:
+            players = [getattr(self, "ai_player", None)]
+        else:
+            return
+        finished = [p.last_search_stats for p in players if p and p.last_search_stats]
+        if finished:
+            self.managers["render"].update_search_stats(max(finished, key=lambda s: s.end_time))
+
+    def update_frame_stats(self):
+        """Refresh the frame statistics of the debug overlay once a second, and log them"""
+        now = time.perf_counter()
+        if now - self._frame_stats_shown < 1.0:
+            return
+        self._frame_stats_shown = now
+        lines = self.pacer.stats.summary_lines()
+        self.managers["render"].update_frame_stats(lines)
+        if FRAME_STATS_LOG_INTERVAL and now - self._frame_stats_logged >= FRAME_STATS_LOG_INTERVAL:
+            self._frame_stats_logged = now
+            print("[Frames] " + ", ".join(lines))
+
+    def is_busy(self) -> bool:
+        """Whether the game has work in progress that needs the full frame rate"""
+        circle_system = self.systems["circle"]
+        if circle_system and not self.sim_clock.paused:
+            # Paused training freezes animations and AI players alike
+            if circle_system.is_any_circle_animating() or circle_system.game_state.ai_thinking:
+                return True
+        if self.game_mode == GameMode.ONLINE:
+            return self.network_manager.has_pending_messages()
+        return False
+
     def initialize_ai_players(self, circle_system):
         """Initialize both AI players for training mode"""
         from ..managers.save_load_manager import SaveLoadManager
@@ -67,9 +157,7 @@ class GameController:
         save_manager = SaveLoadManager(circle_system)
 
         # Initialize Red AI
-        self.red_ai = StrategicAIPlayer(circle_system, color=RED)
-        self.red_ai.initialize_save_manager(save_manager)
+        self.red_ai = create_ai_player(circle_system, color=RED, save_manager=save_manager)
 
         # Initialize Blue AI
-        self.blue_ai = StrategicAIPlayer(circle_system, color=BLUE)
-        self.blue_ai.initialize_save_manager(save_manager)
+        self.blue_ai = create_ai_player(circle_system, color=BLUE, save_manager=save_manager)
@@ -1,21 +1,27 @@
 import math
-import time
-from typing import List, Dict
+from typing import List, Optional
 from ..utils.circle_classes import MediumCircle, SmallCircle
+from ..utils.clock import SimulationClock
 from .base_animation_controller import BaseAnimationController
+from .rotation_kernel import RotationKernel
 from ..utils.settings import CIRCLE_MEDIUM_RADIUS, DEFAULT_ROTATION_DURATION
 
 
 class LargeCircleRotationController(BaseAnimationController):
     """Handles large circle rotation animations"""
 
-    def __init__(self, circle_system, rotation_duration: float = DEFAULT_ROTATION_DURATION):
-        super().__init__(rotation_duration)
+    def __init__(
+        self,
+        circle_system,
+        rotation_duration: float = DEFAULT_ROTATION_DURATION,
+        clock: Optional[SimulationClock] = None,
+    ):
+        super().__init__(rotation_duration, clock)
         self.system = circle_system
         self.is_rotating = False
         self.rotation_start = 0
         self.rotating_large_circle = None
-        self.initial_angles: Dict = {}
+        self.kernel: Optional[RotationKernel] = None
 
     def start_rotation(
         self, large_circle, medium_circles: List[MediumCircle], small_circles: List[SmallCircle]
@@ -29,34 +35,32 @@ class LargeCircleRotationController(BaseAnimationController):
             small_circles: List of small circles inside the medium circles
         """
         self.is_rotating = True
-        self.rotation_start = time.time()
+        self.rotation_start = self.clock.now()
         self.rotating_large_circle = large_circle
-        self.initial_angles.clear()
+        self.kernel = self._kernel(large_circle, medium_circles, small_circles)
 
-        # Store initial angles for all affected medium circles
-        for medium_circle in medium_circles:
-            # Store medium circle angles relative to large circle center
-            dx = medium_circle.pos[0] - large_circle.pos[0]
-            dy = medium_circle.pos[1] - large_circle.pos[1]
-            self.initial_angles[medium_circle] = (math.atan2(dy, dx), math.sqrt(dx**2 + dy**2))
-
-        # Store initial angles for all affected small circles
-        for small_circle in small_circles:
-            # Find the parent medium circle for this small circle
-            for medium_circle in medium_circles:
-                dx_medium = small_circle.pos[0] - medium_circle.pos[0]
-                dy_medium = small_circle.pos[1] - medium_circle.pos[1]
-                dist_to_medium = math.sqrt(dx_medium**2 + dy_medium**2)
-
-                if (
-                    dist_to_medium <= CIRCLE_MEDIUM_RADIUS
-                ):  # If this small circle is inside this medium circle
-                    self.initial_angles[small_circle] = (
-                        math.atan2(dy_medium, dx_medium),
-                        dist_to_medium,
-                        medium_circle,
-                    )
-                    break
+    def apply_rotation(
+        self, large_circle, medium_circles: List[MediumCircle], small_circles: List[SmallCircle]
+    ) -> None:
+        """Move the circles straight to where the rotation ends, without animating."""
+        self._kernel(large_circle, medium_circles, small_circles).rotate(math.pi / 4)
+
+    @staticmethod
+    def _kernel(large_circle, medium_circles, small_circles) -> RotationKernel:
+        # Small circles turn with the medium circle containing them, and so around the
+        # large circle's center as well
+        carried = [
+            small_circle
+            for small_circle in small_circles
+            if any(
+                math.dist(small_circle.pos, medium_circle.pos) <= CIRCLE_MEDIUM_RADIUS
+                for medium_circle in medium_circles
+            )
+        ]
+        return RotationKernel(large_circle.pos, dict.fromkeys([*medium_circles, *carried]))
+
+    def moving_circles(self) -> List:
+        return self.kernel.circles if self.is_rotating and self.kernel else []
 
     def update(self, current_time: float) -> None:
         """Update large circle rotation animation"""
@@ -74,42 +78,10 @@ class LargeCircleRotationController(BaseAnimationController):
     def _complete_rotation(self, target_rotation: float) -> None:
         """Complete the large circle rotation animation"""
         self.is_rotating = False
-        large_circle = self.rotating_large_circle
-
-        # Update final positions
-        for obj, data in self.initial_angles.items():
-            if isinstance(obj, MediumCircle):
-                # Update medium circle position
-                initial_angle, distance = data
-                final_angle = initial_angle + target_rotation
-                obj.pos[0] = large_circle.pos[0] + math.cos(final_angle) * distance
-                obj.pos[1] = large_circle.pos[1] + math.sin(final_angle) * distance
-            else:  # SmallCircle
-                # Update small circle position relative to its parent medium circle
-                initial_angle, distance, parent_circle = data
-                final_angle = initial_angle + target_rotation
-                obj.pos[0] = parent_circle.pos[0] + math.cos(final_angle) * distance
-                obj.pos[1] = parent_circle.pos[1] + math.sin(final_angle) * distance
-
+        self.kernel.rotate(target_rotation)
         self.rotating_large_circle = None
 
     def _update_rotation(self, elapsed: float, target_rotation: float) -> None:
         """Update the large circle rotation animation"""
         progress = self._calculate_animation_progress(elapsed, self.rotation_duration)
-        current_rotation = target_rotation * progress
-        large_circle = self.rotating_large_circle
-
-        # Update positions during animation
-        for obj, data in self.initial_angles.items():
-            if isinstance(obj, MediumCircle):
-                # Update medium circle position
-                initial_angle, distance = data
-                current_angle = initial_angle + current_rotation
-                obj.pos[0] = large_circle.pos[0] + math.cos(current_angle) * distance
-                obj.pos[1] = large_circle.pos[1] + math.sin(current_angle) * distance
-            else:
-                # Update small circle position relative to its parent medium circle
-                initial_angle, distance, parent_circle = data
-                current_angle = initial_angle + current_rotation
-                obj.pos[0] = parent_circle.pos[0] + math.cos(current_angle) * distance
-                obj.pos[1] = parent_circle.pos[1] + math.sin(current_angle) * distance
+        self.kernel.rotate(target_rotation * progress)
@@ -3,7 +3,8 @@ import pygame
 from .controllers.game_controller import GameController
 from .utils.settings import GameMode, ROTATION_DURATIONS, RED, DEFAULT_ROTATION_DURATION
 from .systems.circle_system import CircleSystem
-from .ai.strategic_ai_player import StrategicAIPlayer  # AIPlayer
+from .ai.ai_backend import create_ai_player
+from .ai.evaluation_cache import EvaluationCache
 from .managers.save_load_manager import SaveLoadManager
 
 
@@ -24,11 +25,12 @@ class Game:
         if not self.controller.managers["render"].screen:
             raise RuntimeError("Screen not properly initialized in RenderManager")
 
-    def _handle_events(self):
-        """Process all game events and return whether the game should continue."""
-        for event in pygame.event.get():
+    def _handle_events(self, events):
+        """Process the events of a frame and return whether the game should continue."""
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
+            self.controller.managers["render"].handle_window_event(event)
 
             # Handle debug events first if in gameplay modes
             if self.controller.game_mode not in [GameMode.MENU, GameMode.WAITING]:
@@ -57,6 +59,8 @@ class Game:
                     self.controller.player_color = color
 
         elif self.controller.game_mode == GameMode.TRAINING:
+            if self.controller.handle_speed_button(event):
+                return
             if self.controller.systems["circle"] and self.controller.event_handler:
                 self.controller.event_handler.handle_events(event)
 
@@ -97,15 +101,17 @@ class Game:
         # Update circle system if it exists
         if self.controller.systems["circle"]:
             self.controller.systems["circle"].update()
+            if self.controller.systems["circle"].get_winner():
+                self.controller.save_ai_learning()
 
             if self.controller.game_mode == GameMode.ONLINE:
-                self.controller.managers["network"].handle_online_moves(
+                self.controller.network_manager.handle_online_moves(
                     self.controller.systems["circle"]
                 )
 
     def _handle_network_update(self):
         """Handle network-related updates."""
-        new_mode, new_color = self.controller.managers["network"].handle_network_messages(
+        new_mode, new_color = self.controller.network_manager.handle_network_messages(
             self.controller.game_mode,
             self.controller.systems["circle"],
             self.controller.player_color,
@@ -117,7 +123,9 @@ class Game:
 
     def set_game_mode(self, new_mode, reduced_version=False):
         """Set up the game for a new mode."""
+        self.controller.save_ai_learning()
         self.controller.game_mode = new_mode
+        self.controller.set_speed_state("normal")
 
         if hasattr(self.controller, "event_handler"):
             self.controller.event_handler.game_mode = new_mode
@@ -144,9 +152,10 @@ class Game:
             self.controller.systems["circle"].color_manager.set_player_color(None)
         elif mode == GameMode.AI:
             self.controller.systems["circle"].color_manager.set_player_color(RED)
-            self.controller.ai_player = StrategicAIPlayer(self.controller.systems["circle"])
             save_manager = SaveLoadManager(self.controller.systems["circle"])
-            self.controller.ai_player.initialize_save_manager(save_manager)
+            self.controller.ai_player = create_ai_player(
+                self.controller.systems["circle"], save_manager=save_manager
+            )
         elif mode == GameMode.TRAINING:
             self.controller.systems["circle"].color_manager.set_player_color(None)
             self.controller.initialize_ai_players(self.controller.systems["circle"])
@@ -159,9 +168,10 @@ class Game:
         """Main game loop."""
         running = True
         while running:
-            self.controller.current_time = pygame.time.get_ticks()
+            events = self.controller.pacer.get_events()
+            self.controller.current_time = self.controller.sim_clock.ticks()
 
-            if not self._handle_events():
+            if not self._handle_events(events):
                 running = False
                 continue
 
@@ -169,16 +179,27 @@ class Game:
 
             # Update training stats before rendering
             self.controller.update_training_stats()
+            self.controller.update_search_stats()
+            self.controller.update_frame_stats()
+
+            # While fast-forwarding, the skipped frames run uncapped and are not drawn
+            rendered = self.controller.sim_clock.next_frame()
+            changed = True
+            if rendered:
+                changed = self.controller.managers["render"].render_frame(
+                    self.controller.game_mode,
+                    self.controller.systems,
+                )
 
-            # Render frame
-            self.controller.managers["render"].render_frame(
-                self.controller.game_mode,
-                self.controller.systems,
-            )
-
-            self.controller.clock.tick(60)
+            # Idle frames (no input, nothing drawn, nothing in progress) let the loop sleep
+            busy = bool(events) or changed or self.controller.is_busy()
+            self.controller.pacer.end_frame(busy, tick=rendered)
 
         # Cleanup
+        self.controller.save_ai_learning()
+        for line in self.controller.pacer.stats.summary_lines():
+            print(f"[Frames] {line}")
         if self.controller.game_mode == GameMode.ONLINE:
-            self.controller.managers["network"].network_manager.shutdown()
+            self.controller.network_manager.shutdown()
+        EvaluationCache.close_shared()
         pygame.quit()
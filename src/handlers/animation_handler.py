@@ -1,8 +1,10 @@
 import time
+from typing import Optional
 import pygame
 from ..controllers.center_rotation_controller import CenterRotationController
 from ..controllers.large_circle_rotation_controller import LargeCircleRotationController
 from ..controllers.circle_rotation_controller import CircleRotationController
+from ..utils.clock import SimulationClock
 from ..utils.geometry import get_circles_inside_at_position
 from ..utils.settings import CIRCLE_MEDIUM_RADIUS, DEFAULT_ROTATION_DURATION, PHASE_PLACEMENT
 
@@ -10,13 +12,24 @@ from ..utils.settings import CIRCLE_MEDIUM_RADIUS, DEFAULT_ROTATION_DURATION, PH
 class AnimationHandler:
     """Handles animations for circle rotations in the game system."""
 
-    def __init__(self, circle_system, rotation_duration: float = DEFAULT_ROTATION_DURATION):
+    def __init__(
+        self,
+        circle_system,
+        rotation_duration: float = DEFAULT_ROTATION_DURATION,
+        clock: Optional[SimulationClock] = None,
+    ):
         self.system = circle_system
         self._rotation_duration = rotation_duration
-        self.center_controller = CenterRotationController(circle_system, rotation_duration)
-        self.circle_controller = CircleRotationController(circle_system, rotation_duration)
+        # Animations run on simulated time, the rotation sounds on real time
+        self.clock = clock or SimulationClock.shared()
+        self.center_controller = CenterRotationController(
+            circle_system, rotation_duration, self.clock
+        )
+        self.circle_controller = CircleRotationController(
+            circle_system, rotation_duration, self.clock
+        )
         self.large_circle_controller = LargeCircleRotationController(
-            circle_system, rotation_duration
+            circle_system, rotation_duration, self.clock
         )
 
         # Load sound effects
@@ -32,7 +45,6 @@ class AnimationHandler:
         # Backward compatibility attributes
         self.is_center_rotating = False
         self.center_rotation_start = 0
-        self.center_initial_angles = {}
         self.pending_post_rotation = False
 
     @property
@@ -91,26 +103,34 @@ class AnimationHandler:
         self.is_playing_rotation = False
         self.rotation_sound_started = False
 
-        self.center_controller = CenterRotationController(self.system, self.rotation_duration)
-        self.circle_controller = CircleRotationController(self.system, self.rotation_duration)
+        self.center_controller = CenterRotationController(
+            self.system, self.rotation_duration, self.clock
+        )
+        self.circle_controller = CircleRotationController(
+            self.system, self.rotation_duration, self.clock
+        )
         self.large_circle_controller = LargeCircleRotationController(
-            self.system, self.rotation_duration
+            self.system, self.rotation_duration, self.clock
         )
 
         # Reset backward compatibility attributes
         self.is_center_rotating = False
         self.center_rotation_start = 0
-        self.center_initial_angles.clear()
         self.pending_post_rotation = False
 
         for medium_circle in self.system.medium_circles:
             medium_circle.is_animating = False
             medium_circle.animation_start = 0
             medium_circle.target_rotation = 0
-            medium_circle.initial_angles = {}
+        self.system.color_manager.slot_index.finish_move()
 
-    def start_large_circle_rotation(self, large_circle):
-        """Start rotation animation for a large circle and all circles within it."""
+    def start_large_circle_rotation(self, large_circle, instant=False):
+        """
+        Start rotation animation for a large circle and all circles within it.
+
+        With instant, the rotation and its after effects are applied right away instead,
+        without sound, for callers that only need the resulting position.
+        """
         if self.is_any_circle_animating():
             return False
 
@@ -124,6 +144,14 @@ class AnimationHandler:
                 medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.system.small_circles
             )
             all_small_circles.extend(circles_inside)
+        self.system.color_manager.slot_index.start_move(all_small_circles, medium_circles)
+
+        if instant:
+            self.large_circle_controller.apply_rotation(
+                large_circle, medium_circles, all_small_circles
+            )
+            self._finish_instant_rotation()
+            return True
 
         # Start the rotation sound sequence
         self._start_rotation_sound_sequence()
@@ -132,8 +160,14 @@ class AnimationHandler:
         self.large_circle_controller.start_rotation(large_circle, medium_circles, all_small_circles)
         return True
 
-    def start_medium_circle_rotation(self, medium_circle, circles_inside):
+    def start_medium_circle_rotation(self, medium_circle, circles_inside, instant=False):
         """Start rotation for a specific medium circle with dynamically calculated circles."""
+        self.system.color_manager.slot_index.start_move(circles_inside)
+        if instant:
+            self.circle_controller.apply_rotation(medium_circle, circles_inside)
+            self._finish_instant_rotation()
+            return
+
         # Start the rotation sound sequence
         self._start_rotation_sound_sequence()
 
@@ -143,19 +177,21 @@ class AnimationHandler:
     def start_center_rotation(self) -> None:
         """Start center rotation animation."""
         self.center_controller.start_rotation()
+        self.system.color_manager.slot_index.start_move(
+            self.system.small_circles, self.system.medium_circles
+        )
         # Update backward compatibility attributes
         self.is_center_rotating = self.center_controller.is_rotating
         self.center_rotation_start = self.center_controller.rotation_start
-        self.center_initial_angles = self.center_controller.initial_angles
 
     def update(self):
         """Update all animations and handle post-animation effects."""
-        current_time = time.time()
+        current_time = self.clock.now()
         was_animating = self.is_any_circle_animating()
 
         # Update sound effects
         if was_animating:
-            self._update_rotation_sounds(current_time)
+            self._update_rotation_sounds(time.time())
 
         self.center_controller.update(current_time)
         self.circle_controller.update(current_time)
@@ -166,8 +202,14 @@ class AnimationHandler:
             self._stop_rotation_sounds()
             self._handle_post_animation_effects()
 
+    def _finish_instant_rotation(self):
+        """What the frames after an animated rotation would do, done synchronously."""
+        self._handle_post_animation_effects()
+        self.system.settle_board()
+
     def _handle_post_animation_effects(self):
         """Handle effects that occur after animations complete."""
+        self.system.color_manager.slot_index.finish_move()
         # Update game state first
         self.system.game_state.phase = PHASE_PLACEMENT
         self.system.game_state.turn = "blue" if self.system.game_state.turn == "red" else "red"
@@ -182,7 +224,10 @@ class AnimationHandler:
             after_rotation=True,  # This ensures neighbor rules are applied post-animation
         )
 
-        self.system.circle_manager.find_and_neutralize_islands(self.system.connection_manager)
+        self.system.circle_manager.find_and_neutralize_islands(
+            self.system.connection_manager, self.system.color_manager.slot_index
+        )
+        self.system.mark_board_changed()
 
     def is_any_circle_animating(self) -> bool:
         """Check if any animation is currently in progress."""
@@ -193,6 +238,13 @@ class AnimationHandler:
             or self.large_circle_controller.is_rotating
         )
 
+    def moving_circles(self) -> set:
+        """Circles whose positions the running animations change; empty when idle."""
+        moving = set(self.center_controller.moving_circles())
+        moving.update(self.large_circle_controller.moving_circles())
+        moving.update(self.circle_controller.moving_circles())
+        return moving
+
     def set_rotation_duration(self, duration: float) -> None:
         """Update the rotation duration for all controllers."""
         self.rotation_duration = duration
@@ -2,14 +2,13 @@ import pygame
 from ..utils.settings import (
     CIRCLE_MEDIUM_RADIUS,
     CIRCLE_LARGE_RADIUS,
-    CIRCLE_SMALL_RADIUS,
     RED,
     BLUE,
     PHASE_PLACEMENT,
     GREY,
     GameMode,
 )
-from ..utils.geometry import calculate_distance, get_completely_contained_circles
+from ..utils.geometry import get_completely_contained_circles
 import random
 
 
@@ -55,57 +54,9 @@ class EventHandler:
                     )
         return False
 
-    def _count_valid_moves_by_type(self, mouse_pos, valid_moves):
-        """Count how many valid move areas of each type contain this point."""
-        large_count = 0
-        medium_count = 0
-        placement_count = 0
-
-        for move in valid_moves:
-            # Always use CIRCLE_MEDIUM_RADIUS + 4 for rotation moves (both large and medium)
-            # as that's the radius of the green contour shown to the player
-            if hasattr(move, "medium_circles"):  # large circle
-                if calculate_distance(mouse_pos, move.pos) <= CIRCLE_MEDIUM_RADIUS + 4:
-                    large_count += 1
-            elif hasattr(move, "small_circles"):  # medium circle
-                if calculate_distance(mouse_pos, move.pos) <= CIRCLE_MEDIUM_RADIUS + 4:
-                    medium_count += 1
-            else:  # small circle (placement)
-                if calculate_distance(mouse_pos, move.pos) <= CIRCLE_SMALL_RADIUS + 4:
-                    placement_count += 1
-
-        total_count = large_count + medium_count + placement_count
-
-        return total_count, large_count, medium_count, placement_count
-
-    def _get_valid_move_at_point(self, mouse_pos, valid_moves):
-        """Get the valid move at this point if it's in exactly one valid move area."""
-        total, large_count, medium_count, placement_count = self._count_valid_moves_by_type(
-            mouse_pos, valid_moves
-        )
-
-        # If point is in multiple valid move areas, return None
-        if total != 1:
-            return None
-
-        # Return the one valid move containing this point
-        for move in valid_moves:
-            # Use the same radius as the green contour
-            radius = (
-                CIRCLE_SMALL_RADIUS + 4
-                if not hasattr(move, "medium_circles") and not hasattr(move, "small_circles")
-                else CIRCLE_MEDIUM_RADIUS + 4
-            )
-
-            if calculate_distance(mouse_pos, move.pos) <= radius:
-                return move
-
-        return None
-
     def _handle_rotation_click(self, mouse_pos):
         """Handle clicks during rotation phase."""
-        valid_moves = self.system.move_handler.get_valid_moves()
-        clicked_move = self._get_valid_move_at_point(mouse_pos, valid_moves)
+        clicked_move = self.system.move_handler.get_valid_move_at(mouse_pos)
 
         if clicked_move:
             # Toggle selection
@@ -121,8 +72,7 @@ class EventHandler:
 
     def _handle_placement_click(self, mouse_pos):
         """Handle clicks during placement phase."""
-        valid_moves = self.system.move_handler.get_valid_moves()
-        clicked_move = self._get_valid_move_at_point(mouse_pos, valid_moves)
+        clicked_move = self.system.move_handler.get_valid_move_at(mouse_pos)
 
         if clicked_move and clicked_move.color == GREY:
             # Toggle selection
@@ -204,6 +154,7 @@ class EventHandler:
                     print("Game reset")
                 elif menu_rect.collidepoint(mouse_pos):
                     self.game_controller.game_mode = GameMode.MENU
+                    self.game_controller.set_speed_state("normal")
                     self.winner_buttons = None
                     print("Returning to menu")
                 return True
@@ -290,6 +241,7 @@ class EventHandler:
     def _handle_quit(self):
         """Handle quit button click by returning to menu"""
         self.game_controller.game_mode = GameMode.MENU
+        self.game_controller.set_speed_state("normal")
         return True
 
     def _handle_prev_click(self):
@@ -20,14 +20,35 @@ class MoveHandler:
     def get_valid_moves(self):
         return self.validator.get_valid_moves()
 
-    def make_placement_move(self, circle, player_color):
-        if self.executor.make_placement_move(circle, player_color):
+    def get_valid_move_at(self, pos):
+        return self.validator.get_move_at(pos)
+
+    def skip_blocked_placement(self):
+        """Move on to the rotation phase if the player to move has nowhere to place."""
+        if self.system.game_state.phase != PHASE_PLACEMENT or self.system.is_any_circle_animating():
+            return False
+        if self.validator.get_valid_moves():
+            return False
+        self.system.game_state.phase = PHASE_ROTATION
+        print("No valid moves found. Changing phase to rotation for", self.system.game_state.turn)
+        return True
+
+    def make_placement_move(self, circle, player_color, instant=False):
+        if self.executor.make_placement_move(circle, player_color, instant):
             self.recorder.record_placement_move(circle.pos, player_color)
             return True
         return False
 
-    def make_rotation_move(self, circle, player_color, contained_circles_only=False):
-        if self.executor.make_rotation_move(circle, player_color, contained_circles_only):
+    def make_rotation_move(
+        self, circle, player_color, contained_circles_only=False, instant=False
+    ):
+        """
+        Play a rotation; with instant it is fully applied (turn passed, colors and islands
+        updated) when this returns, which is what the AI search, replays and tests need.
+        """
+        if self.executor.make_rotation_move(
+            circle, player_color, contained_circles_only, instant
+        ):
             rotation_type = (
                 "medium" if isinstance(circle, type(self.system.medium_circles[0])) else "super"
             )
@@ -57,6 +78,7 @@ class MoveHandler:
                     after_rotation=False,
                 )
                 self.system.game_state.phase = PHASE_ROTATION
+                self.system.mark_board_changed()
                 break
 
     def _apply_rotation_move(self, position, opponent_color):
@@ -1,6 +1,3 @@
-from ..utils.settings import RED, BLUE
-
-
 class TurnHandler:
     def __init__(self, circle_system):
         self.circle_system = circle_system
@@ -10,11 +7,7 @@ class TurnHandler:
         if not hasattr(self.circle_system, "circle_manager"):
             return None
 
-        large_circles = self.circle_system.circle_manager.large_circles
-
-        # Count large circles of each color
-        red_large_circles = sum(1 for sc in large_circles if sc.color == RED)
-        blue_large_circles = sum(1 for sc in large_circles if sc.color == BLUE)
+        red_large_circles, blue_large_circles = self.circle_system.circle_manager.stats.large
 
         if red_large_circles >= 5:
             return "red"
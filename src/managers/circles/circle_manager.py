@@ -4,6 +4,7 @@ from ...utils.circle_initialization import FractalCircleInitializer
 from ...utils.circle_classes import MediumCircle, SmallCircle, LargeCircle
 from ...utils.geometry import get_circles_inside_at_position
 from ...utils.island_detection import IslandDetector
+from ...utils.board.board_stats import BoardStats
 
 
 class CircleManager:
@@ -16,6 +17,8 @@ class CircleManager:
         self.fractal_initializer = FractalCircleInitializer(
             self.center, CIRCLE_MEDIUM_RADIUS * 4, reduced_version=reduced_version
         )
+        self.island_detector = IslandDetector()
+        self.stats = BoardStats()
 
     def _initialize_system(self):
         """Initialize all circles in the system using fractal mathematics."""
@@ -63,6 +66,8 @@ class CircleManager:
             self.large_circles.append(large_circle)
             large_id += 1
 
+        self.stats.track(self)
+
         # Verify initialization
         for medium_circle in self.medium_circles:
             contained = self.get_circles_inside(medium_circle)
@@ -75,11 +80,17 @@ class CircleManager:
             medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.small_circles
         )
 
-    def find_and_neutralize_islands(self, connection_manager):
+    def find_and_neutralize_islands(self, connection_manager, slot_index=None):
         """Find and neutralize isolated groups of small circles"""
-        red_islands, blue_islands = IslandDetector.find_islands(
-            self.small_circles, connection_manager
-        )
+        use_slots = slot_index is not None and slot_index.refresh()
+        if use_slots:
+            red_islands, blue_islands = self.island_detector.find_changed_islands(
+                slot_index, connection_manager
+            )
+        else:
+            red_islands, blue_islands = IslandDetector.find_islands(
+                self.small_circles, connection_manager
+            )
         neutralized = []
 
         # Process all islands regardless of size
@@ -88,6 +99,10 @@ class CircleManager:
                 circle.set_color(GREY)
                 neutralized.append(circle)
 
+        if use_slots and neutralized:
+            # Greying cannot create new islands, but the detector must see later recolors
+            slot_index.changed_since("islands")
+
         return neutralized
 
     def print_neutralized_circles(self, neutralized):
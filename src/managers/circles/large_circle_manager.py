@@ -1,5 +1,5 @@
-from ...utils.settings import RED, BLUE, GREY, CIRCLE_MEDIUM_RADIUS
-import math
+from ...utils.settings import RED, BLUE, GREY
+from ...utils.circle_intersection_checker import CircleIntersectionChecker
 
 
 class MediumCircleManager:
@@ -32,29 +32,4 @@ class MediumCircleManager:
 
     @staticmethod
     def _check_intersections(medium_circles):
-        changed = False
-        for circle in medium_circles:
-            if circle.color == GREY:
-                intersecting_red = 0
-                intersecting_blue = 0
-
-                for other_circle in medium_circles:
-                    if other_circle != circle:
-                        dx = circle.pos[0] - other_circle.pos[0]
-                        dy = circle.pos[1] - other_circle.pos[1]
-                        distance = math.sqrt(dx**2 + dy**2)
-
-                        if distance < 2 * CIRCLE_MEDIUM_RADIUS:
-                            if other_circle.color == RED:
-                                intersecting_red += 1
-                            elif other_circle.color == BLUE:
-                                intersecting_blue += 1
-
-                if intersecting_red >= 2:
-                    circle.color = RED
-                    changed = True
-                elif intersecting_blue >= 2:
-                    circle.color = BLUE
-                    changed = True
-
-        return changed
+        return CircleIntersectionChecker.check_by_distance(medium_circles)
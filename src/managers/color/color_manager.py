@@ -1,4 +1,5 @@
 from ...utils.circle_intersection_checker import CircleIntersectionChecker
+from ...utils.board.slot_index import SlotIndex
 from .medium_circle_color_manager import MediumCircleColorManager
 from .large_circle_color_manager import LargeCircleColorManager
 from .player_color_manager import PlayerColorManager
@@ -6,9 +7,12 @@ from .player_color_manager import PlayerColorManager
 
 class GameColorManager:
     def __init__(self, circle_system):
-        self.intersection_checker = CircleIntersectionChecker()
-        self.medium_circle_manager = MediumCircleColorManager(self.intersection_checker)
-        self.large_circle_manager = LargeCircleColorManager(circle_system)
+        self.slot_index = SlotIndex(circle_system)
+        self.intersection_checker = CircleIntersectionChecker(self.slot_index)
+        self.medium_circle_manager = MediumCircleColorManager(
+            self.intersection_checker, self.slot_index
+        )
+        self.large_circle_manager = LargeCircleColorManager(circle_system, self.slot_index)
         self._player_manager = PlayerColorManager()
         self.turn = self._player_manager.turn
         self.player_color = self._player_manager.player_color
@@ -5,9 +5,10 @@ from ...utils.geometry import get_completely_contained_circles, calculate_distan
 class LargeCircleColorManager:
     """Manages color updates for large circles based on their medium circle children."""
 
-    def __init__(self, circle_system):
+    def __init__(self, circle_system, slot_index=None):
         """Initialize with circle system reference."""
         self.circle_system = circle_system
+        self.slot_index = slot_index
 
     def update_colors(self, large_circles):
         """Update large circle colors based on their contained medium circles."""
@@ -16,15 +17,19 @@ class LargeCircleColorManager:
             return False
 
         changes_made = False
+        use_slots = self.slot_index and self.slot_index.refresh()
 
-        for large_circle in large_circles:
+        for index, large_circle in enumerate(large_circles):
             # Get completely contained medium circles
-            contained_circles = get_completely_contained_circles(
-                large_circle.pos,
-                CIRCLE_LARGE_RADIUS,
-                self.circle_system.medium_circles,
-                CIRCLE_MEDIUM_RADIUS,
-            )
+            if use_slots:
+                contained_circles = self.slot_index.large_members(index)
+            else:
+                contained_circles = get_completely_contained_circles(
+                    large_circle.pos,
+                    CIRCLE_LARGE_RADIUS,
+                    self.circle_system.medium_circles,
+                    CIRCLE_MEDIUM_RADIUS,
+                )
 
             # Count medium circles of each color
             red_count = sum(1 for mc in contained_circles if mc.color == RED)
@@ -3,8 +3,11 @@ from .neighbor_rule_manager import NeighborRuleManager
 
 
 class MediumCircleColorManager:
-    def __init__(self, intersection_checker):
+    def __init__(self, intersection_checker, slot_index=None):
         self.intersection_checker = intersection_checker
+        self.slot_index = slot_index
+        self.neighbor_rule_manager = NeighborRuleManager()
+        self._contained_colors = {}  # Medium slot -> color from its contained circles
 
     def update_colors(
         self, medium_circles, get_circles_inside_func, connection_manager, after_rotation=False
@@ -32,38 +35,75 @@ class MediumCircleColorManager:
         return changes_made
 
     def _update_based_on_contained_circles(self, medium_circles, get_circles_inside_func):
+        if self.slot_index and self.slot_index.refresh():
+            return self._update_from_slots(medium_circles)
+
         changes_made = False
         for medium_circle in medium_circles:
             circles_inside = get_circles_inside_func(medium_circle)
             if not circles_inside:
                 continue
 
-            red_count = sum(1 for circle in circles_inside if circle.color == RED)
-            blue_count = sum(1 for circle in circles_inside if circle.color == BLUE)
+            new_color = self._color_from_circles(circles_inside)
+            if new_color != medium_circle.color:
+                changes_made = True
+                medium_circle.color = new_color
+
+        return changes_made
 
-            new_color = GREY
-            if red_count >= 5:
-                new_color = RED
-            elif blue_count >= 5:
-                new_color = BLUE
+    def _update_from_slots(self, medium_circles):
+        """Recount only the medium slots holding small circles that changed since last time"""
+        slot_index = self.slot_index
+        affected = set()
+        for circle in slot_index.changed_since("medium_colors"):
+            affected.update(slot_index.parents(circle))
+        for medium_slot in affected:
+            self._contained_colors[medium_slot] = self._color_from_circles(
+                slot_index.members(medium_slot)
+            )
 
+        changes_made = False
+        for medium_circle in medium_circles:
+            new_color = self._contained_colors[slot_index.medium_slot_of[medium_circle]]
             if new_color != medium_circle.color:
                 changes_made = True
                 medium_circle.color = new_color
 
         return changes_made
 
+    @staticmethod
+    def _color_from_circles(circles):
+        red_count = sum(1 for circle in circles if circle.color == RED)
+        blue_count = sum(1 for circle in circles if circle.color == BLUE)
+
+        if red_count >= 5:
+            return RED
+        if blue_count >= 5:
+            return BLUE
+        return GREY
+
     def _apply_post_rotation_updates(
         self, medium_circles, get_circles_inside_func, connection_manager
     ):
-        changes_made = False
-        neighbor_rule_manager = NeighborRuleManager()
+        if self.slot_index and self.slot_index.refresh():
+            # Start from the circles that moved or changed color since the rule last ran
+            seeds = self.slot_index.changed_since("neighbor_rule")
+            changed = self.neighbor_rule_manager.propagate(
+                seeds, self.slot_index.slot_of, connection_manager
+            )
+            # The rule's own changes are already settled
+            self.slot_index.changed_since("neighbor_rule")
+            if not changed:
+                return False
+            self._update_based_on_contained_circles(medium_circles, get_circles_inside_func)
+            return True
 
+        changes_made = False
         all_circles = []
         for medium_circle in medium_circles:
             all_circles.extend(get_circles_inside_func(medium_circle))
 
-        while neighbor_rule_manager.apply_neighbor_color_rule(all_circles, connection_manager):
+        while self.neighbor_rule_manager.apply_neighbor_color_rule(all_circles, connection_manager):
             changes_made = True
             self._update_based_on_contained_circles(medium_circles, get_circles_inside_func)
 
@@ -1,3 +1,4 @@
+import heapq
 from ...utils.settings import RED, BLUE, GREY
 
 
@@ -8,15 +9,64 @@ class NeighborRuleManager:
         grey_circles = [c for c in circles if c.color == GREY]
 
         for circle in grey_circles:
-            neighbors = connection_manager.adjacent_connections.get(circle, [])
-            red_neighbors = sum(1 for n in neighbors if n.color == RED)
-            blue_neighbors = sum(1 for n in neighbors if n.color == BLUE)
-
-            if red_neighbors >= 2:
-                circle.color = RED
-                changes_made = True
-            elif blue_neighbors >= 2:
-                circle.color = BLUE
+            if self._apply_to_circle(circle, connection_manager.adjacent_connections):
                 changes_made = True
 
         return changes_made
+
+    def propagate(self, seeds, slot_of, connection_manager):
+        """
+        Apply the neighbor rule until nothing changes, starting from the circles in seeds.
+
+        Equivalent to repeating apply_neighbor_color_rule over every grey circle in slot
+        order, as long as the rest of the board was already stable: within a pass, circles
+        are visited in slot order from a heap, and a color change only queues the grey
+        neighbors it can affect - later slots in the same pass, earlier slots in the next.
+        Returns the circles that changed color.
+        """
+        adjacency = connection_manager.adjacent_connections
+        candidates = set()
+        for circle in seeds:
+            if circle.color == GREY:
+                candidates.add(circle)
+            candidates.update(n for n in adjacency.get(circle, ()) if n.color == GREY)
+
+        changed = []
+        next_pass = candidates
+        while next_pass:
+            queue = [(slot_of[circle], circle.id, circle) for circle in next_pass]
+            heapq.heapify(queue)
+            queued = set(next_pass)
+            next_pass = set()
+
+            while queue:
+                slot, _, circle = heapq.heappop(queue)
+                if circle.color != GREY or not self._apply_to_circle(circle, adjacency):
+                    continue
+                changed.append(circle)
+
+                for neighbor in adjacency.get(circle, ()):
+                    if neighbor.color != GREY:
+                        continue
+                    if slot_of[neighbor] > slot:
+                        if neighbor not in queued:
+                            queued.add(neighbor)
+                            heapq.heappush(queue, (slot_of[neighbor], neighbor.id, neighbor))
+                    else:
+                        next_pass.add(neighbor)
+
+        return changed
+
+    @staticmethod
+    def _apply_to_circle(circle, adjacency):
+        neighbors = adjacency.get(circle, [])
+        red_neighbors = sum(1 for n in neighbors if n.color == RED)
+        blue_neighbors = sum(1 for n in neighbors if n.color == BLUE)
+
+        if red_neighbors >= 2:
+            circle.color = RED
+            return True
+        if blue_neighbors >= 2:
+            circle.color = BLUE
+            return True
+        return False
@@ -135,6 +135,10 @@ class GameNetworkManager:
         """Get the next message from the message queue."""
         return self.queue_manager.get_message()
 
+    def has_pending_messages(self) -> bool:
+        """Check if messages or moves from the server are waiting to be handled."""
+        return self.queue_manager.has_incoming()
+
     def _run_async_loop(self) -> None:
         """Run the asyncio event loop in a separate thread."""
         loop = asyncio.new_event_loop()
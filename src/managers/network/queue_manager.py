@@ -30,6 +30,10 @@ class QueueManager:
             return None
         return None
 
+    def has_incoming(self) -> bool:
+        """Check if messages or moves are waiting to be handled."""
+        return not self.message_queue.empty() or not self.incoming_moves.empty()
+
     def add_pending_move(self, sequence: int, move_data: Dict[str, Any]) -> None:
         """Add move to pending moves list."""
         self.pending_moves.append((sequence, move_data))
@@ -6,14 +6,17 @@ from ..utils.settings import (
     BLUE,
     RED,
     DRAW_SAVE_LOAD_UI,
+    DIRTY_RECT_UPDATES,
 )
 from ..renderers.debug_renderer import DebugRenderer
+from ..renderers.dirty_regions import DirtyRegions, SCREEN_RECT
 from ..renderers.game_renderer import GameRenderer
 from ..renderers.save_load_ui import SaveLoadUI
+from ..renderers.text_cache import render_text
 
 
 class RenderManager:
-    def __init__(self, screen, original_ui):
+    def __init__(self, screen, original_ui, dirty_rect_updates=DIRTY_RECT_UPDATES):
         self.screen = screen
         self.font = pygame.font.Font(None, 32)
         self.debug_settings = DebugSettings()  # Will use singleton instance
@@ -21,8 +24,16 @@ class RenderManager:
         self.game_renderer = GameRenderer(self.font, original_ui)
         self.show_debug_ui = False
         self.current_training_stats = None
+        self.search_stats = None
+        self.frame_stats = []
         self.save_load_ui = SaveLoadUI(self.font)
         self.circle_system = None
+        # With dirty rect updates only the changed parts of the window reach the display,
+        # and frames where nothing changed are not drawn at all. The regions are tracked
+        # either way, so the main loop can tell frames that changed nothing.
+        self.dirty_rect_updates = dirty_rect_updates
+        self.dirty_regions = DirtyRegions()
+        self.preview_frame = 0
 
     def set_circle_system(self, circle_system):
         """Set the circle system reference and share debug settings"""
@@ -34,8 +45,20 @@ class RenderManager:
         """Update the current training statistics"""
         self.current_training_stats = stats
 
+    def update_search_stats(self, stats):
+        """Update the AI search statistics shown in the debug overlay"""
+        self.search_stats = stats
+
+    def update_frame_stats(self, lines):
+        """Update the frame-time statistics shown in the debug overlay"""
+        self.frame_stats = lines
+
     def render_frame(self, game_mode, systems):
-        """Render a frame of the game based on the current game mode."""
+        """Render a frame of the game based on the current game mode; True if it changed."""
+        dirty = self.dirty_regions.changed(self._frame_regions(game_mode, systems))
+        if self.dirty_rect_updates and not dirty:
+            return False  # The display already shows this frame
+
         self.screen.fill((255, 255, 255))  # White background
 
         if game_mode in [GameMode.MENU, GameMode.WAITING]:
@@ -57,19 +80,59 @@ class RenderManager:
                         )
                     # Draw the debug UI controls
                     self.debug_renderer.draw_debug_ui(self.screen, self.debug_settings)
+                    if self.search_stats:
+                        self.debug_renderer.draw_search_stats(self.screen, self.search_stats)
+                    self.debug_renderer.draw_frame_stats(self.screen, self.frame_stats)
 
                 # Draw save/load UI only in offline mode
                 # if game_mode == GameMode.OFFLINE and DRAW_SAVE_LOAD_UI:
                 #     self.save_load_ui.draw(self.screen, systems["circle"].save_load_manager)
 
-                # if game_mode == GameMode.TRAINING:
-                #     if self.current_training_stats:
-                #         self.draw_training_stats(self.screen, self.current_training_stats)
-                #         self.game_renderer.draw_training_stats(
-                #             self.screen, self.current_training_stats
-                #         )
+                if game_mode == GameMode.TRAINING and self.current_training_stats:
+                    # self.draw_training_stats(self.screen, self.current_training_stats)
+                    self.game_renderer.draw_training_stats(
+                        self.screen, self.current_training_stats
+                    )
 
-        pygame.display.flip()
+        if self.dirty_rect_updates:
+            pygame.display.update(dirty)
+        else:
+            pygame.display.flip()
+        return bool(dirty)
+
+    def _frame_regions(self, game_mode, systems):
+        """(name, rect, key) of every part of the screen that render_frame draws"""
+        if game_mode in [GameMode.MENU, GameMode.WAITING]:
+            return [("menu", SCREEN_RECT, systems["menu"].render_key())]
+        circle_system = systems["circle"]
+        if not circle_system:
+            return [("empty", SCREEN_RECT, None)]
+
+        regions = [("board", *self.game_renderer.board_region(circle_system))]
+        regions.extend(self.game_renderer.original_ui.dirty_regions())
+        if game_mode == GameMode.TRAINING and self.current_training_stats:
+            speed_button = self.game_renderer.ui_renderer.get_button_rect()
+            regions.append(("speed", speed_button, self.current_training_stats["speed_state"]))
+        regions.append(("debug", SCREEN_RECT, self._debug_key()))
+        return regions
+
+    def _debug_key(self):
+        if not self.show_debug_ui:
+            return None
+        if self.debug_settings.showing_connections:
+            # The connection preview covers the board, so it is redrawn every frame
+            self.preview_frame += 1
+        return (
+            self.debug_settings.connection_distance_multiplier,
+            self.debug_settings.showing_connections and self.preview_frame,
+            self.search_stats,
+            tuple(self.frame_stats),
+        )
+
+    def handle_window_event(self, event):
+        """Push the whole window again after the system has cleared or resized it."""
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED):
+            self.dirty_regions.invalidate()
 
     def draw_training_stats(self, surface, stats):
         """Draw training statistics for both players"""
@@ -87,7 +150,7 @@ class RenderManager:
         ]
 
         for text in texts:
-            text_surface = self.font.render(text, True, BLUE)
+            text_surface = render_text(self.font, text, True, BLUE)
             surface.blit(text_surface, (x_offset, y_offset))
             y_offset += line_height
 
@@ -100,12 +163,15 @@ class RenderManager:
         ]
 
         for text in texts:
-            text_surface = self.font.render(text, True, RED)
+            text_surface = render_text(self.font, text, True, RED)
             surface.blit(text_surface, (x_offset, y_offset))
             y_offset += line_height
 
     def handle_debug_events(self, event):
         """Handle debug-related events."""
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.show_debug_ui = not self.show_debug_ui
+            return True
         if self.debug_renderer.handle_debug_events(event, self.debug_settings):
             if self.circle_system:
                 print("\nRenderManager handling debug event")
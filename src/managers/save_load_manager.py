@@ -105,6 +105,7 @@ class SaveLoadManager:
                 circle = self.game_system.medium_circles[i]
                 circle.pos = saved_circle["pos"]
                 circle.color = saved_circle["color"]
+            self.game_system.color_manager.slot_index.invalidate()
 
             # Restore game state
             self.game_system.game_state.turn = state["turn"]
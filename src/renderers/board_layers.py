@@ -0,0 +1,71 @@
+import pygame
+from ..utils.settings import WIDTH, HEIGHT
+
+
+def _new_layer():
+    return pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+
+
+class BoardLayers:
+    """
+    Draws the circles of the board from cached, premultiplied layers.
+
+    While nothing moves, the whole board is one layer that is rebuilt only when the board
+    version changes, so an idle frame is a single blit. During an animation the circles
+    that do not move are split into a layer below the moving medium circles (large and
+    medium circles) and one below the moving small circles, built once per animation,
+    and only the moving circles are drawn each frame.
+    """
+
+    def __init__(self, circle_renderer):
+        self.circle_renderer = circle_renderer
+        self.board_layer = _new_layer()
+        self.base_layer = _new_layer()
+        self.small_layer = _new_layer()
+        self._board_key = None
+        self._animation_key = None
+
+    def draw(self, surface, circle_system):
+        renderer = self.circle_renderer
+        manager = circle_system.circle_manager
+        moving = circle_system.animation_handler.moving_circles()
+
+        if not moving:
+            key = (circle_system, circle_system.board_version)
+            if key != self._board_key:
+                renderer.update_ids(circle_system)
+                self._compose(
+                    self.board_layer,
+                    manager.large_circles,
+                    manager.medium_circles,
+                    manager.small_circles,
+                )
+                self._board_key = key
+            self._blit(surface, self.board_layer)
+            return
+
+        key = (circle_system, circle_system.board_version, frozenset(moving))
+        if key != self._animation_key:
+            renderer.update_ids(circle_system)
+            static_medium = [c for c in manager.medium_circles if c not in moving]
+            static_small = [c for c in manager.small_circles if c not in moving]
+            self._compose(self.base_layer, manager.large_circles, static_medium, [])
+            self._compose(self.small_layer, [], [], static_small)
+            self._animation_key = key
+            # The idle layer is out of date once anything moves
+            self._board_key = None
+
+        self._blit(surface, self.base_layer)
+        renderer.draw_circles(surface, [c for c in manager.medium_circles if c in moving], "medium")
+        self._blit(surface, self.small_layer)
+        renderer.draw_circles(surface, [c for c in manager.small_circles if c in moving], "small")
+
+    def _compose(self, layer, large_circles, medium_circles, small_circles):
+        layer.fill((0, 0, 0, 0))
+        self.circle_renderer.draw_circles(layer, large_circles, "large")
+        self.circle_renderer.draw_circles(layer, medium_circles, "medium")
+        self.circle_renderer.draw_circles(layer, small_circles, "small")
+
+    @staticmethod
+    def _blit(surface, layer):
+        surface.blit(layer, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
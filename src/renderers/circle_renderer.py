@@ -3,13 +3,12 @@ from ..utils.settings import (
     CIRCLE_SMALL_RADIUS,
     CIRCLE_MEDIUM_RADIUS,
     CIRCLE_LARGE_RADIUS,
-    WIDTH,
-    HEIGHT,
     RED,
     BLUE,
     SHOW_IDS,
 )
-from ..utils.geometry import calculate_distance
+from .sprite_cache import SpriteCache, render_disk
+from .text_cache import render_text
 
 
 class CircleRenderer:
@@ -20,12 +19,6 @@ class CircleRenderer:
         self.REDUCED_CIRCLE_LARGE_RADIUS = int(CIRCLE_LARGE_RADIUS * 0.55)
         self.INCREASED_CIRCLE_SMALL_RADIUS = int(CIRCLE_SMALL_RADIUS * 1.5)
 
-        # Tracking original positions and IDs for each circle type
-        self.small_circle_coords = []
-        self.medium_circle_coords = []
-        self.large_circle_coords = []
-        self.initialized = {"small": False, "medium": False, "large": False}
-
         # Color schemes
         self.COLORS = {
             "neutral": {
@@ -56,12 +49,10 @@ class CircleRenderer:
 
         # Cache for circle surfaces
         self.circle_cache = {}
+        self.sprite_cache = SpriteCache.shared()
+        self._radii_and_alphas = {size: (radius, alpha) for size, radius, alpha in self._tiers()}
         self._initialize_surface_cache()
 
-        # Batch rendering surfaces
-        self.small_circles_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        self.medium_circles_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-
     def _hex_to_rgb(self, hex_color):
         """Convert hex color string to RGB tuple"""
         hex_color = hex_color.replace("0x", "")
@@ -75,131 +66,66 @@ class CircleRenderer:
             return self.COLORS["blue"][size]
         return self.COLORS["neutral"][size]
 
-    def _initialize_positions(self, circles, circle_type):
-        """Initialize positions for a specific circle type."""
-        if circle_type == "small":
-            coords_list = self.small_circle_coords
-        elif circle_type == "medium":
-            coords_list = self.medium_circle_coords
-        else:  # large
-            coords_list = self.large_circle_coords
-
-        for circle in circles:
-            pos_tuple = (float(circle.pos[0]), float(circle.pos[1]))
-            coords_list.append(pos_tuple)
-            circle.original_pos = pos_tuple
-            circle.original_id = len(coords_list) - 1
-            circle.id = circle.original_id
-
-        self.initialized[circle_type] = True
-
-    def _update_id(self, circle, current_pos, circle_type):
-        """Update circle ID based on its type and position."""
-        if circle_type == "small":
-            coords_list = self.small_circle_coords
-        elif circle_type == "medium":
-            coords_list = self.medium_circle_coords
-        else:  # large
-            coords_list = self.large_circle_coords
-
-        for idx, orig_pos in enumerate(coords_list):
-            if calculate_distance(current_pos, orig_pos) <= 5:
-                circle.id = idx
-                break
-
     def _initialize_surface_cache(self):
-        """Pre-render common circle surfaces"""
-        for radius in [self.INCREASED_CIRCLE_SMALL_RADIUS, self.REDUCED_CIRCLE_MEDIUM_RADIUS]:
-            size = (radius * 2 + 2, radius * 2 + 2)
-
-            # Cache surfaces for all color schemes
+        """Load or pre-render the circle sprites of every tier and color scheme"""
+        for circle_size, radius, alpha in self._tiers():
             for scheme in ["neutral", "red", "blue"]:
-                for circle_size in ["small", "medium"]:
-                    if (
-                        radius == self.INCREASED_CIRCLE_SMALL_RADIUS and circle_size == "small"
-                    ) or (radius == self.REDUCED_CIRCLE_MEDIUM_RADIUS and circle_size == "medium"):
-                        color = self.COLORS[scheme][circle_size]
-                        alpha = self.SMALL_ALPHA if circle_size == "small" else self.MEDIUM_ALPHA
-                        surface = pygame.Surface(size, pygame.SRCALPHA)
-                        pygame.draw.circle(
-                            surface, (*color, alpha), (radius + 1, radius + 1), radius
-                        )
-                        self.circle_cache[f"{radius}_{scheme}_{circle_size}"] = surface
-
-    def draw_small_circles(self, surface, small_circles):
-        """Draw small circles with batched rendering"""
-        if not self.initialized["small"]:
-            self._initialize_positions(small_circles, "small")
-
-        self.small_circles_surface.fill((0, 0, 0, 0))
-
-        for circle in small_circles:
-            current_pos = (float(circle.pos[0]), float(circle.pos[1]))
-            self._update_id(circle, current_pos, "small")
-
-            color = self._get_circle_color(circle, "small")
-            circle_surface = self._get_cached_circle(
-                self.INCREASED_CIRCLE_SMALL_RADIUS, color, self.SMALL_ALPHA, "small"
-            )
-            pos = (
-                int(circle.pos[0] - self.INCREASED_CIRCLE_SMALL_RADIUS),
-                int(circle.pos[1] - self.INCREASED_CIRCLE_SMALL_RADIUS),
-            )
-            self.small_circles_surface.blit(circle_surface, pos)
-
-            if self.show_ids:
-                self._draw_id(self.small_circles_surface, circle)
-
-        surface.blit(self.small_circles_surface, (0, 0))
-
-    def draw_medium_circles(self, surface, medium_circles):
-        """Draw medium circles with batched rendering"""
-        if not self.initialized["medium"]:
-            self._initialize_positions(medium_circles, "medium")
-
-        self.medium_circles_surface.fill((0, 0, 0, 0))
-
-        for circle in medium_circles:
-            current_pos = (float(circle.pos[0]), float(circle.pos[1]))
-            self._update_id(circle, current_pos, "medium")
-
-            color = self._get_circle_color(circle, "medium")
-            circle_surface = self._get_cached_circle(
-                self.REDUCED_CIRCLE_MEDIUM_RADIUS, color, self.MEDIUM_ALPHA, "medium"
-            )
-            pos = (
-                int(circle.pos[0] - self.REDUCED_CIRCLE_MEDIUM_RADIUS),
-                int(circle.pos[1] - self.REDUCED_CIRCLE_MEDIUM_RADIUS),
-            )
-            self.medium_circles_surface.blit(circle_surface, pos)
-
-            if self.show_ids:
-                self._draw_id(self.medium_circles_surface, circle)
-
-        surface.blit(self.medium_circles_surface, (0, 0))
-
-    def draw_large_circles(self, surface, circle_manager):
-        """Draw the large background circles."""
-        if not hasattr(circle_manager, "large_circles"):
-            return
-
-        for large_circle in circle_manager.large_circles:
-            current_pos = (float(large_circle.pos[0]), float(large_circle.pos[1]))
-            self._update_id(large_circle, current_pos, "large")
-
-            circle_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            color = self._get_circle_color(large_circle, "large")
-
-            pygame.draw.circle(
-                circle_surface,
-                (*color, self.LARGE_ALPHA),
-                (int(large_circle.pos[0]), int(large_circle.pos[1])),
-                self.REDUCED_CIRCLE_LARGE_RADIUS,
-            )
-            surface.blit(circle_surface, (0, 0))
+                color = self.COLORS[scheme][circle_size]
+                self.circle_cache[f"{radius}_{scheme}_{circle_size}"] = self._load_sprite(
+                    radius, color, alpha
+                )
+
+    def _tiers(self):
+        return [
+            ("small", self.INCREASED_CIRCLE_SMALL_RADIUS, self.SMALL_ALPHA),
+            ("medium", self.REDUCED_CIRCLE_MEDIUM_RADIUS, self.MEDIUM_ALPHA),
+            ("large", self.REDUCED_CIRCLE_LARGE_RADIUS, self.LARGE_ALPHA),
+        ]
+
+    def _load_sprite(self, radius, color, alpha):
+        """Circle sprite with premultiplied alpha, so layers composite like direct drawing"""
+        return self.sprite_cache.get("circle", (radius, color, alpha), render_disk).premul_alpha()
+
+    def update_ids(self, circle_system):
+        """
+        Set every circle's ID to the slot it currently sits on.
+
+        The slots come from the board's slot index, which only looks up circles that moved
+        since it last looked; circles in the middle of an animation keep their ID.
+        """
+        slot_index = circle_system.color_manager.slot_index
+        slot_index.refresh()
+        for slot_of in (slot_index.slot_of, slot_index.medium_slot_of):
+            for circle, slot in slot_of.items():
+                circle.id = slot
+
+    def draw_circles(self, surface, circles, circle_size):
+        """Blit the sprites of one tier of circles with premultiplied alpha blending"""
+        radius, alpha = self._radii_and_alphas[circle_size]
+        # Large sprites are centered on the rounded position, the others on the offset
+        large = circle_size == "large"
+        for circle in circles:
+            color = self._get_circle_color(circle, circle_size)
+            circle_surface = self._get_cached_circle(radius, color, alpha, circle_size)
+            if large:
+                pos = (int(circle.pos[0]) - radius - 1, int(circle.pos[1]) - radius - 1)
+            else:
+                pos = (int(circle.pos[0] - radius), int(circle.pos[1] - radius))
+            surface.blit(circle_surface, pos, special_flags=pygame.BLEND_PREMULTIPLIED)
 
             if self.show_ids:
-                self._draw_id(surface, large_circle)
+                self._draw_id(surface, circle)
+
+    def bounds(self, circles, circle_size):
+        """Rect covered by the sprites of circles, as placed by draw_circles, or None"""
+        radius, _ = self._radii_and_alphas[circle_size]
+        offset = radius + 1 if circle_size == "large" else radius
+        size = radius * 2 + 2
+        rects = [
+            pygame.Rect(int(circle.pos[0] - offset), int(circle.pos[1] - offset), size, size)
+            for circle in circles
+        ]
+        return rects[0].unionall(rects[1:]) if rects else None
 
     def _get_cached_circle(self, radius, color, alpha, size):
         """Get a cached circle surface or create new one"""
@@ -210,14 +136,11 @@ class CircleRenderer:
                 if key in self.circle_cache:
                     return self.circle_cache[key]
 
-        # If not found in cache, create new surface
-        size = (radius * 2 + 2, radius * 2 + 2)
-        surface = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.circle(surface, (*color, alpha), (radius + 1, radius + 1), radius)
-        return surface
+        # If not found in cache, load or render it
+        return self._load_sprite(radius, color, alpha)
 
     def _draw_id(self, surface, circle):
         """Draw circle ID with caching"""
-        id_text = self.circle_font.render(str(circle.id), True, (0, 0, 0))
+        id_text = render_text(self.circle_font, str(circle.id), True, (0, 0, 0)).premul_alpha()
         text_rect = id_text.get_rect(center=(int(circle.pos[0]), int(circle.pos[1])))
-        surface.blit(id_text, text_rect)
+        surface.blit(id_text, text_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
@@ -1,5 +1,6 @@
 import pygame
 from ..utils.settings import WIDTH, HEIGHT
+from .text_cache import render_text
 
 
 # debug_renderer.py
@@ -95,5 +96,27 @@ class DebugRenderer:
 
         # Draw value text
         text = f"Connection Distance: {debug_settings.connection_distance_multiplier:.1f}"
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = render_text(self.font, text, True, (255, 255, 255))
         surface.blit(text_surface, (self.slider_rect.right + 10, self.slider_rect.centery - 10))
+
+    def draw_search_stats(self, surface, stats):
+        """Draw the statistics of the last AI search in the top-left corner"""
+        y = 10
+        for line in stats.summary_lines():
+            text_surface = render_text(self.font, line, True, (255, 255, 255))
+            background = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
+            background.fill((0, 0, 0, 160))
+            surface.blit(background, (10, y))
+            surface.blit(text_surface, (10, y))
+            y += text_surface.get_height() + 4
+
+    def draw_frame_stats(self, surface, lines):
+        """Draw the frame-time statistics of the main loop above the slider"""
+        y = self.slider_rect.y - 10
+        for line in reversed(lines):
+            text_surface = render_text(self.font, line, True, (255, 255, 255))
+            y -= text_surface.get_height() + 4
+            background = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
+            background.fill((0, 0, 0, 160))
+            surface.blit(background, (10, y))
+            surface.blit(text_surface, (10, y))
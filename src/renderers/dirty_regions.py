@@ -0,0 +1,39 @@
+import pygame
+from ..utils.settings import WIDTH, HEIGHT
+
+SCREEN_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+
+class DirtyRegions:
+    """
+    Tracks which parts of the window changed since the last frame pushed to the display.
+
+    Every frame each component reports a region as (name, rect, key), where the key is a
+    value that changes whenever the component would draw different pixels. A region whose
+    key changed is dirty over both its old and its new rect, so whatever it drew before
+    gets erased. When the set of regions changes (menu and game screen) or the window has
+    to be repainted, the whole screen is dirty.
+    """
+
+    def __init__(self):
+        self.regions = None  # name -> (rect, key) of the last frame pushed
+
+    def invalidate(self):
+        """Push the whole screen with the next frame."""
+        self.regions = None
+
+    def changed(self, regions):
+        """Rects that need to go to the display for this frame; empty when nothing changed."""
+        previous = self.regions
+        self.regions = {name: (rect, key) for name, rect, key in regions}
+        if previous is None or previous.keys() != self.regions.keys():
+            return [SCREEN_RECT]
+
+        dirty = []
+        for name, (rect, key) in self.regions.items():
+            old_rect, old_key = previous[name]
+            if key != old_key:
+                dirty.append(rect)
+                if old_rect != rect:
+                    dirty.append(old_rect)
+        return dirty
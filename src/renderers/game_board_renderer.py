@@ -6,6 +6,7 @@ from ..utils.settings import (
     CENTER_CLICK_RADIUS,
 )
 from ..utils.circle_classes import SmallCircle, MediumCircle, LargeCircle
+from .sprite_cache import SpriteCache, box_blur
 
 
 class GameBoardRenderer:
@@ -14,13 +15,28 @@ class GameBoardRenderer:
         self.CENTER_COLOR = (150, 150, 150)
         self.SELECTED_COLOR = (64, 144, 96)  # New color #409060
 
-        # Cache for guide surfaces and current turn
+        # Guide surfaces for both turns, keyed by (turn, radius, is_selected)
         self.guide_cache = {}
-        self.current_turn = None
         self.selected_move = None
-        self._initialize_guide_cache("red")
+        self.sprite_cache = SpriteCache.shared()
+        for turn in ("red", "blue"):
+            self._initialize_guide_cache(turn)
+
+    def _guide_color(self, turn, is_selected):
+        if is_selected:
+            return self.SELECTED_COLOR
+        return (255, 0, 0) if turn == "red" else (0, 0, 255)
 
     def _create_guide_surface(self, guide_radius, turn, is_selected=False):
+        """Get the guide surface for a radius and color from the sprite cache"""
+        guide_color = self._guide_color(turn, is_selected)
+        surface = self.sprite_cache.get(
+            "guide", (guide_radius, guide_color), self._render_guide_surface
+        )
+        return surface, surface.get_width() // 2
+
+    @staticmethod
+    def _render_guide_surface(guide_radius, guide_color):
         """Create a guide surface with a proper radial gradient"""
         # Size of surface (add some padding for blur)
         padding = guide_radius // 2
@@ -30,12 +46,6 @@ class GameBoardRenderer:
         surface = pygame.Surface((size, size), pygame.SRCALPHA)
         center = (size // 2, size // 2)
 
-        # Set color based on turn and selection state
-        if is_selected:
-            guide_color = self.SELECTED_COLOR
-        else:
-            guide_color = (255, 0, 0) if turn == "red" else (0, 0, 255)
-
         # Create gradient by drawing concentric circles from outside in
         steps = 30
         for i in range(steps):
@@ -46,65 +56,23 @@ class GameBoardRenderer:
             pygame.draw.circle(surface, (*guide_color, alpha), center, current_radius)
 
         # Apply a final blur for smoothness
-        final_surface = self._gaussian_blur(surface, guide_radius // 8)
-
-        return final_surface, size // 2
-
-    def _gaussian_blur(self, surface, blur_amount):
-        """Apply gaussian blur effect"""
+        blur_amount = guide_radius // 8
         if blur_amount <= 0:
             return surface
-
-        size = surface.get_size()
-        blur_surface = pygame.Surface(size, pygame.SRCALPHA)
-
-        kernel_size = max(1, blur_amount // 2)
-
-        for x in range(kernel_size, size[0] - kernel_size):
-            for y in range(kernel_size, size[1] - kernel_size):
-                r, g, b, a = 0, 0, 0, 0
-                count = 0
-
-                for dx in range(-kernel_size, kernel_size + 1):
-                    for dy in range(-kernel_size, kernel_size + 1):
-                        px = x + dx
-                        py = y + dy
-                        if 0 <= px < size[0] and 0 <= py < size[1]:
-                            color = surface.get_at((px, py))
-                            r += color[0]
-                            g += color[1]
-                            b += color[2]
-                            a += color[3]
-                            count += 1
-
-                if count > 0:
-                    blur_surface.set_at((x, y), (r // count, g // count, b // count, a // count))
-
-        return blur_surface
+        return box_blur(surface, max(1, blur_amount // 2))
 
     def _initialize_guide_cache(self, turn):
-        """Pre-render guide surfaces for different sizes"""
-        self.current_turn = turn
-        self.guide_cache.clear()
-
+        """Load or pre-render the guide surfaces of a turn for different sizes"""
         # Create both selected and unselected versions for each size
         for radius in [CIRCLE_SMALL_RADIUS, CIRCLE_MEDIUM_RADIUS, CIRCLE_LARGE_RADIUS]:
             guide_radius = int(radius * 0.3) if radius != CIRCLE_SMALL_RADIUS else int(radius * 0.7)
-
-            # Unselected surface
-            unselected_surface, half_size = self._create_guide_surface(guide_radius, turn, False)
-            self.guide_cache[(radius, False)] = (unselected_surface, half_size)
-
-            # Selected surface
-            selected_surface, half_size = self._create_guide_surface(guide_radius, turn, True)
-            self.guide_cache[(radius, True)] = (selected_surface, half_size)
+            for is_selected in (False, True):
+                self.guide_cache[(turn, radius, is_selected)] = self._create_guide_surface(
+                    guide_radius, turn, is_selected
+                )
 
     def draw_valid_moves(self, surface, valid_moves, turn):
         """Draw guide indicators for valid moves"""
-        # Reinitialize cache if turn has changed
-        if turn != self.current_turn:
-            self._initialize_guide_cache(turn)
-
         for move in valid_moves:
             if hasattr(move, "pos"):
                 # Determine the guide radius based on move type
@@ -125,12 +93,11 @@ class GameBoardRenderer:
                 )
 
                 # Get the appropriate guide surface
-                cache_key = (radius, is_selected)
+                cache_key = (turn, radius, is_selected)
                 if cache_key not in self.guide_cache:
-                    guide_surface, half_size = self._create_guide_surface(
+                    self.guide_cache[cache_key] = self._create_guide_surface(
                         guide_radius, turn, is_selected
                     )
-                    self.guide_cache[cache_key] = (guide_surface, half_size)
 
                 guide_surface, half_size = self.guide_cache[cache_key]
                 pos = (int(move.pos[0] - half_size) + 1, int(move.pos[1] - half_size) + 1)
@@ -1,6 +1,8 @@
+from .board_layers import BoardLayers
 from .circle_renderer import CircleRenderer
 from .ui_renderer import UIRenderer
 from .game_board_renderer import GameBoardRenderer
+from .dirty_regions import SCREEN_RECT
 from ..utils.settings import DRAW_CONNECTIONS, DRAW_TURN_AND_PHASE, DRAW_SCORES
 
 
@@ -8,9 +10,12 @@ class GameRenderer:
     def __init__(self, font, original_ui):
         self.original_ui = original_ui
         self.circle_renderer = CircleRenderer()
+        self.board_layers = BoardLayers(self.circle_renderer)
         self.ui_renderer = UIRenderer(font)
         self.board_renderer = GameBoardRenderer()
         self.background_color = (0, 0, 0)  # Black background
+        self.animation_frame = 0
+        self._rest_bounds = (None, None)  # Circle system, rect of its board at rest
 
     def draw_training_stats(self, surface, training_stats):
         """
@@ -22,6 +27,58 @@ class GameRenderer:
         """
         self.ui_renderer.draw_training_stats(surface, training_stats)
 
+    def board_region(self, circle_system):
+        """
+        Dirty region of the board: (rect, key).
+
+        The rect covers every circle at rest plus wherever the moving circles are now, so
+        the frames of an animation update the area the circles leave and enter. The winner
+        overlay and the optional text overlays draw over the whole screen.
+        """
+        moving = circle_system.animation_handler.moving_circles()
+        if moving:
+            # Circles are somewhere else every frame of an animation
+            self.animation_frame += 1
+        winner = circle_system.get_winner()
+        key = (
+            circle_system,
+            circle_system.board_version,
+            circle_system.game_state.turn,
+            circle_system.game_state.phase,
+            circle_system.game_state.ai_thinking,
+            circle_system.board_renderer.selected_move,
+            winner,
+            self.animation_frame if moving else None,
+        )
+
+        if winner or DRAW_CONNECTIONS or DRAW_TURN_AND_PHASE or DRAW_SCORES:
+            return SCREEN_RECT, key
+        rect = self._board_bounds(circle_system)
+        for circle_size, circles in (
+            ("medium", circle_system.medium_circles),
+            ("small", circle_system.small_circles),
+        ):
+            moved = self.circle_renderer.bounds([c for c in circles if c in moving], circle_size)
+            if moved:
+                rect = rect.union(moved)
+        return rect, key
+
+    def _board_bounds(self, circle_system):
+        """Rect of all circles at rest; rotations only ever move circles between slots."""
+        system, rect = self._rest_bounds
+        if system is not circle_system:
+            rects = [
+                self.circle_renderer.bounds(circles, circle_size)
+                for circle_size, circles in (
+                    ("large", circle_system.large_circles),
+                    ("medium", circle_system.medium_circles),
+                    ("small", circle_system.small_circles),
+                )
+            ]
+            rect = rects[0].unionall(rects[1:]).clip(SCREEN_RECT)
+            self._rest_bounds = (circle_system, rect)
+        return rect
+
     def draw(self, surface, circle_system):
         """Main draw method that orchestrates all rendering."""
         surface.fill(self.background_color)
@@ -35,9 +92,7 @@ class GameRenderer:
             )
 
         # Draw circles
-        self.circle_renderer.draw_large_circles(surface, circle_system.circle_manager)
-        self.circle_renderer.draw_medium_circles(surface, circle_system.medium_circles)
-        self.circle_renderer.draw_small_circles(surface, circle_system.small_circles)
+        self.board_layers.draw(surface, circle_system)
 
         # Draw game state elements
         valid_moves = circle_system.move_handler.get_valid_moves()
@@ -49,7 +104,7 @@ class GameRenderer:
         if DRAW_TURN_AND_PHASE:
             self.ui_renderer.draw_turn_and_phase(surface, circle_system.game_state)
         if DRAW_SCORES:
-            self.ui_renderer.draw_scores(surface, circle_system.small_circles)
+            self.ui_renderer.draw_scores(surface, circle_system.board_stats)
 
         # Draw winner screen if game is over
         winner = circle_system.get_winner()
@@ -1,6 +1,7 @@
 import pygame
 import pygame.gfxdraw
 from typing import List, Tuple
+from .text_cache import render_text
 
 
 class Button:
@@ -36,6 +37,11 @@ class Button:
 
         self.rect = pygame.Rect(x, y, width, height)
 
+    def dirty_region(self):
+        """The button with its shadow, keyed by everything that changes its look"""
+        rect = pygame.Rect(self.x, self.y, self.width + 4, self.height + 4)
+        return f"button:{self.text}", rect, (self.is_pressed, self.is_active, self.current_color)
+
     def draw(self, screen: pygame.Surface):
         # Button shadow effect
         shadow_offset = 4 if not self.is_pressed else 2
@@ -71,100 +77,13 @@ class Button:
         )
 
         # Text
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(
             center=(button_pos[0] + self.width // 2, button_pos[1] + self.height // 2)
         )
         screen.blit(text_surface, text_rect)
 
 
-class ScoreBoard:
-    def __init__(self, x: int, y: int, width: int = 120, height: int = 160):
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-        self.font = pygame.font.SysFont("times", 12)
-
-        # Color schemes matching CircleRenderer
-        self.COLORS = {
-            "neutral": {
-                "small": self._hex_to_rgb("0xe0e0e0"),
-                "medium": self._hex_to_rgb("0xa0a0b0"),
-                "large": self._hex_to_rgb("0x7070a0"),
-            },
-            "red": {
-                "small": self._hex_to_rgb("0xe01010"),
-                "medium": self._hex_to_rgb("0xc01010"),
-                "large": self._hex_to_rgb("0xa01010"),
-            },
-            "blue": {
-                "small": self._hex_to_rgb("0x1010e0"),
-                "medium": self._hex_to_rgb("0x1010c0"),
-                "large": self._hex_to_rgb("0x1010a0"),
-            },
-        }
-
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex color string to RGB tuple"""
-        hex_color = hex_color.replace("0x", "")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-    def calculate_stats(self, circle_manager):
-        # Count small circles with correct color values
-        small_red = sum(
-            1
-            for circle in circle_manager.small_circles
-            if circle.color == self.COLORS["red"]["small"]
-        )
-        small_blue = sum(
-            1
-            for circle in circle_manager.small_circles
-            if circle.color == self.COLORS["blue"]["small"]
-        )
-
-        # Count medium circles
-        medium_red = sum(
-            1
-            for circle in circle_manager.medium_circles
-            if circle.color == self.COLORS["red"]["medium"]
-        )
-        medium_blue = sum(
-            1
-            for circle in circle_manager.medium_circles
-            if circle.color == self.COLORS["blue"]["medium"]
-        )
-
-        # Count large circles
-        large_red = sum(
-            1
-            for circle in circle_manager.large_circles
-            if circle.color == self.COLORS["red"]["large"]
-        )
-        large_blue = sum(
-            1
-            for circle in circle_manager.large_circles
-            if circle.color == self.COLORS["blue"]["large"]
-        )
-
-        # Calculate totals
-        total_red = small_red + medium_red + large_red
-        total_blue = small_blue + medium_blue + large_blue
-
-        # Calculate percentages (based on small circles as they represent board coverage)
-        total_small_circles = len(circle_manager.small_circles)
-        red_percentage = (small_red / total_small_circles * 100) if total_small_circles > 0 else 0
-        blue_percentage = (small_blue / total_small_circles * 100) if total_small_circles > 0 else 0
-
-        return {
-            "small": (small_red, small_blue),
-            "medium": (medium_red, medium_blue),
-            "large": (large_red, large_blue),
-            "total": (total_red, total_blue),
-            "percentage": (red_percentage, blue_percentage),
-        }
-
-
 class ScoreBoard:
     def __init__(self, x: int, y: int, width: int = 120, height: int = 160):
         self.x = x
@@ -180,51 +99,17 @@ class ScoreBoard:
             "blue": [0, 0, 255],  # Pure Blue
         }
 
+    def dirty_region(self, circle_manager=None):
+        stats = self.calculate_stats(circle_manager) if circle_manager else None
+        key = tuple(stats.items()) if stats else None
+        return "scoreboard", pygame.Rect(self.x, self.y, self.width, 6 * 20), key
+
     def calculate_stats(self, circle_manager):
         if not circle_manager:
             print("Debug: circle_manager is None")
             return None
 
-        # Count small circles
-        small_red = sum(
-            1 for circle in circle_manager.small_circles if circle.color == self.COLORS["red"]
-        )
-        small_blue = sum(
-            1 for circle in circle_manager.small_circles if circle.color == self.COLORS["blue"]
-        )
-
-        # Count medium circles
-        medium_red = sum(
-            1 for circle in circle_manager.medium_circles if circle.color == self.COLORS["red"]
-        )
-        medium_blue = sum(
-            1 for circle in circle_manager.medium_circles if circle.color == self.COLORS["blue"]
-        )
-
-        # Count large circles
-        large_red = sum(
-            1 for circle in circle_manager.large_circles if circle.color == self.COLORS["red"]
-        )
-        large_blue = sum(
-            1 for circle in circle_manager.large_circles if circle.color == self.COLORS["blue"]
-        )
-
-        # Calculate totals
-        total_red = small_red + medium_red + large_red
-        total_blue = small_blue + medium_blue + large_blue
-
-        # Calculate percentages
-        total_small_circles = len(circle_manager.small_circles)
-        red_percentage = (small_red / total_small_circles * 100) if total_small_circles > 0 else 0
-        blue_percentage = (small_blue / total_small_circles * 100) if total_small_circles > 0 else 0
-
-        return {
-            "small": (small_red, small_blue),
-            "medium": (medium_red, medium_blue),
-            "large": (large_red, large_blue),
-            "total": (total_red, total_blue),
-            "percentage": (red_percentage, blue_percentage),
-        }
+        return circle_manager.stats.to_dict()
 
     def draw(self, screen, circle_manager=None):
         cell_width = self.width // 4
@@ -237,7 +122,7 @@ class ScoreBoard:
         for col, (header, color) in enumerate(zip(headers, header_colors)):
             x_pos = self.x + (col + 2) * cell_width  # Position in the last two columns
             pygame.draw.rect(screen, color, pygame.Rect(x_pos, self.y, cell_width, cell_height))
-            text = self.font.render(header, True, (255, 255, 255))
+            text = render_text(self.font, header, True, (255, 255, 255))
             text_rect = text.get_rect(center=(x_pos + cell_width // 2, self.y + cell_height // 2))
             screen.blit(text, text_rect)
 
@@ -261,7 +146,7 @@ class ScoreBoard:
                 pygame.draw.rect(
                     screen, (64, 64, 64), pygame.Rect(self.x, y_pos, cell_width, cell_height)
                 )
-                text = self.font.render(label, True, (255, 255, 255))
+                text = render_text(self.font, label, True, (255, 255, 255))
                 text_rect = text.get_rect(
                     center=(self.x + cell_width // 2, y_pos + cell_height // 2)
                 )
@@ -274,7 +159,7 @@ class ScoreBoard:
                     (64, 64, 64),
                     pygame.Rect(self.x + cell_width, y_pos, cell_width, cell_height),
                 )
-                text = self.font.render(number, True, (255, 255, 255))
+                text = render_text(self.font, number, True, (255, 255, 255))
                 text_rect = text.get_rect(
                     center=(self.x + cell_width * 1.5, y_pos + cell_height // 2)
                 )
@@ -298,9 +183,9 @@ class ScoreBoard:
 
                 # Format the number based on whether it's a percentage
                 if row == 4:  # Last row (percentage row)
-                    text = self.font.render(f"{int(count)}%", True, (255, 255, 255))
+                    text = render_text(self.font, f"{int(count)}%", True, (255, 255, 255))
                 else:
-                    text = self.font.render(str(count), True, (255, 255, 255))
+                    text = render_text(self.font, str(count), True, (255, 255, 255))
                 text_rect = text.get_rect(
                     center=(x_pos + cell_width // 2, y_pos + cell_height // 2)
                 )
@@ -324,7 +209,7 @@ class MoveRegister:
             pygame.draw.rect(
                 screen, (80, 80, 80), pygame.Rect(self.x + col * cell_width, self.y, cell_width, 20)
             )
-            text = self.font.render(header, True, (255, 255, 255))
+            text = render_text(self.font, header, True, (255, 255, 255))
             screen.blit(text, (self.x + col * cell_width + 5, self.y + 5))
 
         # Draw cells
@@ -381,16 +266,32 @@ class GameUI:
             Button("Next", width - 50, height - 240, 40, 20),  # Above move register
         ]
 
+    def dirty_regions(self):
+        """
+        (name, rect, key) of the parts of the panel that can change between frames.
+
+        The title, version and move register never change, so they only go to the display
+        with full-screen updates.
+        """
+        circle_system = self.game_controller.systems.get("circle")
+        regions = [("status", pygame.Rect(10, 600 - 103, 200, 98), self._phase_text())]
+        regions.extend(button.dirty_region() for button in self.buttons)
+        regions.append(
+            self.scoreboard.dirty_region(circle_system.circle_manager if circle_system else None)
+        )
+        return regions
+
+    def _phase_text(self):
+        if self.game_controller.systems.get("circle"):
+            return f"Phase: {self.game_controller.systems['circle'].game_state.phase}"
+        return "Phase: N/A"
+
     def draw_status_boxes(self):
         # Top status box (smaller and narrower)
         pygame.draw.rect(self.screen, (64, 64, 64), pygame.Rect(13, 600 - 103, 100, 25))
         pygame.draw.rect(self.screen, (192, 192, 192), pygame.Rect(13, 600 - 103, 100, 25), 1)
-        if "circle" in self.game_controller.systems:
-            phase = self.game_controller.systems["circle"].game_state.phase
-            phase_text = f"Phase: {phase}"
-        else:
-            phase_text = "Phase: N/A"
-        status_text = self.status_font.render(phase_text, True, (0, 0, 0))
+        phase_text = self._phase_text()
+        status_text = render_text(self.status_font, phase_text, True, (0, 0, 0))
 
         self.screen.blit(status_text, (16, 600 - 95))
 
@@ -403,11 +304,11 @@ class GameUI:
         self.screen.fill((0, 0, 0))
 
         # Draw title
-        title_surface = self.title_font.render("The Ring World", True, (0, 128, 255))
+        title_surface = render_text(self.title_font, "The Ring World", True, (0, 128, 255))
         self.screen.blit(title_surface, (20, 20))
 
         # Draw version more to the right
-        version_surface = self.version_font.render("Version 1.37", True, (0, 128, 255))
+        version_surface = render_text(self.version_font, "Version 1.37", True, (0, 128, 255))
         self.screen.blit(version_surface, (40, 45))  # Moved right
 
         # Draw status boxes
@@ -1,5 +1,6 @@
 import pygame
 from ..utils.settings import WIDTH
+from .text_cache import render_text
 
 
 class SaveLoadUI:
@@ -17,20 +18,20 @@ class SaveLoadUI:
         """Draw save/load UI elements"""
         # Draw save button
         pygame.draw.rect(surface, (200, 200, 200), self.save_button)
-        save_text = self.button_font.render("Save", True, (0, 0, 0))
+        save_text = render_text(self.button_font, "Save", True, (0, 0, 0))
         save_text_rect = save_text.get_rect(center=self.save_button.center)
         surface.blit(save_text, save_text_rect)
 
         # Draw load button
         pygame.draw.rect(surface, (200, 200, 200), self.load_button)
-        load_text = self.button_font.render("Load", True, (0, 0, 0))
+        load_text = render_text(self.button_font, "Load", True, (0, 0, 0))
         load_text_rect = load_text.get_rect(center=self.load_button.center)
         surface.blit(load_text, load_text_rect)
 
         # Draw save feedback if active
         current_time = pygame.time.get_ticks()
         if current_time < self.save_feedback_time + self.save_feedback_duration:
-            feedback = self.button_font.render("Game Saved!", True, (0, 150, 0))
+            feedback = render_text(self.button_font, "Game Saved!", True, (0, 150, 0))
             feedback_rect = feedback.get_rect(center=(WIDTH - 90, 110))
             surface.blit(feedback, feedback_rect)
 
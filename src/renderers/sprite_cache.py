@@ -0,0 +1,154 @@
+import os
+import pygame
+from ..utils.settings import SPRITE_CACHE_DIR
+
+# Bump when a sprite generator changes, so stale files on disk are not reused
+SPRITE_VERSION = 1
+
+
+class SpriteCache:
+    """
+    Static sprites rendered once and kept on disk.
+
+    A sprite is identified by a name and the parameters it is generated from; the file name
+    is built from both, so changing a radius or color produces a new file instead of
+    reusing an old one. Sprites are converted to the display format when one is set.
+    """
+
+    _shared = {}
+
+    def __init__(self, directory=SPRITE_CACHE_DIR):
+        self.directory = directory
+        self.sprites = {}
+
+    @classmethod
+    def shared(cls, directory=SPRITE_CACHE_DIR) -> "SpriteCache":
+        """Get the cache for a directory, so every renderer loads a sprite only once."""
+        if directory not in cls._shared:
+            cls._shared[directory] = cls(directory)
+        return cls._shared[directory]
+
+    def get(self, name, params, build):
+        """Sprite for (name, params); build(*params) renders it when it is not on disk."""
+        key = (name, params)
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            return sprite
+
+        path = self._path(name, params)
+        sprite = None
+        if os.path.exists(path):
+            try:
+                sprite = pygame.image.load(path)
+            except pygame.error:
+                sprite = None
+        if sprite is None:
+            sprite = build(*params)
+            self._save(sprite, path)
+
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        self.sprites[key] = sprite
+        return sprite
+
+    def _path(self, name, params):
+        parts = [name, f"v{SPRITE_VERSION}"]
+        for param in params:
+            if isinstance(param, (tuple, list)):
+                parts.append("_".join(str(value) for value in param))
+            else:
+                parts.append(str(param))
+        return os.path.join(self.directory, "-".join(parts) + ".png")
+
+    def _save(self, sprite, path):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            pygame.image.save(sprite, path)
+        except (OSError, pygame.error) as e:
+            print(f"Could not cache sprite {path}: {e}")
+
+
+def render_disk(radius, color, alpha):
+    """Filled circle of radius with one pixel of margin, as used for every circle tier."""
+    size = (radius * 2 + 2, radius * 2 + 2)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius + 1, radius + 1), radius)
+    return surface
+
+
+def box_blur(surface, kernel_size):
+    """
+    Average every pixel over the (2k+1)^2 window around it, channels including alpha.
+
+    Pixels closer than kernel_size to the border stay transparent. Works on the pixel
+    arrays with summed-area tables instead of per-pixel get_at/set_at calls, on NumPy
+    arrays when NumPy is installed and on the raw RGBA bytes otherwise.
+    """
+    width, height = surface.get_size()
+    if width <= 2 * kernel_size or height <= 2 * kernel_size:
+        return pygame.Surface((width, height), pygame.SRCALPHA)
+    try:
+        import numpy as np
+    except ImportError:  # The web build may ship without NumPy
+        return _box_blur_bytes(surface, kernel_size)
+
+    blurred = pygame.Surface((width, height), pygame.SRCALPHA)
+    channels = np.empty((width, height, 4), dtype=np.int64)
+    channels[..., :3] = pygame.surfarray.pixels3d(surface)
+    channels[..., 3] = pygame.surfarray.pixels_alpha(surface)
+
+    window = 2 * kernel_size + 1
+    table = np.zeros((width + 1, height + 1, 4), dtype=np.int64)
+    table[1:, 1:] = channels.cumsum(axis=0).cumsum(axis=1)
+    sums = (
+        table[window:, window:]
+        - table[:-window, window:]
+        - table[window:, :-window]
+        + table[:-window, :-window]
+    )
+    averages = sums // (window * window)
+
+    inner = slice(kernel_size, width - kernel_size), slice(kernel_size, height - kernel_size)
+    rgb = pygame.surfarray.pixels3d(blurred)
+    alpha = pygame.surfarray.pixels_alpha(blurred)
+    rgb[inner] = averages[..., :3]
+    alpha[inner] = averages[..., 3]
+    del rgb, alpha  # Release the surface locks
+    return blurred
+
+
+def _box_blur_bytes(surface, kernel_size):
+    """box_blur without NumPy: the same summed-area table over the surface's RGBA bytes."""
+    width, height = surface.get_size()
+    pixels = pygame.image.tobytes(surface, "RGBA")
+    row = (width + 1) * 4
+    # table[(y * (width + 1) + x) * 4 + c]: sum of channel c over the pixels above and left
+    table = [0] * (row * (height + 1))
+    for y in range(height):
+        sums = [0, 0, 0, 0]
+        source = y * width * 4
+        above = y * row + 4
+        target = above + row
+        for offset in range(width * 4):
+            channel = offset & 3
+            sums[channel] += pixels[source + offset]
+            table[target + offset] = table[above + offset] + sums[channel]
+
+    window = 2 * kernel_size + 1
+    area = window * window
+    blurred = bytearray(width * height * 4)
+    for y in range(kernel_size, height - kernel_size):
+        top = (y - kernel_size) * row
+        bottom = top + window * row
+        target = (y * width + kernel_size) * 4
+        for left in range(0, (width - 2 * kernel_size) * 4, 4):
+            right = left + window * 4
+            for channel in range(4):
+                blurred[target + channel] = (
+                    table[bottom + right + channel]
+                    - table[top + right + channel]
+                    - table[bottom + left + channel]
+                    + table[top + left + channel]
+                ) // area
+            target += 4
+    return pygame.image.frombytes(bytes(blurred), (width, height), "RGBA")
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from typing import Optional
+import pygame
+from ..utils.settings import TEXT_CACHE_ENTRIES
+
+
+class TextCache:
+    """
+    Rendered text surfaces, reused while the font, text and colors stay the same.
+
+    Labels and numbers of the UI rarely change between frames, so every renderer goes
+    through one shared LRU instead of calling font.render each frame. The surfaces are
+    shared, so callers must copy one before drawing on it.
+    """
+
+    _shared: Optional["TextCache"] = None
+
+    def __init__(self, max_entries=TEXT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "TextCache":
+        """Get the cache every renderer shares."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def render(self, font, text, antialias, color, background=None) -> pygame.Surface:
+        """Same as font.render(text, antialias, color, background), from the cache."""
+        key = (
+            font,
+            text,
+            antialias,
+            tuple(color),
+            tuple(background) if background is not None else None,
+        )
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+def render_text(font, text, antialias, color, background=None) -> pygame.Surface:
+    """Render text through the shared cache."""
+    return TextCache.shared().render(font, text, antialias, color, background)
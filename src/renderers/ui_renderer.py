@@ -1,5 +1,6 @@
 import pygame
 from ..utils.settings import WIDTH, HEIGHT, WHITE, BLUE, RED
+from .text_cache import render_text
 
 
 class UIRenderer:
@@ -41,11 +42,9 @@ class UIRenderer:
         if hasattr(game_state, "ai_thinking") and game_state.ai_thinking:
             self._draw_text(surface, "Thinking...", (10, HEIGHT - 50))
 
-    def draw_scores(self, surface, small_circles):
+    def draw_scores(self, surface, board_stats):
         """Draw the score counters for both players."""
-        # Count circles by color
-        blue_count = sum(1 for circle in small_circles if circle.color == BLUE)
-        red_count = sum(1 for circle in small_circles if circle.color == RED)
+        red_count, blue_count = board_stats.small
 
         # Draw scores with appropriate colors
         self._draw_text(surface, f"Blue: {blue_count}", (10, 130), BLUE)
@@ -68,7 +67,7 @@ class UIRenderer:
 
         # Create winner text
         winner_text = f"{winner.capitalize()} Wins!"
-        winner_surface = self.font.render(winner_text, True, (255, 255, 255))
+        winner_surface = render_text(self.font, winner_text, True, (255, 255, 255))
         text_rect = winner_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
         surface.blit(winner_surface, text_rect)
 
@@ -90,8 +89,8 @@ class UIRenderer:
             return
 
         # Draw speed state button using the actual state
-        # speed_state = training_stats.get("speed_state", "normal")
-        # self.draw_fast_forward_button(surface, speed_state)
+        speed_state = training_stats.get("speed_state", "normal")
+        self.draw_fast_forward_button(surface, speed_state)
 
         # Draw games played counter
         # games_played = training_stats.get("games_played", 0)
@@ -109,7 +108,7 @@ class UIRenderer:
         pygame.draw.rect(surface, (100, 100, 100), button_rect, 2)  # Border
 
         # Draw button text
-        text_surface = self.font.render(text, True, (0, 0, 0))
+        text_surface = render_text(self.font, text, True, (0, 0, 0))
         text_rect = text_surface.get_rect(center=button_rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -117,8 +116,7 @@ class UIRenderer:
 
     def draw_fast_forward_button(self, surface, state):
         """Draw the speed control button with current state."""
-        # Define button dimensions
-        button_rect = pygame.Rect(WIDTH - 60, 10, 50, 50)
+        button_rect = self.get_button_rect()
 
         # Get current state settings or default to normal
         current_state = state if isinstance(state, str) else "normal"
@@ -129,7 +127,7 @@ class UIRenderer:
 
     def _draw_text(self, surface, text, position, color=(255, 255, 255)):
         """Helper method to draw text on the surface."""
-        text_surface = self.font.render(text, True, color)
+        text_surface = render_text(self.font, text, True, color)
         surface.blit(text_surface, position)
 
     def _draw_button(self, surface, button_rect, settings):
@@ -141,10 +139,11 @@ class UIRenderer:
         pygame.draw.rect(surface, (0, 0, 0), button_rect, 2)
 
         # Draw button symbol
-        ff_text = self.ff_font.render(settings["symbol"], True, settings["text_color"])
+        ff_text = render_text(self.ff_font, settings["symbol"], True, settings["text_color"])
         ff_rect = ff_text.get_rect(center=button_rect.center)
         surface.blit(ff_text, ff_rect)
 
     def get_button_rect(self):
         """Get the rectangle defining the fast forward button's position and size."""
-        return pygame.Rect(WIDTH - 60, 10, 50, 50)
+        # Below the Quit button, clear of the scoreboard in the top right corner
+        return pygame.Rect(WIDTH - 55, 270, 50, 50)
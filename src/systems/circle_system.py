@@ -5,6 +5,7 @@ from ..managers.color.color_manager import GameColorManager
 from ..managers.connection_manager import ConnectionManager
 from ..managers.render_manager import RenderManager
 from ..managers.save_load_manager import SaveLoadManager
+from ..utils.clock import SimulationClock
 from ..utils.game_state import GameState
 from ..handlers.event_handler import EventHandler
 from ..handlers.move_handler import MoveHandler
@@ -22,8 +23,12 @@ class CircleSystem:
         event_handler: EventHandler = None,
         screen=None,
         reduced_version=False,
+        clock: SimulationClock = None,
     ):
         print("Initializing circle system", reduced_version)
+        # Animations, AI thinking delays and the reset timer all read this clock
+        self.clock = clock or SimulationClock.shared()
+
         # Initialize managers
         self.circle_manager = CircleManager(reduced_version)
         self.connection_manager = ConnectionManager()
@@ -40,20 +45,25 @@ class CircleSystem:
         # Initialize handlers
         self.event_handler = event_handler
         self.move_handler = MoveHandler(self)
-        self.animation_handler = AnimationHandler(self, rotation_duration)
+        self.animation_handler = AnimationHandler(self, rotation_duration, self.clock)
         self.turn_handler = TurnHandler(self)
 
         # Initialize font
         font.init()
         self.font = pygame.font.Font(None, FONT_SIZE)
 
+        # Board version, bumped whenever a move, load, reset or debug change alters the board.
+        # Derived state is only recomputed when the version moves on.
+        self.board_version = 0
+        self._settled_version = -1
+        self._winner_version = -1
+        self._winner = None
+
         # Initialize system
         self._initialize_system()
 
         self.reset_delay = RESET_GAME_DELAY
         self.winner_time = None
-        self.last_update_time = 0
-        self.connection_update_interval = 1000
 
     def reset_game(self):
         """Reset the game state and board."""
@@ -66,6 +76,10 @@ class CircleSystem:
 
         self.update_adjacent_connections()
 
+    def mark_board_changed(self):
+        """Invalidate state derived from the board (medium colors, winner, valid moves)."""
+        self.board_version += 1
+
     def _initialize_system(self):
         """Initialize the circle system components."""
         self.circle_manager._initialize_system()  # This will initialize large circles, medium circles, and small circles
@@ -89,6 +103,10 @@ class CircleSystem:
     def small_circles(self):
         return self.circle_manager.small_circles
 
+    @property
+    def board_stats(self):
+        return self.circle_manager.stats
+
     @property
     def adjacent_connections(self):
         return self.connection_manager.adjacent_connections
@@ -105,16 +123,13 @@ class CircleSystem:
     def center_rotation_start(self):
         return self.animation_handler.center_rotation_start
 
-    @property
-    def center_initial_angles(self):
-        return self.animation_handler.center_initial_angles
-
     def update_adjacent_connections(self):
         """Update the connections between adjacent circles."""
         if self.debug_settings:
             multiplier = self.debug_settings.connection_distance_multiplier
             self.connection_manager.update_connection_distances(multiplier)
             self.connection_manager.update_adjacent_connections(self.small_circles)
+            self.mark_board_changed()
         else:
             print("Warning: No debug settings available in CircleSystem")
 
@@ -144,30 +159,36 @@ class CircleSystem:
 
         # Update animations
         self.animation_handler.update()
+        self.settle_board()
 
-        # Update circle colors if not animating
-        if not self.is_any_circle_animating():
-            # Update colors for all circles
+    def settle_board(self):
+        """Finish a board change once nothing animates any more."""
+        # Settle medium colors once the board has changed and stopped animating
+        if self._settled_version != self.board_version and not self.is_any_circle_animating():
             self.circle_manager.update_medium_circle_colors()
+            self.mark_board_changed()
+            self._settled_version = self.board_version
 
-            # Update connections periodically
-            current_time = pygame.time.get_ticks()
-            if current_time - self.last_update_time >= self.connection_update_interval:
-                self.update_adjacent_connections()
-                self.last_update_time = current_time
+        # A player with nowhere to place goes straight to the rotation phase
+        self.move_handler.skip_blocked_placement()
 
     def get_winner(self):
         """Get the current winner if any and track the win time."""
         if self.game_state.winner:
             return self.game_state.winner
 
-        winner = self.turn_handler.get_winner()
+        if self._winner_version != self.board_version:
+            self._winner = self.turn_handler.get_winner()
+            self._winner_version = self.board_version
+        winner = self._winner
         if winner and self.winner_time is None:
-            self.winner_time = pygame.time.get_ticks()
+            self.winner_time = self.clock.ticks()
         return winner
 
-    def should_reset(self, current_time):
+    def should_reset(self, current_time=None):
         """Check if enough time has passed since win to reset."""
+        if current_time is None:
+            current_time = self.clock.ticks()
         if self.winner_time and current_time - self.winner_time >= self.reset_delay:
             return True
         return False
@@ -1,7 +1,8 @@
 import pygame
 from ..utils.settings import GameMode
-from ..managers.network.network_manager import GameNetworkManager
 from ..utils.settings import RED
+from ..ai.ai_backend import warm_up
+from ..renderers.text_cache import render_text
 
 
 class MenuSystem:
@@ -13,7 +14,6 @@ class MenuSystem:
         self.mode = GameMode.MENU
         self.room_code = ""
         self.input_active = False
-        self.network_manager = GameNetworkManager()
         self.player_color = None
         self.show_size_selection = False
         self.selected_game_mode = None
@@ -30,6 +30,17 @@ class MenuSystem:
         self.pressed_button = None
         self.pressed_size_button = None
 
+    def render_key(self):
+        """Everything the menu screen is drawn from; it only needs redrawing when this changes"""
+        return (
+            self.mode,
+            self.show_size_selection,
+            self.input_active,
+            self.room_code,
+            self.pressed_button,
+            self.pressed_size_button,
+        )
+
     def draw(self, surface):
         surface.fill((0, 0, 0))  # Black background
 
@@ -48,7 +59,7 @@ class MenuSystem:
         surface.blit(overlay, (0, 0))
 
         # Draw prompt
-        prompt = self.title_font.render("Select Game Size:", True, (208, 208, 208))
+        prompt = render_text(self.title_font, "Select Game Size:", True, (208, 208, 208))
         prompt_rect = prompt.get_rect(center=(surface.get_width() // 2, 200))
         surface.blit(prompt, prompt_rect)
 
@@ -101,7 +112,7 @@ class MenuSystem:
         )
 
         # Text
-        text_surface = self.button_font.render(text, True, (208, 208, 208))
+        text_surface = render_text(self.button_font, text, True, (208, 208, 208))
         text_rect = text_surface.get_rect(
             center=(button_pos[0] + rect.width // 2, button_pos[1] + rect.height // 2)
         )
@@ -109,12 +120,12 @@ class MenuSystem:
 
     def _draw_main_menu(self, surface):
         # Draw title
-        title = self.title_font.render("The Ring World", True, (0, 128, 255))
+        title = render_text(self.title_font, "The Ring World", True, (0, 128, 255))
         title_rect = title.get_rect(center=(surface.get_width() // 2, 100))
         surface.blit(title, title_rect)
 
         # Draw version
-        version = self.version_font.render("Version 1.37", True, (0, 128, 255))
+        version = render_text(self.version_font, "Version 1.37", True, (0, 128, 255))
         version_rect = version.get_rect(center=(surface.get_width() // 2, 150))
         surface.blit(version, version_rect)
 
@@ -139,6 +150,13 @@ class MenuSystem:
         if self.input_active:
             self._draw_room_input(surface)
 
+    @property
+    def network_manager(self):
+        """The network stack, started the first time online play needs it"""
+        from ..managers.network.network_manager import GameNetworkManager
+
+        return GameNetworkManager()
+
     def handle_events(self, event):
         if self.show_size_selection:
             return self._handle_size_selection(event)
@@ -256,6 +274,8 @@ class MenuSystem:
                     elif self.pressed_button == 3:  # TRAINING
                         self.selected_game_mode = GameMode.TRAINING
 
+                    if self.selected_game_mode in (GameMode.AI, GameMode.TRAINING):
+                        warm_up()  # Load the AI while the board size is being chosen
                     self.show_size_selection = True
 
             self.pressed_button = None
@@ -283,7 +303,7 @@ class MenuSystem:
         surface.blit(overlay, (0, 0))
 
         # Draw input box
-        prompt = self.title_font.render("Enter Room Code:", True, (208, 208, 208))
+        prompt = render_text(self.title_font, "Enter Room Code:", True, (208, 208, 208))
         prompt_rect = prompt.get_rect(center=(surface.get_width() // 2, 200))
         surface.blit(prompt, prompt_rect)
 
@@ -294,18 +314,20 @@ class MenuSystem:
         pygame.draw.rect(surface, (64, 64, 64), input_rect)
         pygame.draw.rect(surface, (192, 192, 192), input_rect, 1)
 
-        input_text = self.button_font.render(self.room_code, True, (208, 208, 208))
+        input_text = render_text(self.button_font, self.room_code, True, (208, 208, 208))
         text_rect = input_text.get_rect(center=input_rect.center)
         surface.blit(input_text, text_rect)
 
         # Draw instruction
-        instruction = self.small_font.render("Press ENTER to join", True, (128, 128, 128))
+        instruction = render_text(self.small_font, "Press ENTER to join", True, (128, 128, 128))
         instruction_rect = instruction.get_rect(center=(surface.get_width() // 2, 380))
         surface.blit(instruction, instruction_rect)
 
     def _draw_waiting_screen(self, surface):
-        waiting_text = self.title_font.render("Waiting for opponent...", True, (208, 208, 208))
-        room_text = self.button_font.render(f"Room: {self.room_code}", True, (208, 208, 208))
+        waiting_text = render_text(
+            self.title_font, "Waiting for opponent...", True, (208, 208, 208)
+        )
+        room_text = render_text(self.button_font, f"Room: {self.room_code}", True, (208, 208, 208))
 
         waiting_rect = waiting_text.get_rect(center=(surface.get_width() // 2, 200))
         room_rect = room_text.get_rect(center=(surface.get_width() // 2, 300))
@@ -0,0 +1,354 @@
+from typing import Dict, List, Optional
+import numpy as np
+from ..settings import PHASE_PLACEMENT, PHASE_ROTATION
+from .board_topology import BoardTopology
+from .fast_board import (
+    FastBoard,
+    EMPTY,
+    RED_CELL,
+    BLUE_CELL,
+    PLACE,
+    MEDIUM_ROTATION,
+    LARGE_ROTATION,
+)
+
+# Value of the padding column used when a gather needs "no neighbor"
+SENTINEL = 3
+
+
+# NumPy reductions over a short last axis (3-8 neighbors) are much slower than folding the
+# columns with element-wise ops, so the hot paths use these helpers instead of sum/any/min
+
+
+def _count_last(mask: np.ndarray) -> np.ndarray:
+    total = mask[..., 0].astype(np.int8)
+    for i in range(1, mask.shape[-1]):
+        total += mask[..., i]
+    return total
+
+
+def _any_last(mask: np.ndarray) -> np.ndarray:
+    result = mask[..., 0].copy()
+    for i in range(1, mask.shape[-1]):
+        result |= mask[..., i]
+    return result
+
+
+def _min_last(values: np.ndarray) -> np.ndarray:
+    result = values[..., 0].copy()
+    for i in range(1, values.shape[-1]):
+        np.minimum(result, values[..., i], out=result)
+    return result
+
+
+class _BatchTables:
+    """Index arrays derived from a BoardTopology, shared by every batch on that board."""
+
+    def __init__(self, topology: BoardTopology):
+        n = topology.small_count
+        m = topology.medium_count
+        k = topology.large_count
+        self.small_count = n
+        self.medium_count = m
+        self.large_count = k
+
+        # Padded index arrays; index n (or m) points at a sentinel column
+        self.medium_members = self._pad(topology.medium_members, n)
+        self.small_neighbors = self._pad(topology.small_neighbors, n)
+        self.medium_neighbors = self._pad(topology.medium_neighbors, m)
+        self.large_members = self._pad(topology.large_members, m)
+        self.small_parents = self._pad(topology.small_parents, m)
+
+        # Slot-ordered rules processed level by level: a slot only depends on lower-numbered
+        # neighbors updated earlier in the same pass, so slots on one level are independent
+        self.small_levels = self._levels(topology.small_neighbors)
+        self.medium_levels = self._levels(topology.medium_neighbors)
+
+        # One gather per rotation: new_cells[:, t] = old_cells[:, sources[r, t]]
+        rotations = list(topology.medium_rotations) + list(topology.large_small_rotations)
+        sources = np.tile(np.arange(n + 1), (len(rotations), 1))
+        for r, permutation in enumerate(rotations):
+            for source, target in permutation.items():
+                sources[r, target] = source
+        self.rotation_sources = sources
+
+    def _levels(self, neighbors):
+        level = [0] * len(neighbors)
+        for slot, around in enumerate(neighbors):
+            level[slot] = 1 + max((level[other] for other in around if other < slot), default=0)
+        slots_by_level = [
+            np.array([slot for slot in range(len(neighbors)) if level[slot] == depth])
+            for depth in range(1, max(level, default=0) + 1)
+        ]
+        padded = self._pad(neighbors, len(neighbors))
+        return [(slots, padded[slots]) for slots in slots_by_level]
+
+    @staticmethod
+    def _pad(rows, sentinel):
+        width = max((len(row) for row in rows), default=0)
+        table = np.full((len(rows), max(width, 1)), sentinel, dtype=np.int64)
+        for i, row in enumerate(rows):
+            table[i, : len(row)] = row
+        return table
+
+
+class BatchBoard:
+    """
+    B boards advanced in lockstep with NumPy.
+
+    Colors are kept as a (B, 272) int8 array (one extra sentinel column is stored at the end)
+    and every rule of FastBoard is applied to the whole batch at once: rotations are row-wise
+    permutation gathers, medium and large colors are counted over member index arrays, and
+    islands are found by label propagation. Rules that the live game applies in slot order
+    (medium intersections, the neighbor rule) are stepped slot by slot, vectorized over the
+    batch, so every board evolves exactly like a FastBoard playing the same moves.
+
+    Moves are encoded as action indices: a placement on small slot s is s, a medium
+    rotation is small_count + m and a large rotation is small_count + medium_count + k.
+    """
+
+    _tables: Dict[int, _BatchTables] = {}
+
+    def __init__(self, topology: BoardTopology, batch_size: int):
+        self.topology = topology
+        key = id(topology)
+        if key not in self._tables:
+            self._tables[key] = _BatchTables(topology)
+        self.tables = self._tables[key]
+
+        n = topology.small_count
+        self.cells = np.zeros((batch_size, n + 1), dtype=np.int8)
+        self.cells[:, n] = SENTINEL
+        self.medium = np.zeros((batch_size, topology.medium_count), dtype=np.int8)
+        self.large = np.zeros((batch_size, topology.large_count), dtype=np.int8)
+        self.turn = np.full(batch_size, RED_CELL, dtype=np.int8)
+        self.rotation_phase = np.zeros(batch_size, dtype=bool)
+
+    @classmethod
+    def from_boards(cls, boards: List[FastBoard]) -> "BatchBoard":
+        """Stack fast boards (all on the same topology) into a batch."""
+        batch = cls(boards[0].topology, len(boards))
+        n = batch.small_count
+        batch.cells[:, :n] = np.array([board.small for board in boards], dtype=np.int8)
+        batch.medium[:] = np.array([board.medium for board in boards], dtype=np.int8)
+        batch.large[:] = np.array([board.large for board in boards], dtype=np.int8)
+        batch.turn[:] = [board.turn for board in boards]
+        batch.rotation_phase[:] = [board.phase == PHASE_ROTATION for board in boards]
+        return batch
+
+    def board(self, index: int) -> FastBoard:
+        """Copy one board of the batch out as a FastBoard (medium identities are not tracked)."""
+        board = FastBoard(self.topology)
+        board.small = self.small[index].tolist()
+        board.medium = self.medium[index].tolist()
+        board.large = self.large[index].tolist()
+        board.turn = int(self.turn[index])
+        board.phase = PHASE_ROTATION if self.rotation_phase[index] else PHASE_PLACEMENT
+        return board
+
+    @property
+    def batch_size(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def small_count(self) -> int:
+        return self.tables.small_count
+
+    @property
+    def action_count(self) -> int:
+        tables = self.tables
+        return tables.small_count + tables.medium_count + tables.large_count
+
+    @property
+    def small(self) -> np.ndarray:
+        return self.cells[:, : self.small_count]
+
+    # Action encoding
+
+    def action_to_move(self, action: int):
+        n = self.tables.small_count
+        m = self.tables.medium_count
+        if action < n:
+            return (PLACE, action)
+        if action < n + m:
+            return (MEDIUM_ROTATION, action - n)
+        return (LARGE_ROTATION, action - n - m)
+
+    def move_to_action(self, move) -> int:
+        kind, index = move
+        if kind == PLACE:
+            return index
+        if kind == MEDIUM_ROTATION:
+            return self.tables.small_count + index
+        return self.tables.small_count + self.tables.medium_count + index
+
+    # Move generation
+
+    def legal_move_mask(self) -> np.ndarray:
+        """(B, action_count) mask of the moves FastBoard.valid_moves would return."""
+        tables = self.tables
+        small = self.small
+        turn = self.turn[:, None]
+
+        own = small == turn
+        medium_has_turn = _any_last(own[:, tables.medium_members])
+        blocked = _any_last(self._padded(medium_has_turn, False)[:, tables.small_parents])
+        placements = (small == EMPTY) & ~blocked
+        placements &= ~self.rotation_phase[:, None]
+
+        large_has_turn = self._padded(self.medium)[:, tables.large_members] == turn[:, :, None]
+        rotations = np.concatenate([medium_has_turn, _any_last(large_has_turn)], axis=1)
+
+        # With no placement left the player rotates instead
+        can_place = placements.any(axis=1)
+        rotations &= ~can_place[:, None]
+        return np.concatenate([placements, rotations], axis=1)
+
+    # Move application
+
+    def step(self, actions) -> None:
+        """Apply one action per board; boards given a negative action are left unchanged."""
+        actions = np.asarray(actions)
+        n = self.tables.small_count
+        is_place = (actions >= 0) & (actions < n)
+
+        rows = np.nonzero(is_place)[0]
+        if len(rows):
+            self.cells[rows, actions[rows]] = self.turn[rows]
+            self._update_colors(rows, after_rotation=False)
+            self.medium[rows] = self._contained_colors(rows)
+            self.rotation_phase[rows] = True
+
+        rows = np.nonzero(actions >= n)[0]
+        if len(rows):
+            sources = self.tables.rotation_sources[actions[rows] - n]
+            self.cells[rows] = np.take_along_axis(self.cells[rows], sources, axis=1)
+            self.turn[rows] = np.where(self.turn[rows] == RED_CELL, BLUE_CELL, RED_CELL)
+            self.rotation_phase[rows] = False
+            self._update_colors(rows, after_rotation=True)
+            self._neutralize_islands(rows)
+            self.medium[rows] = self._contained_colors(rows)
+
+    # Color rules
+
+    @staticmethod
+    def _padded(array: np.ndarray, value=SENTINEL) -> np.ndarray:
+        sentinel = np.full((array.shape[0], 1), value, dtype=array.dtype)
+        return np.concatenate([array, sentinel], axis=1)
+
+    @staticmethod
+    def _majority(values: np.ndarray, threshold: int) -> np.ndarray:
+        red = _count_last(values == RED_CELL) >= threshold
+        blue = _count_last(values == BLUE_CELL) >= threshold
+        return np.where(red, RED_CELL, np.where(blue, BLUE_CELL, EMPTY)).astype(np.int8)
+
+    def _contained_colors(self, rows) -> np.ndarray:
+        return self._majority(self.cells[rows][:, self.tables.medium_members], 5)
+
+    def _apply_medium_intersections(self, medium: np.ndarray) -> np.ndarray:
+        medium = self._padded(medium)
+        for slots, neighbors in self.tables.medium_levels:
+            around = medium[:, neighbors]
+            red = _count_last(around == RED_CELL) >= 2
+            blue = _count_last(around == BLUE_CELL) >= 2
+            current = medium[:, slots]
+            grey = current == EMPTY
+            medium[:, slots] = np.where(
+                grey & red, RED_CELL, np.where(grey & blue, BLUE_CELL, current)
+            )
+        return medium[:, :-1]
+
+    def _apply_neighbor_rule(self, cells: np.ndarray) -> np.ndarray:
+        """One slot-ordered pass over the grey cells; returns which rows changed."""
+        grey_at_start = cells == EMPTY
+        changed = np.zeros(cells.shape[0], dtype=bool)
+        for slots, neighbors in self.tables.small_levels:
+            around = cells[:, neighbors]
+            red = _count_last(around == RED_CELL) >= 2
+            blue = _count_last(around == BLUE_CELL) >= 2
+            grey = grey_at_start[:, slots]
+            new = np.where(grey & red, RED_CELL, np.where(grey & blue, BLUE_CELL, cells[:, slots]))
+            changed |= (grey & (red | blue)).any(axis=1)
+            cells[:, slots] = new
+        return changed
+
+    def _update_colors(self, rows, after_rotation: bool) -> None:
+        """Batch version of FastBoard._update_colors for the given rows."""
+        medium = self._apply_medium_intersections(self._contained_colors(rows))
+
+        if after_rotation:
+            cells = self.cells[rows]
+            active = np.arange(len(rows))
+            changed_any = np.zeros(len(rows), dtype=bool)
+            while len(active):
+                sub = cells[active]
+                changed = self._apply_neighbor_rule(sub)
+                cells[active] = sub
+                changed_any[active[changed]] = True
+                active = active[changed]
+            self.cells[rows] = cells
+            recolored = np.nonzero(changed_any)[0]
+            if len(recolored):
+                medium[recolored] = self._contained_colors(rows[recolored])
+
+        self.medium[rows] = medium
+        self.large[rows] = self._majority(self._padded(medium)[:, self.tables.large_members], 5)
+
+    def _neutralize_islands(self, rows) -> None:
+        """Grey out same-colored groups surrounded by the opposite color, for the given rows."""
+        n = self.tables.small_count
+        neighbors = self.tables.small_neighbors
+        cells = self.cells[rows]
+        small = cells[:, :n]
+        batch = len(rows)
+
+        colored = small != EMPTY
+        around = cells[:, neighbors]  # (b, n, degree)
+        same = (around == small[:, :, None]) & colored[:, :, None]
+
+        # Label propagation with pointer jumping: every cell ends up labeled with the
+        # smallest slot index of its same-colored component
+        offsets = np.arange(batch, dtype=np.int32)[:, None] * (n + 1)
+        labels = np.tile(np.arange(n + 1, dtype=np.int16), (batch, 1))
+        while True:
+            candidate = np.where(same, labels[:, neighbors], n)
+            new_labels = labels.copy()
+            new_labels[:, :n] = np.minimum(labels[:, :n], _min_last(candidate))
+            new_labels = new_labels.ravel()[new_labels + offsets].astype(np.int16)
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+        labels = labels[:, :n]
+
+        opposite = np.where(small == RED_CELL, BLUE_CELL, RED_CELL)
+        touches_grey = _any_last(around == EMPTY) & colored
+        touches_opposite = _any_last(around == opposite[:, :, None]) & colored
+
+        # Per component: does any member touch a grey cell / an opposite-colored cell
+        flat = (labels + offsets[:, :1]).ravel()
+        grey_border = np.zeros(batch * (n + 1), dtype=bool)
+        grey_border[flat[touches_grey.ravel()]] = True
+        opposite_border = np.zeros(batch * (n + 1), dtype=bool)
+        opposite_border[flat[touches_opposite.ravel()]] = True
+        island = colored & ~grey_border[flat].reshape(batch, n)
+        island &= opposite_border[flat].reshape(batch, n)
+
+        small[island] = EMPTY
+        self.cells[rows] = cells
+
+    # Game result
+
+    def winners(self) -> np.ndarray:
+        """Per-board winner cell (RED_CELL, BLUE_CELL or EMPTY), red first like get_winner."""
+        red = (self.large == RED_CELL).sum(axis=1) >= 5
+        blue = (self.large == BLUE_CELL).sum(axis=1) >= 5
+        return np.where(red, RED_CELL, np.where(blue, BLUE_CELL, EMPTY)).astype(np.int8)
+
+    def random_actions(self, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Pick a uniformly random legal action per board (-1 where none is legal)."""
+        rng = rng or np.random.default_rng()
+        mask = self.legal_move_mask()
+        weights = rng.random(mask.shape) * mask
+        actions = weights.argmax(axis=1)
+        actions[~mask.any(axis=1)] = -1
+        return actions
@@ -0,0 +1,94 @@
+from typing import Dict, Tuple
+from ..settings import RED, BLUE
+
+SMALL = "small"
+MEDIUM = "medium"
+LARGE = "large"
+TIERS = (SMALL, MEDIUM, LARGE)
+
+
+class _TierCounter:
+    """Red and blue counts for one tier of circles."""
+
+    __slots__ = ("red", "blue")
+
+    def __init__(self):
+        self.red = 0
+        self.blue = 0
+
+    def color_changed(self, old_color, new_color):
+        if old_color == RED:
+            self.red -= 1
+        elif old_color == BLUE:
+            self.blue -= 1
+        if new_color == RED:
+            self.red += 1
+        elif new_color == BLUE:
+            self.blue += 1
+
+
+class BoardStats:
+    """
+    Red and blue circle counts per tier, kept up to date as circles change color.
+
+    The circles report every color assignment to their tier's counter, so reading a count
+    is O(1) no matter how often the UI or the AI asks. Consumers only read from this object.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, _TierCounter] = {tier: _TierCounter() for tier in TIERS}
+        self._small_total = 0
+
+    def track(self, circle_manager):
+        """Count the manager's circles and follow their color changes from now on."""
+        self._small_total = len(circle_manager.small_circles)
+        for tier, circles in (
+            (SMALL, circle_manager.small_circles),
+            (MEDIUM, circle_manager.medium_circles),
+            (LARGE, circle_manager.large_circles),
+        ):
+            counter = _TierCounter()
+            for circle in circles:
+                counter.color_changed(None, circle.color)
+                circle.color_tracker = counter
+            self._counters[tier] = counter
+
+    def counts(self, tier: str) -> Tuple[int, int]:
+        """(red, blue) count for a tier."""
+        counter = self._counters[tier]
+        return counter.red, counter.blue
+
+    @property
+    def small(self) -> Tuple[int, int]:
+        return self.counts(SMALL)
+
+    @property
+    def medium(self) -> Tuple[int, int]:
+        return self.counts(MEDIUM)
+
+    @property
+    def large(self) -> Tuple[int, int]:
+        return self.counts(LARGE)
+
+    @property
+    def total(self) -> Tuple[int, int]:
+        red = sum(counter.red for counter in self._counters.values())
+        blue = sum(counter.blue for counter in self._counters.values())
+        return red, blue
+
+    @property
+    def percentage(self) -> Tuple[float, float]:
+        """Share of the small circles held by each color, in percent."""
+        if not self._small_total:
+            return 0, 0
+        red, blue = self.small
+        return red / self._small_total * 100, blue / self._small_total * 100
+
+    def to_dict(self):
+        return {
+            SMALL: self.small,
+            MEDIUM: self.medium,
+            LARGE: self.large,
+            "total": self.total,
+            "percentage": self.percentage,
+        }
@@ -0,0 +1,188 @@
+import math
+from typing import Dict, List, Tuple
+from ..settings import CIRCLE_SMALL_RADIUS, CIRCLE_MEDIUM_RADIUS, CIRCLE_LARGE_RADIUS
+
+
+class BoardTopology:
+    """
+    Static slot geometry of the board.
+
+    Circles only ever move between a fixed set of positions ("slots"), so everything the
+    rules need - which small slots sit inside which medium slot, which slots are adjacent,
+    where each rotation sends each slot - can be computed once and reused as index lists.
+    Slot i is the starting position of the circle created with id i.
+    """
+
+    _cache: Dict[Tuple[bool, float], "BoardTopology"] = {}
+
+    def __init__(
+        self,
+        small_positions: List[Tuple[float, float]],
+        medium_positions: List[Tuple[float, float]],
+        large_positions: List[Tuple[float, float]],
+        forbidden_connections,
+        connection_distance: float,
+        distance_tolerance: float = 0.1,
+        reduced_version: bool = False,
+    ):
+        self.reduced_version = reduced_version
+        self.small_positions = [tuple(p) for p in small_positions]
+        self.medium_positions = [tuple(p) for p in medium_positions]
+        self.large_positions = [tuple(p) for p in large_positions]
+        self.small_count = len(self.small_positions)
+        self.medium_count = len(self.medium_positions)
+        self.large_count = len(self.large_positions)
+
+        # Quantized position -> slot lookups used to map live circles onto slots
+        self._small_grid = self._build_grid(self.small_positions)
+        self._medium_grid = self._build_grid(self.medium_positions)
+
+        # Small slots inside each medium slot (same rule as get_circles_inside_at_position)
+        self.medium_members: List[Tuple[int, ...]] = [
+            tuple(
+                s
+                for s, small_pos in enumerate(self.small_positions)
+                if math.dist(small_pos, medium_pos) <= CIRCLE_MEDIUM_RADIUS
+            )
+            for medium_pos in self.medium_positions
+        ]
+
+        # Medium slots containing each small slot
+        self.small_parents: List[Tuple[int, ...]] = [
+            tuple(m for m, members in enumerate(self.medium_members) if s in members)
+            for s in range(self.small_count)
+        ]
+
+        # Medium slots completely contained in each large circle
+        self.large_members: List[Tuple[int, ...]] = [
+            tuple(
+                m
+                for m, medium_pos in enumerate(self.medium_positions)
+                if math.dist(medium_pos, large_pos) + CIRCLE_MEDIUM_RADIUS <= CIRCLE_LARGE_RADIUS
+            )
+            for large_pos in self.large_positions
+        ]
+
+        # Overlapping medium slots (same rule as CircleIntersectionChecker)
+        self.medium_neighbors: List[Tuple[int, ...]] = [
+            tuple(
+                other
+                for other, other_pos in enumerate(self.medium_positions)
+                if other != m and math.dist(medium_pos, other_pos) < 2 * CIRCLE_MEDIUM_RADIUS
+            )
+            for m, medium_pos in enumerate(self.medium_positions)
+        ]
+
+        # Adjacent small slots (same rule as ConnectionManager)
+        min_distance = connection_distance * (1 - distance_tolerance)
+        max_distance = connection_distance * (1 + distance_tolerance)
+        adjacency: List[List[int]] = [[] for _ in range(self.small_count)]
+        for i in range(self.small_count):
+            for j in range(i + 1, self.small_count):
+                if (i, j) in forbidden_connections:
+                    continue
+                distance = math.dist(self.small_positions[i], self.small_positions[j])
+                if min_distance <= distance <= max_distance:
+                    adjacency[i].append(j)
+                    adjacency[j].append(i)
+        self.small_neighbors: List[Tuple[int, ...]] = [tuple(n) for n in adjacency]
+
+        # Rotation permutations: slot -> slot the circle lands on after a 45 degree turn
+        self.medium_rotations: List[Dict[int, int]] = [
+            {
+                s: self._rotate_slot(self.small_positions[s], medium_pos, "small")
+                for s in self.medium_members[m]
+            }
+            for m, medium_pos in enumerate(self.medium_positions)
+        ]
+        self.large_small_rotations: List[Dict[int, int]] = []
+        self.large_medium_rotations: List[Dict[int, int]] = []
+        for k, large_pos in enumerate(self.large_positions):
+            medium_perm = {
+                m: self._rotate_slot(self.medium_positions[m], large_pos, "medium")
+                for m in self.large_members[k]
+            }
+            affected_small = sorted(
+                {s for m in self.large_members[k] for s in self.medium_members[m]}
+            )
+            small_perm = {
+                s: self._rotate_slot(self.small_positions[s], large_pos, "small")
+                for s in affected_small
+            }
+            self.large_medium_rotations.append(medium_perm)
+            self.large_small_rotations.append(small_perm)
+
+    @classmethod
+    def for_system(cls, circle_system) -> "BoardTopology":
+        """Get the (cached) topology matching a circle system's board size and connections."""
+        reduced_version = circle_system.circle_manager.fractal_initializer.reduced_version
+        return cls.for_board_size(
+            reduced_version, circle_system.connection_manager.current_multiplier
+        )
+
+    @classmethod
+    def for_board_size(cls, reduced_version: bool = False, multiplier: float = 3.2):
+        """Get the (cached) topology for a board size and connection distance multiplier."""
+        key = (reduced_version, round(multiplier, 2))
+        if key not in cls._cache:
+            cls._cache[key] = cls.from_board_size(reduced_version, multiplier)
+        return cls._cache[key]
+
+    @classmethod
+    def from_board_size(cls, reduced_version: bool = False, multiplier: float = 3.2):
+        """Build the topology from a freshly initialized board of the given size."""
+        # Imported here to keep the topology usable from the managers without a cycle
+        from ...managers.circles.circle_manager import CircleManager
+        from ...managers.connection_manager import ConnectionManager
+
+        circle_manager = CircleManager(reduced_version)
+        circle_manager._initialize_system()
+        connection_manager = ConnectionManager()
+        return cls(
+            [c.pos for c in circle_manager.small_circles],
+            [c.pos for c in circle_manager.medium_circles],
+            [c.pos for c in circle_manager.large_circles],
+            connection_manager.forbidden_connections,
+            CIRCLE_SMALL_RADIUS * multiplier,
+            connection_manager.distance_tolerance,
+            reduced_version,
+        )
+
+    @staticmethod
+    def _grid_key(pos) -> Tuple[int, int]:
+        return (int(round(pos[0])), int(round(pos[1])))
+
+    def _build_grid(self, positions) -> Dict[Tuple[int, int], int]:
+        return {self._grid_key(pos): slot for slot, pos in enumerate(positions)}
+
+    def _rotate_slot(self, pos, center, circle_type, angle: float = math.pi / 4) -> int:
+        dx = pos[0] - center[0]
+        dy = pos[1] - center[1]
+        rotated = (
+            center[0] + dx * math.cos(angle) - dy * math.sin(angle),
+            center[1] + dx * math.sin(angle) + dy * math.cos(angle),
+        )
+        if circle_type == "small":
+            slot = self.small_slot_at(rotated)
+        else:
+            slot = self.medium_slot_at(rotated)
+        if slot is None:
+            raise ValueError(f"Rotation of {pos} around {center} does not land on a slot")
+        return slot
+
+    def _lookup(self, pos, grid, positions, tolerance: float = 2.0):
+        x, y = self._grid_key(pos)
+        for dx in (0, -1, 1):
+            for dy in (0, -1, 1):
+                slot = grid.get((x + dx, y + dy))
+                if slot is not None and math.dist(positions[slot], pos) <= tolerance:
+                    return slot
+        return None
+
+    def small_slot_at(self, pos):
+        """Slot index of the small circle position closest to pos, or None if off-grid."""
+        return self._lookup(pos, self._small_grid, self.small_positions)
+
+    def medium_slot_at(self, pos):
+        """Slot index of the medium circle position closest to pos, or None if off-grid."""
+        return self._lookup(pos, self._medium_grid, self.medium_positions)
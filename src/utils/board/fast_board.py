@@ -0,0 +1,337 @@
+from typing import List, Optional, Tuple
+from ..settings import RED, BLUE, PHASE_PLACEMENT, PHASE_ROTATION
+from ..circle_classes import MediumCircle, LargeCircle
+from .board_topology import BoardTopology
+
+# Cell values used by the fast board model
+EMPTY = 0
+RED_CELL = 1
+BLUE_CELL = 2
+
+# Move kinds: ("place", small_slot), ("medium", medium_slot), ("large", large_index)
+PLACE = "place"
+MEDIUM_ROTATION = "medium"
+LARGE_ROTATION = "large"
+
+TURN_CELLS = {"red": RED_CELL, "blue": BLUE_CELL}
+CELL_TURNS = {RED_CELL: "red", BLUE_CELL: "blue"}
+
+
+def color_to_cell(color) -> int:
+    """Convert an RGB circle color into a fast board cell value."""
+    if color == RED:
+        return RED_CELL
+    if color == BLUE:
+        return BLUE_CELL
+    return EMPTY
+
+
+class FastBoard:
+    """
+    Slot-indexed board model for search.
+
+    Holds one integer per slot instead of circle objects with float positions, and applies
+    the same placement, rotation, recoloring, neighbor and island rules as the live game
+    using the precomputed BoardTopology. Slots are processed in index order wherever the
+    live rules depend on evaluation order.
+    """
+
+    __slots__ = ("topology", "small", "medium", "large", "medium_order", "turn", "phase")
+
+    def __init__(self, topology: BoardTopology):
+        self.topology = topology
+        self.small: List[int] = [EMPTY] * topology.small_count
+        self.medium: List[int] = [EMPTY] * topology.medium_count
+        self.large: List[int] = [EMPTY] * topology.large_count
+        # Medium slot -> index of the MediumCircle object currently occupying it
+        self.medium_order: List[int] = list(range(topology.medium_count))
+        self.turn = RED_CELL
+        self.phase = PHASE_PLACEMENT
+
+    @classmethod
+    def from_system(cls, circle_system) -> "FastBoard":
+        """Capture the live circle system as a fast board."""
+        board = cls(BoardTopology.for_system(circle_system))
+        topology = board.topology
+
+        for circle in circle_system.small_circles:
+            slot = topology.small_slot_at(circle.pos)
+            if slot is not None:
+                board.small[slot] = color_to_cell(circle.color)
+
+        for index, circle in enumerate(circle_system.medium_circles):
+            slot = topology.medium_slot_at(circle.pos)
+            if slot is not None:
+                board.medium[slot] = color_to_cell(circle.color)
+                board.medium_order[slot] = index
+
+        for index, circle in enumerate(circle_system.large_circles):
+            board.large[index] = color_to_cell(circle.color)
+
+        board.turn = TURN_CELLS[circle_system.game_state.turn]
+        board.phase = circle_system.game_state.phase
+        return board
+
+    def copy(self) -> "FastBoard":
+        board = FastBoard.__new__(FastBoard)
+        board.topology = self.topology
+        board.small = self.small[:]
+        board.medium = self.medium[:]
+        board.large = self.large[:]
+        board.medium_order = self.medium_order[:]
+        board.turn = self.turn
+        board.phase = self.phase
+        return board
+
+    def position_key(self) -> bytes:
+        """Hashable key identifying the position (colors, side to move and phase)."""
+        phase = 0 if self.phase == PHASE_PLACEMENT else 1
+        return bytes(self.small) + bytes((self.turn, phase))
+
+    @property
+    def turn_name(self) -> str:
+        return CELL_TURNS[self.turn]
+
+    def empty_count(self) -> int:
+        return self.small.count(EMPTY)
+
+    def count(self, cell: int) -> int:
+        return self.small.count(cell)
+
+    # Move generation
+
+    def valid_placements(self) -> List[int]:
+        """Grey small slots outside every medium circle that holds the current color."""
+        topology = self.topology
+        small = self.small
+        turn = self.turn
+        blocked = set()
+        for members in topology.medium_members:
+            for s in members:
+                if small[s] == turn:
+                    blocked.update(members)
+                    break
+        return [s for s in range(topology.small_count) if small[s] == EMPTY and s not in blocked]
+
+    def valid_rotations(self) -> List[Tuple[str, int]]:
+        """Medium slots holding the current color and large circles with a medium of it."""
+        topology = self.topology
+        small = self.small
+        turn = self.turn
+        moves = [
+            (MEDIUM_ROTATION, m)
+            for m, members in enumerate(topology.medium_members)
+            if any(small[s] == turn for s in members)
+        ]
+        moves.extend(
+            (LARGE_ROTATION, k)
+            for k, members in enumerate(topology.large_members)
+            if any(self.medium[m] == turn for m in members)
+        )
+        return moves
+
+    def valid_moves(self) -> List[Tuple[str, int]]:
+        """Moves for the current phase; with no placement left the player rotates instead."""
+        if self.phase == PHASE_PLACEMENT:
+            placements = self.valid_placements()
+            if placements:
+                return [(PLACE, s) for s in placements]
+        return self.valid_rotations()
+
+    # Move application
+
+    def play(self, move: Tuple[str, int]) -> None:
+        kind, index = move
+        if kind == PLACE:
+            self.place(index)
+        elif kind == MEDIUM_ROTATION:
+            self.rotate_medium(index)
+        else:
+            self.rotate_large(index)
+
+    def place(self, slot: int) -> None:
+        """Place the current color on a small slot and switch to the rotation phase."""
+        self.small[slot] = self.turn
+        self._update_colors(after_rotation=False)
+        self._update_medium_colors()
+        self.phase = PHASE_ROTATION
+
+    def rotate_medium(self, slot: int) -> None:
+        """Rotate the small circles of a medium slot by 45 degrees and end the turn."""
+        small = self.small
+        moved = [(target, small[s]) for s, target in self.topology.medium_rotations[slot].items()]
+        for target, cell in moved:
+            small[target] = cell
+        self._end_turn()
+
+    def rotate_large(self, index: int) -> None:
+        """Rotate a large circle's medium and small circles by 45 degrees and end the turn."""
+        topology = self.topology
+        small = self.small
+        moved = [(target, small[s]) for s, target in topology.large_small_rotations[index].items()]
+        for target, cell in moved:
+            small[target] = cell
+
+        order = self.medium_order
+        moved = [(target, order[m]) for m, target in topology.large_medium_rotations[index].items()]
+        for target, obj in moved:
+            order[target] = obj
+        self._end_turn()
+
+    def _end_turn(self) -> None:
+        """Post-rotation effects, mirroring AnimationHandler._handle_post_animation_effects."""
+        self.turn = BLUE_CELL if self.turn == RED_CELL else RED_CELL
+        self.phase = PHASE_PLACEMENT
+        self._update_colors(after_rotation=True)
+        self._neutralize_islands()
+        self._update_medium_colors()
+
+    # Color rules
+
+    def _medium_color(self, m: int) -> int:
+        small = self.small
+        red_count = 0
+        blue_count = 0
+        for s in self.topology.medium_members[m]:
+            cell = small[s]
+            if cell == RED_CELL:
+                red_count += 1
+            elif cell == BLUE_CELL:
+                blue_count += 1
+        if red_count >= 5:
+            return RED_CELL
+        if blue_count >= 5:
+            return BLUE_CELL
+        return EMPTY
+
+    def _update_medium_colors(self) -> None:
+        self.medium = [self._medium_color(m) for m in range(self.topology.medium_count)]
+
+    def _apply_medium_intersections(self) -> None:
+        medium = self.medium
+        for m, neighbors in enumerate(self.topology.medium_neighbors):
+            if medium[m] != EMPTY:
+                continue
+            red_count = 0
+            blue_count = 0
+            for other in neighbors:
+                if medium[other] == RED_CELL:
+                    red_count += 1
+                elif medium[other] == BLUE_CELL:
+                    blue_count += 1
+            if red_count >= 2:
+                medium[m] = RED_CELL
+            elif blue_count >= 2:
+                medium[m] = BLUE_CELL
+
+    def _apply_neighbor_rule(self) -> bool:
+        small = self.small
+        changed = False
+        grey_slots = [s for s in range(self.topology.small_count) if small[s] == EMPTY]
+        neighbors = self.topology.small_neighbors
+        for s in grey_slots:
+            red_count = 0
+            blue_count = 0
+            for n in neighbors[s]:
+                if small[n] == RED_CELL:
+                    red_count += 1
+                elif small[n] == BLUE_CELL:
+                    blue_count += 1
+            if red_count >= 2:
+                small[s] = RED_CELL
+                changed = True
+            elif blue_count >= 2:
+                small[s] = BLUE_CELL
+                changed = True
+        return changed
+
+    def _update_large_colors(self) -> None:
+        medium = self.medium
+        for k, members in enumerate(self.topology.large_members):
+            red_count = sum(1 for m in members if medium[m] == RED_CELL)
+            blue_count = sum(1 for m in members if medium[m] == BLUE_CELL)
+            if red_count >= 5:
+                self.large[k] = RED_CELL
+            elif blue_count >= 5:
+                self.large[k] = BLUE_CELL
+            else:
+                self.large[k] = EMPTY
+
+    def _update_colors(self, after_rotation: bool) -> None:
+        """
+        Mirror GameColorManager.update_all_colors. Callers then recompute the medium colors
+        from their contents, as CircleSystem.update does on every idle frame.
+        """
+        self._update_medium_colors()
+        self._apply_medium_intersections()
+        if after_rotation:
+            while self._apply_neighbor_rule():
+                self._update_medium_colors()
+        self._update_large_colors()
+
+    def _neutralize_islands(self) -> None:
+        """Grey out same-colored groups completely surrounded by the opposite color."""
+        small = self.small
+        neighbors = self.topology.small_neighbors
+        visited = [False] * self.topology.small_count
+        islands = []
+
+        for start in range(self.topology.small_count):
+            color = small[start]
+            if color == EMPTY or visited[start]:
+                continue
+            visited[start] = True
+            component = [start]
+            stack = [start]
+            while stack:
+                current = stack.pop()
+                for n in neighbors[current]:
+                    if not visited[n] and small[n] == color:
+                        visited[n] = True
+                        component.append(n)
+                        stack.append(n)
+
+            opposite = BLUE_CELL if color == RED_CELL else RED_CELL
+            members = set(component)
+            border = {n for c in component for n in neighbors[c] if n not in members}
+            if border and all(small[n] == opposite for n in border):
+                islands.append(component)
+
+        for component in islands:
+            for s in component:
+                small[s] = EMPTY
+
+    # Game result
+
+    def winner(self) -> Optional[str]:
+        """Same rule as TurnHandler.get_winner: five large circles of one color."""
+        if self.large.count(RED_CELL) >= 5:
+            return "red"
+        if self.large.count(BLUE_CELL) >= 5:
+            return "blue"
+        return None
+
+
+def find_live_circle(circle_system, move: Tuple[str, int]):
+    """Map a fast board move back to the live circle object it acts on."""
+    kind, index = move
+    topology = BoardTopology.for_system(circle_system)
+    if kind == LARGE_ROTATION:
+        return circle_system.large_circles[index]
+    if kind == PLACE:
+        circles, slot_at = circle_system.small_circles, topology.small_slot_at
+    else:
+        circles, slot_at = circle_system.medium_circles, topology.medium_slot_at
+    return next((c for c in circles if slot_at(c.pos) == index), None)
+
+
+def fast_move_for(circle_system, circle) -> Optional[Tuple[str, int]]:
+    """Map a live circle (placement target or rotated circle) to its fast board move."""
+    topology = BoardTopology.for_system(circle_system)
+    if isinstance(circle, LargeCircle):
+        return (LARGE_ROTATION, circle_system.large_circles.index(circle))
+    if isinstance(circle, MediumCircle):
+        slot = topology.medium_slot_at(circle.pos)
+        return None if slot is None else (MEDIUM_ROTATION, slot)
+    slot = topology.small_slot_at(circle.pos)
+    return None if slot is None else (PLACE, slot)
@@ -0,0 +1,124 @@
+"""
+Perft for the fast board model: walk the full game tree to a fixed depth and count leaves.
+
+Every placement and every rotation is one ply. Leaf counts are split by the kind of the
+last move, and positions where somebody has already won are not expanded. The numbers
+for a given position and depth never change, so they serve as a regression oracle for
+any other board representation, and the timing is the headline move generation
+benchmark.
+
+    python -m src.utils.board.perft --depth 3
+    python -m src.utils.board.perft --depth 4 --reduced --divide
+    python -m src.utils.board.perft --depth 2 --position <notation>
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import argparse
+import time
+from .board_topology import BoardTopology
+from .fast_board import FastBoard, PLACE, MEDIUM_ROTATION, LARGE_ROTATION
+from .position_notation import decode_position
+
+MOVE_KINDS = (PLACE, MEDIUM_ROTATION, LARGE_ROTATION)
+
+
+@dataclass
+class PerftResult:
+    """Leaf counts and timing of one perft run."""
+
+    depth: int
+    leaves: Dict[str, int] = field(default_factory=lambda: {kind: 0 for kind in MOVE_KINDS})
+    visited: int = 0  # Positions whose moves were generated
+    wins: int = 0  # Won positions reached before the full depth
+    elapsed: float = 0.0
+
+    @property
+    def nodes(self) -> int:
+        return sum(self.leaves.values())
+
+    @property
+    def nodes_per_second(self) -> float:
+        return (self.nodes + self.visited) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def perft(board: FastBoard, depth: int) -> PerftResult:
+    """Count the leaf positions depth plies below board."""
+    result = PerftResult(depth)
+    start = time.perf_counter()
+    _perft(board, depth, result)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def _perft(board: FastBoard, depth: int, result: PerftResult):
+    if depth == 0:
+        return
+    if board.winner():
+        result.wins += 1
+        return
+
+    moves = board.valid_moves()
+    result.visited += 1
+    if depth == 1:
+        # Bulk count: the leaves are the moves themselves
+        for kind, _ in moves:
+            result.leaves[kind] += 1
+        return
+
+    for move in moves:
+        child = board.copy()
+        child.play(move)
+        _perft(child, depth - 1, result)
+
+
+def divide(board: FastBoard, depth: int) -> List[Tuple[Tuple[str, int], PerftResult]]:
+    """Perft split by root move, to find where two move generators disagree."""
+    results = []
+    for move in board.valid_moves():
+        child = board.copy()
+        child.play(move)
+        if depth == 1:
+            result = PerftResult(depth)
+            result.leaves[move[0]] = 1
+        else:
+            result = perft(child, depth - 1)
+        results.append((move, result))
+    return results
+
+
+def starting_board(reduced_version: bool = False) -> FastBoard:
+    return FastBoard(BoardTopology.for_board_size(reduced_version))
+
+
+def format_result(result: PerftResult, label: Optional[str] = None) -> str:
+    counts = ", ".join(f"{kind} {result.leaves[kind]}" for kind in MOVE_KINDS)
+    prefix = f"{label}: " if label else f"depth {result.depth}: "
+    return f"{prefix}{result.nodes} ({counts}; wins {result.wins})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count game tree leaves on the fast board")
+    parser.add_argument("--depth", type=int, default=3, help="plies to search (default 3)")
+    parser.add_argument("--reduced", action="store_true", help="use the reduced board")
+    parser.add_argument("--divide", action="store_true", help="also print counts per root move")
+    parser.add_argument("--position", help="start from a position notation instead")
+    args = parser.parse_args(argv)
+
+    board = decode_position(args.position) if args.position else starting_board(args.reduced)
+    size = "reduced" if board.topology.reduced_version else "full"
+    print(f"Perft on the {size} board")
+    for depth in range(1, args.depth + 1):
+        result = perft(board, depth)
+        print(
+            f"{format_result(result)} in {result.elapsed:.3f}s, "
+            f"{result.nodes_per_second:,.0f} nodes/s"
+        )
+
+    if args.divide:
+        for move, result in divide(board, args.depth):
+            print(format_result(result, f"{move[0]} {move[1]}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Compact position notation.
+
+A position is packed as one header byte (board size, side to move, phase), the colors of
+every small, medium and large slot as one base-3 number, and - only when large rotations
+have moved the medium circles around - the medium circle index held by each medium slot.
+The text form is the same bytes in URL-safe base64, about 90 characters for an untouched
+full board, so it fits in logs, cache keys, test fixtures and network messages.
+"""
+
+import base64
+from ..settings import RED, BLUE, GREY, PHASE_PLACEMENT, PHASE_ROTATION
+from .board_topology import BoardTopology
+from .fast_board import FastBoard, EMPTY, RED_CELL, BLUE_CELL, CELL_TURNS
+
+# Header bits
+_REDUCED = 1
+_BLUE_TO_MOVE = 2
+_ROTATION_PHASE = 4
+_MEDIUM_ORDER = 8
+
+# Cell values -> base-3 digit characters, so int(..., 3) does the packing
+_DIGIT_CHARS = bytes.maketrans(b"\x00\x01\x02", b"012")
+# Unpacking peels off five base-3 digits at a time (3 ** 5 = 243)
+_CHUNK = 3**5
+_CHUNK_CELLS = [
+    bytes((v // 81, v // 27 % 3, v // 9 % 3, v // 3 % 3, v % 3)) for v in range(_CHUNK)
+]
+
+_CELL_COLORS = {EMPTY: GREY, RED_CELL: RED, BLUE_CELL: BLUE}
+
+
+def _cell_count(topology: BoardTopology) -> int:
+    return topology.small_count + topology.medium_count + topology.large_count
+
+
+def _packed_length(cell_count: int) -> int:
+    return ((3**cell_count - 1).bit_length() + 7) // 8
+
+
+def pack_position(board: FastBoard) -> bytes:
+    """Binary notation of a fast board."""
+    topology = board.topology
+    header = 0
+    if topology.reduced_version:
+        header |= _REDUCED
+    if board.turn == BLUE_CELL:
+        header |= _BLUE_TO_MOVE
+    if board.phase == PHASE_ROTATION:
+        header |= _ROTATION_PHASE
+    reordered = board.medium_order != list(range(topology.medium_count))
+    if reordered:
+        header |= _MEDIUM_ORDER
+
+    cells = bytes(board.small + board.medium + board.large)
+    packed = int(cells.translate(_DIGIT_CHARS), 3).to_bytes(_packed_length(len(cells)), "big")
+    order = bytes(board.medium_order) if reordered else b""
+    return bytes((header,)) + packed + order
+
+
+def unpack_position(data: bytes, multiplier: float = 3.2) -> FastBoard:
+    """Rebuild a fast board from pack_position output."""
+    if not data:
+        raise ValueError("Empty position")
+    header = data[0]
+    topology = BoardTopology.for_board_size(bool(header & _REDUCED), multiplier)
+    cell_count = _cell_count(topology)
+    packed_end = 1 + _packed_length(cell_count)
+    order_length = topology.medium_count if header & _MEDIUM_ORDER else 0
+    if len(data) != packed_end + order_length:
+        raise ValueError(f"Position has {len(data)} bytes, expected {packed_end + order_length}")
+
+    value = int.from_bytes(data[1:packed_end], "big")
+    chunks = []
+    for _ in range((cell_count + 4) // 5):
+        value, digits = divmod(value, _CHUNK)
+        chunks.append(_CHUNK_CELLS[digits])
+    chunks.reverse()
+    cells = list(b"".join(chunks)[-cell_count:])
+    if value or any(chunks[0][: len(chunks) * 5 - cell_count]):
+        raise ValueError("Position has more cells than the board")
+
+    board = FastBoard(topology)
+    small_end = topology.small_count
+    medium_end = small_end + topology.medium_count
+    board.small = cells[:small_end]
+    board.medium = cells[small_end:medium_end]
+    board.large = cells[medium_end:]
+    if order_length:
+        board.medium_order = list(data[packed_end:])
+        if sorted(board.medium_order) != list(range(topology.medium_count)):
+            raise ValueError("Medium order is not a permutation")
+    board.turn = BLUE_CELL if header & _BLUE_TO_MOVE else RED_CELL
+    board.phase = PHASE_ROTATION if header & _ROTATION_PHASE else PHASE_PLACEMENT
+    return board
+
+
+def encode_position(board: FastBoard) -> str:
+    """Text notation of a fast board."""
+    return base64.urlsafe_b64encode(pack_position(board)).rstrip(b"=").decode("ascii")
+
+
+def decode_position(text: str, multiplier: float = 3.2) -> FastBoard:
+    """Rebuild a fast board from encode_position output."""
+    padding = "=" * (-len(text) % 4)
+    try:
+        data = base64.urlsafe_b64decode(text + padding)
+    except ValueError as e:
+        raise ValueError(f"Invalid position notation: {text!r}") from e
+    return unpack_position(data, multiplier)
+
+
+def restore_system(circle_system, board: FastBoard):
+    """Put a live circle system into the position of a fast board."""
+    topology = board.topology
+    circle_system.reset_game()
+
+    for slot, circle in enumerate(circle_system.small_circles):
+        circle.pos = list(topology.small_positions[slot])
+        circle.set_color(_CELL_COLORS[board.small[slot]])
+
+    for slot, index in enumerate(board.medium_order):
+        circle = circle_system.medium_circles[index]
+        circle.pos = list(topology.medium_positions[slot])
+        circle.color = _CELL_COLORS[board.medium[slot]]
+
+    for index, circle in enumerate(circle_system.large_circles):
+        circle.color = _CELL_COLORS[board.large[index]]
+    circle_system.color_manager.slot_index.invalidate()
+
+    circle_system.game_state.turn = CELL_TURNS[board.turn]
+    circle_system.game_state.phase = board.phase
+    circle_system.update_adjacent_connections()
@@ -0,0 +1,138 @@
+from typing import Dict, List, Optional, Set
+from .board_topology import BoardTopology
+
+
+class SlotIndex:
+    """
+    Maps the live circles of a circle system onto board slots.
+
+    Circles only ever move between slots, so "which small circles are inside this medium
+    circle" or "which medium circles make up this large circle" can be answered from the
+    precomputed BoardTopology instead of distance scans. Rotations report the circles they
+    move (start_move / finish_move) and small circles report their color changes, so a
+    refresh only reads the moved circles, and each consumer can ask which small circles
+    changed slot or color since it last looked without comparing the whole board.
+    """
+
+    def __init__(self, circle_system):
+        self.system = circle_system
+        self.topology: Optional[BoardTopology] = None
+        self.small_at: List = []
+        self.slot_of: Dict = {}
+        self.medium_at: List = []
+        self.medium_slot_of: Dict = {}
+        self._moved_small: Set = set()  # Circles whose position must be read again
+        self._moved_medium: Set = set()
+        self._moving = False  # A rotation is under way; its circles are between slots
+        self._full_scan = True
+        self._snapshots: Dict[str, Dict] = {}
+        self._pending: Dict[str, Set] = {}  # Consumer -> small circles to compare
+
+    def start_move(self, small_circles, medium_circles=()):
+        """Called when a rotation starts moving these circles off their slots."""
+        for circles, moved, slot_of in (
+            (small_circles, self._moved_small, self.slot_of),
+            (medium_circles, self._moved_medium, self.medium_slot_of),
+        ):
+            for circle in circles:
+                moved.add(circle)
+                slot_of.pop(circle, None)
+        self._moving = True
+
+    def finish_move(self):
+        """Called when the rotation has put its circles down; they are read on next refresh."""
+        self._moving = False
+
+    def invalidate(self):
+        """Read every circle again, for changes that bypass start_move (loading a position)."""
+        self._full_scan = True
+        self._moving = False
+
+    def circle_recolored(self, circle):
+        """Color listener of the small circles: queue the circle for every consumer."""
+        for pending in self._pending.values():
+            pending.add(circle)
+
+    def refresh(self) -> bool:
+        """
+        Read the positions of the circles that moved since the last refresh. Returns False
+        if some circle is off its slot (for example in the middle of an animation), in which
+        case callers should fall back to geometry.
+        """
+        topology = BoardTopology.for_system(self.system)
+        if topology is not self.topology:
+            self.topology = topology
+            self.small_at = [None] * topology.small_count
+            self.medium_at = [None] * topology.medium_count
+            self.slot_of = {}
+            self.medium_slot_of = {}
+            self._snapshots = {}
+            self._pending = {}
+            self._full_scan = True
+            for circle in self.system.small_circles:
+                circle.color_listener = self
+
+        if self._full_scan:
+            self._full_scan = False
+            self._moved_small.update(self.system.small_circles)
+            self._moved_medium.update(self.system.medium_circles)
+        if self._moving:
+            return False
+
+        landed = []
+        for moved, slot_at, circle_at, slot_of in (
+            (self._moved_small, topology.small_slot_at, self.small_at, self.slot_of),
+            (
+                self._moved_medium,
+                topology.medium_slot_at,
+                self.medium_at,
+                self.medium_slot_of,
+            ),
+        ):
+            for circle in list(moved):
+                slot = slot_at((circle.pos[0], circle.pos[1]))
+                if slot is None:
+                    slot_of.pop(circle, None)
+                    continue
+                moved.discard(circle)
+                slot_of[circle] = slot
+                circle_at[slot] = circle
+                if slot_of is self.slot_of:
+                    landed.append(circle)
+
+        for pending in self._pending.values():
+            pending.update(landed)
+        return not (self._moved_small or self._moved_medium)
+
+    def changed_since(self, consumer: str) -> List:
+        """Small circles whose slot or color changed since this consumer's last call."""
+        snapshot = self._snapshots.get(consumer)
+        if snapshot is None:
+            snapshot = self._snapshots[consumer] = {}
+            candidates = list(self.slot_of)
+        else:
+            candidates = self._pending[consumer]
+        self._pending[consumer] = set()
+
+        changed = []
+        for circle in candidates:
+            slot = self.slot_of.get(circle)
+            if slot is None:
+                continue  # Off its slot; queued again when it lands
+            state = (slot, circle.color)
+            if snapshot.get(circle) != state:
+                snapshot[circle] = state
+                changed.append(circle)
+        return changed
+
+    def members(self, medium_slot: int) -> List:
+        """Small circles currently inside a medium slot."""
+        return [self.small_at[s] for s in self.topology.medium_members[medium_slot]]
+
+    def parents(self, small_circle) -> tuple:
+        """Medium slots containing a small circle."""
+        return self.topology.small_parents[self.slot_of[small_circle]]
+
+    def large_members(self, large_index: int) -> List:
+        """Medium circles currently completely inside a large circle."""
+        return [self.medium_at[m] for m in self.topology.large_members[large_index]]
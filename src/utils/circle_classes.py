@@ -14,8 +14,35 @@ class CircleIdentity:
         return hash(self.id)
 
 
+class _ColorTracked:
+    """
+    Reports every color assignment to an attached counter (see BoardStats) and listener
+    (see SlotIndex).
+
+    Only color is a property; the dataclass field of the same name leaves no class
+    attribute behind, so assignments reach the setter while every other attribute
+    stays a plain write.
+    """
+
+    color_tracker = None
+    color_listener = None
+    _color = None
+
+    @property
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        if self.color_tracker is not None:
+            self.color_tracker.color_changed(self._color, value)
+        if self.color_listener is not None:
+            self.color_listener.circle_recolored(self)
+        self._color = value
+
+
 @dataclass
-class SmallCircle:
+class SmallCircle(_ColorTracked):
     """Small circle with game-specific functionality"""
 
     id: int
@@ -46,7 +73,7 @@ class SmallCircle:
 
 
 @dataclass
-class MediumCircle:
+class MediumCircle(_ColorTracked):
     """medium circle with animation and game functionality"""
 
     id: int
@@ -57,7 +84,6 @@ class MediumCircle:
     is_animating: bool = field(default=False)
     animation_start: float = field(default=0.0)
     target_rotation: float = field(default=0.0)
-    initial_angles: Dict = field(default_factory=dict)
     identity: CircleIdentity = field(init=False)
 
     def __post_init__(self):
@@ -75,7 +101,7 @@ class MediumCircle:
 
 
 @dataclass
-class LargeCircle:
+class LargeCircle(_ColorTracked):
     """Large circle containing medium circles"""
 
     id: int
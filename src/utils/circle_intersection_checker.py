@@ -1,13 +1,94 @@
 # circle_intersection_checker.py
-import math
 from .settings import RED, BLUE, GREY, CIRCLE_MEDIUM_RADIUS
 
+# Per-slot color codes for the overlap counters
+_OTHER = 0
+_RED = 1
+_BLUE = 2
+
+
+def _color_code(color):
+    if color == RED:
+        return _RED
+    if color == BLUE:
+        return _BLUE
+    return _OTHER
+
 
 class CircleIntersectionChecker:
-    @staticmethod
-    def check_medium_circle_intersections(medium_circles):
+    """
+    Applies the intersection rule: a grey medium circle overlapping at least two red (or
+    else two blue) medium circles takes that color.
+
+    Medium circles only move between fixed slots, so when a slot index is available the
+    overlap graph comes from BoardTopology.medium_neighbors and each slot keeps a count of
+    its red and blue neighbors. The counters are updated from the slots whose color changed
+    since the previous call, which turns the rule into a counter check.
+    """
+
+    def __init__(self, slot_index=None):
+        self.slot_index = slot_index
+        self._topology = None
+        self._slot_colors = []  # Color code per medium slot when the counters were last updated
+        self._red_neighbors = []
+        self._blue_neighbors = []
+
+    def check_medium_circle_intersections(self, medium_circles):
         """Check for intersections between medium circles and update colors accordingly"""
+        if self.slot_index is not None and self.slot_index.refresh():
+            return self._check_from_slots(medium_circles)
+        return self.check_by_distance(medium_circles)
+
+    def _check_from_slots(self, medium_circles):
+        slot_index = self.slot_index
+        neighbors = slot_index.topology.medium_neighbors
+        if slot_index.topology is not self._topology:
+            self._topology = slot_index.topology
+            self._slot_colors = [_OTHER] * len(neighbors)
+            self._red_neighbors = [0] * len(neighbors)
+            self._blue_neighbors = [0] * len(neighbors)
+
+        for slot, circle in enumerate(slot_index.medium_at):
+            self._set_slot_color(slot, _color_code(circle.color), neighbors)
+
+        # Same order as the distance based check, so earlier changes count for later circles
+        changes_made = False
+        for circle in medium_circles:
+            if circle.color != GREY:
+                continue
+            slot = slot_index.medium_slot_of[circle]
+            if self._red_neighbors[slot] >= 2:
+                circle.color = RED
+            elif self._blue_neighbors[slot] >= 2:
+                circle.color = BLUE
+            else:
+                continue
+            self._set_slot_color(slot, _color_code(circle.color), neighbors)
+            changes_made = True
+
+        return changes_made
+
+    def _set_slot_color(self, slot, code, neighbors):
+        """Record a slot's color and move its neighbors' counters along with it."""
+        previous = self._slot_colors[slot]
+        if code == previous:
+            return
+        self._slot_colors[slot] = code
+        for other in neighbors[slot]:
+            if previous == _RED:
+                self._red_neighbors[other] -= 1
+            elif previous == _BLUE:
+                self._blue_neighbors[other] -= 1
+            if code == _RED:
+                self._red_neighbors[other] += 1
+            elif code == _BLUE:
+                self._blue_neighbors[other] += 1
+
+    @staticmethod
+    def check_by_distance(medium_circles):
+        """Intersection rule from the current positions, for circles that are off their slots"""
         changes_made = False
+        max_distance_squared = (2 * CIRCLE_MEDIUM_RADIUS) ** 2
         for circle in medium_circles:
             if circle.color == GREY:
                 intersecting_red = 0
@@ -17,9 +98,8 @@ class CircleIntersectionChecker:
                     if other_circle != circle:
                         dx = circle.pos[0] - other_circle.pos[0]
                         dy = circle.pos[1] - other_circle.pos[1]
-                        distance = math.sqrt(dx**2 + dy**2)
 
-                        if distance < 2 * CIRCLE_MEDIUM_RADIUS:
+                        if dx * dx + dy * dy < max_distance_squared:
                             if other_circle.color == RED:
                                 intersecting_red += 1
                             elif other_circle.color == BLUE:
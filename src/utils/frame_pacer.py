@@ -0,0 +1,103 @@
+import time
+from collections import deque
+import pygame
+from .settings import TARGET_FPS, IDLE_FRAMES, IDLE_WAIT_MS, FRAME_STATS_WINDOW
+
+
+class FrameStats:
+    """Frame times of the main loop over a window of recent frames"""
+
+    def __init__(self, window=FRAME_STATS_WINDOW):
+        self.work_times = deque(maxlen=window)  # Seconds spent on each frame, without waiting
+        self.intervals = deque(maxlen=window)  # Seconds between the ends of consecutive frames
+        self.idle = deque(maxlen=window)  # Whether each frame was run from the idle wait
+        self.frames = 0
+
+    def record(self, work_time, interval, idle):
+        self.work_times.append(work_time)
+        self.intervals.append(interval)
+        self.idle.append(idle)
+        self.frames += 1
+
+    @property
+    def fps(self) -> float:
+        total = sum(self.intervals)
+        return len(self.intervals) / total if total > 0 else 0.0
+
+    def percentile(self, fraction) -> float:
+        """Frame work time in seconds that this fraction of the window stays under"""
+        if not self.work_times:
+            return 0.0
+        ordered = sorted(self.work_times)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary_lines(self):
+        """Short text lines for the debug overlay and the console"""
+        if not self.work_times:
+            return []
+        average = sum(self.work_times) / len(self.work_times)
+        idle_share = sum(self.idle) / len(self.idle)
+        return [
+            f"Frames {self.frames}: {self.fps:.1f} fps, {idle_share:.0%} idle",
+            f"frame {average * 1000:.1f}ms avg, {self.percentile(0.95) * 1000:.1f}ms p95, "
+            f"{max(self.work_times) * 1000:.1f}ms max",
+        ]
+
+
+class FramePacer:
+    """
+    Paces the main loop: the full frame rate while anything happens, sleeping while idle.
+
+    A frame is busy when it had input, changed the display, or the game reports work in
+    progress (animations, AI thinking, network messages). After idle_frames frames in a
+    row without any of that, the loop blocks in pygame.event.wait for up to idle_wait_ms
+    instead of ticking, so input wakes it at once and the next frame runs at full rate.
+    Without blocking (the browser build), the caller sleeps for idle_delay() instead.
+    """
+
+    def __init__(
+        self,
+        clock,
+        fps=TARGET_FPS,
+        idle_frames=IDLE_FRAMES,
+        idle_wait_ms=IDLE_WAIT_MS,
+        blocking=True,
+    ):
+        self.clock = clock
+        self.fps = fps
+        self.idle_frames = idle_frames
+        self.idle_wait_ms = idle_wait_ms
+        self.blocking = blocking
+        self.quiet_frames = 0
+        self.stats = FrameStats()
+        self._frame_start = time.perf_counter()
+        self._frame_end = None
+
+    @property
+    def idle(self) -> bool:
+        return self.quiet_frames >= self.idle_frames
+
+    def get_events(self):
+        """Events of this frame; while idle, waits for the first one or the idle timeout."""
+        if self.idle and self.blocking:
+            first = pygame.event.wait(self.idle_wait_ms)
+            events = [first] if first.type != pygame.NOEVENT else []
+            events.extend(pygame.event.get())
+        else:
+            events = pygame.event.get()
+        self._frame_start = time.perf_counter()
+        return events
+
+    def end_frame(self, busy: bool, tick=True):
+        """Record the frame and wait for the next one at the full rate unless idle."""
+        now = time.perf_counter()
+        previous_end = self._frame_end if self._frame_end is not None else self._frame_start
+        self.stats.record(now - self._frame_start, now - previous_end, self.idle)
+        self.quiet_frames = 0 if busy else self.quiet_frames + 1
+        self._frame_end = now
+        if tick and not self.idle:
+            self.clock.tick(self.fps)
+
+    def idle_delay(self) -> float:
+        """Seconds a non-blocking caller should sleep before the next frame"""
+        return self.idle_wait_ms / 1000 if self.idle else 0.0
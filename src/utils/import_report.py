@@ -0,0 +1,119 @@
+"""
+Import time report: where the time of a cold start goes.
+
+Runs a fresh interpreter with -X importtime, so nothing is cached in sys.modules yet, and
+sums the self time of every module per top-level package. With --menu it also builds the
+Game object (display, menu, fonts and sounds, on SDL's dummy drivers) and reports the
+wall time from interpreter start to the menu. --limit turns the report into a
+benchmark check that fails when the total goes over budget.
+
+    python -m src.utils.import_report
+    python -m src.utils.import_report --menu --limit 1.0
+    python -m src.utils.import_report --module src.ai.strategic_ai_player --top 5
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import argparse
+import os
+import subprocess
+import sys
+
+_MENU_SCRIPT = """
+import time
+start = time.perf_counter()
+from src.game import Game
+Game()
+print(f"menu {time.perf_counter() - start}")
+"""
+
+
+@dataclass
+class ImportReport:
+    """Self and cumulative import times, in seconds."""
+
+    module: str
+    total: float = 0.0  # Cumulative time of the imported module
+    packages: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    modules: List[Tuple[str, float, float]] = field(default_factory=list)  # name, self, cumul.
+    menu_time: Optional[float] = None
+
+    def top_packages(self, count: int) -> List[Tuple[str, float]]:
+        return sorted(self.packages.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def top_modules(self, count: int) -> List[Tuple[str, float, float]]:
+        return sorted(self.modules, key=lambda item: item[2], reverse=True)[:count]
+
+
+def parse_importtime(output: str, module: str) -> ImportReport:
+    """Build a report from the stderr of python -X importtime."""
+    report = ImportReport(module)
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        self_time = int(self_us) / 1e6
+        cumulative = int(cumulative_us) / 1e6
+        report.modules.append((name, self_time, cumulative))
+        report.packages[name.split(".")[0]] += self_time
+        if name == module:
+            report.total = cumulative
+    return report
+
+
+def measure(module: str = "src.game", menu: bool = False) -> ImportReport:
+    """Import module (or start the game up to its menu) in a new interpreter."""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    code = _MENU_SCRIPT if menu else f"import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    report = parse_importtime(result.stderr, "src.game" if menu else module)
+    for line in result.stdout.splitlines():
+        if line.startswith("menu "):
+            report.menu_time = float(line.split()[1])
+    return report
+
+
+def format_report(report: ImportReport, top: int = 10) -> List[str]:
+    lines = [f"import {report.module}: {report.total * 1000:.0f} ms"]
+    if report.menu_time is not None:
+        lines.append(f"start to menu: {report.menu_time * 1000:.0f} ms")
+    lines.append("slowest packages (self time):")
+    lines.extend(f"  {name:<28} {t * 1000:8.1f} ms" for name, t in report.top_packages(top))
+    lines.append("slowest modules (cumulative):")
+    lines.extend(
+        f"  {name:<48} {cumulative * 1000:8.1f} ms"
+        for name, _, cumulative in report.top_modules(top)
+    )
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report where the start-up import time goes")
+    parser.add_argument("--module", default="src.game", help="module to import (src.game)")
+    parser.add_argument("--menu", action="store_true", help="also start the game up to the menu")
+    parser.add_argument("--top", type=int, default=10, help="entries per list (default 10)")
+    parser.add_argument("--limit", type=float, help="fail when the start takes longer (seconds)")
+    args = parser.parse_args(argv)
+
+    report = measure(args.module, args.menu)
+    print("\n".join(format_report(report, args.top)))
+
+    measured = report.menu_time if report.menu_time is not None else report.total
+    if args.limit is not None and measured > args.limit:
+        print(f"Over the {args.limit:.2f}s budget by {measured - args.limit:.2f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,100 @@
+from collections import deque
 from .settings import RED, BLUE, GREY
 
 
+def _bits(mask):
+    """Yield the indices of the set bits of mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
 class IslandDetector:
+    """
+    Finds groups of same-colored small circles completely surrounded by the opposite color.
+
+    find_islands scans the whole board. find_changed_islands works on slot bitmasks and only
+    floods the components that contain or touch a circle changed since its last call; any
+    other component was already checked and found not to be an island.
+    """
+
+    def __init__(self):
+        self._adjacency = None
+        self._neighbor_masks = []
+
+    def find_changed_islands(self, slot_index, connection_manager):
+        """Slot based find_islands; slot_index must be refreshed and on its slots."""
+        graph_changed = self._update_neighbor_masks(slot_index, connection_manager)
+        changed = slot_index.changed_since("islands")
+        masks = self._neighbor_masks
+
+        red_mask = 0
+        blue_mask = 0
+        for slot, circle in enumerate(slot_index.small_at):
+            if circle.color == RED:
+                red_mask |= 1 << slot
+            elif circle.color == BLUE:
+                blue_mask |= 1 << slot
+
+        if graph_changed:
+            seeds = (1 << len(masks)) - 1
+        else:
+            seeds = 0
+            for circle in changed:
+                slot = slot_index.slot_of[circle]
+                seeds |= (1 << slot) | masks[slot]
+
+        red_islands = []
+        blue_islands = []
+        candidates = seeds & (red_mask | blue_mask)
+        while candidates:
+            start = (candidates & -candidates).bit_length() - 1
+            is_red = bool(red_mask >> start & 1)
+            color_mask, opposite_mask = (red_mask, blue_mask) if is_red else (blue_mask, red_mask)
+
+            component, reach = self._flood(start, color_mask)
+            candidates &= ~component
+            border = reach & ~component
+            if border and not border & ~opposite_mask:
+                island = [slot_index.small_at[slot] for slot in _bits(component)]
+                (red_islands if is_red else blue_islands).append(island)
+
+        return red_islands, blue_islands
+
+    def _update_neighbor_masks(self, slot_index, connection_manager):
+        """Rebuild per-slot neighbor masks when the connections change; True if the graph did."""
+        adjacency = connection_manager.adjacent_connections
+        if adjacency is self._adjacency:
+            return False
+
+        slot_of = slot_index.slot_of
+        masks = [0] * len(slot_index.small_at)
+        for circle, neighbors in adjacency.items():
+            mask = 0
+            for neighbor in neighbors:
+                mask |= 1 << slot_of[neighbor]
+            masks[slot_of[circle]] = mask
+
+        graph_changed = masks != self._neighbor_masks
+        self._adjacency = adjacency
+        self._neighbor_masks = masks
+        return graph_changed
+
+    def _flood(self, start, color_mask):
+        """Component of start within color_mask, and the union of its members' neighbors."""
+        masks = self._neighbor_masks
+        component = frontier = 1 << start
+        reach = 0
+        while frontier:
+            grown = 0
+            for slot in _bits(frontier):
+                grown |= masks[slot]
+            reach |= grown
+            frontier = grown & color_mask & ~component
+            component |= frontier
+        return component, reach
+
     @staticmethod
     def find_islands(small_circles, connection_manager):
         red_islands = []
@@ -31,11 +124,11 @@ class IslandDetector:
             return None
 
         component = []
-        queue = [start_circle]
+        queue = deque([start_circle])
         local_visited = set()
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current in local_visited:
                 continue
 
@@ -14,8 +14,8 @@ class MoveExecutor:
         self.system = circle_system
         self.placement_sound = pygame.mixer.Sound("assets/sounds/l1.wav")
 
-    def make_placement_move(self, circle, player_color):
-        """Make a placement move if valid."""
+    def make_placement_move(self, circle, player_color, instant=False):
+        """Make a placement move if valid; instant placements are silent."""
         if self.system.is_any_circle_animating():
             return False
 
@@ -23,7 +23,8 @@ class MoveExecutor:
         circle.set_color(current_color)
 
         # Play placement sound
-        self.placement_sound.play()
+        if not instant:
+            self.placement_sound.play()
 
         self.system.color_manager.update_all_colors(
             self.system.medium_circles,
@@ -35,35 +36,44 @@ class MoveExecutor:
 
         # Change phase to rotation after placement
         self.system.game_state.phase = PHASE_ROTATION
+        self.system.mark_board_changed()
         return True
 
-    def make_rotation_move(self, circle, player_color, contained_circles_only=False):
-        """Make a rotation move for either a medium circle or large circle."""
+    def make_rotation_move(
+        self, circle, player_color, contained_circles_only=False, instant=False
+    ):
+        """
+        Make a rotation move for either a medium circle or large circle.
+
+        An instant rotation is applied completely before returning, without animation.
+        """
         if self.system.is_any_circle_animating():
             return False
 
         current_color = RED if player_color == "red" else BLUE
 
         if isinstance(circle, type(self.system.medium_circles[0])):
-            return self._execute_medium_circle_rotation(circle, current_color)
+            return self._execute_medium_circle_rotation(circle, current_color, instant)
         else:
             return self._execute_super_circle_rotation(
-                circle, current_color, contained_circles_only
+                circle, current_color, contained_circles_only, instant
             )
 
-    def _execute_medium_circle_rotation(self, medium_circle, current_color):
+    def _execute_medium_circle_rotation(self, medium_circle, current_color, instant=False):
         circles_inside = get_circles_inside_at_position(
             medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.system.small_circles
         )
 
         if any(circle.color == current_color for circle in circles_inside):
             self.system.animation_handler.start_medium_circle_rotation(
-                medium_circle, circles_inside
+                medium_circle, circles_inside, instant
             )
             return True
         return False
 
-    def _execute_super_circle_rotation(self, super_circle, current_color, contained_circles_only):
+    def _execute_super_circle_rotation(
+        self, super_circle, current_color, contained_circles_only, instant=False
+    ):
         print(f"Executing large rotation in {super_circle.id}")
 
         if contained_circles_only:
@@ -82,7 +92,7 @@ class MoveExecutor:
             super_circle.pos, medium_circles_inside, current_color
         ):
             super_circle.medium_circles = medium_circles_inside
-            self.system.animation_handler.start_large_circle_rotation(super_circle)
+            self.system.animation_handler.start_large_circle_rotation(super_circle, instant)
             return True
         return False
 
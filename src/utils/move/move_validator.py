@@ -3,76 +3,153 @@ from ..settings import (
     BLUE,
     GREY,
     PHASE_PLACEMENT,
+    CIRCLE_SMALL_RADIUS,
     CIRCLE_MEDIUM_RADIUS,
     CIRCLE_LARGE_RADIUS,
 )
-from ..geometry import get_circles_inside_at_position, get_completely_contained_circles
+from ..circle_classes import SmallCircle
+from ..geometry import (
+    calculate_distance,
+    get_circles_inside_at_position,
+    get_completely_contained_circles,
+)
+
+# Click radius around a valid move, the same as the green contour drawn for it
+PLACEMENT_HIT_RADIUS = CIRCLE_SMALL_RADIUS + 4
+ROTATION_HIT_RADIUS = CIRCLE_MEDIUM_RADIUS + 4
 
 
 class MoveValidator:
     def __init__(self, circle_system):
         self.system = circle_system
+        self._cache_key = None
+        self._valid_moves = []
+        self._hit_grid = None
 
     def get_valid_moves(self):
-        """Returns the valid moves for the current phase and turn."""
+        """
+        Returns the valid moves for the current phase and turn.
 
+        The list is cached until the board version, turn or phase changes, so callers must
+        copy it before modifying it.
+        """
         if self.system.is_any_circle_animating():
             return []
 
-        current_color = RED if self.system.game_state.turn == "red" else BLUE
+        key = self._state_key()
+        if key != self._cache_key:
+            self._valid_moves = self._generate_valid_moves()
+            self._hit_grid = None
+            self._cache_key = key
+        return self._valid_moves
 
+    def get_move_at(self, pos):
+        """Valid move whose click area contains pos, or None if there are zero or several."""
+        valid_moves = self.get_valid_moves()
+        if not valid_moves:
+            return None
+        if self._hit_grid is None:
+            self._hit_grid = self._build_hit_grid(valid_moves)
+
+        cell_x = int(pos[0] // ROTATION_HIT_RADIUS)
+        cell_y = int(pos[1] // ROTATION_HIT_RADIUS)
+        hits = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for move in self._hit_grid.get((cell_x + dx, cell_y + dy), ()):
+                    if calculate_distance(pos, move.pos) <= self._hit_radius(move):
+                        hits.append(move)
+
+        return hits[0] if len(hits) == 1 else None
+
+    def _state_key(self):
+        state = self.system.game_state
+        return (self.system.board_version, state.turn, state.phase)
+
+    def _current_color(self):
+        return RED if self.system.game_state.turn == "red" else BLUE
+
+    def _generate_valid_moves(self):
+        current_color = self._current_color()
         if self.system.game_state.phase == PHASE_PLACEMENT:
-            valid_moves = self._get_valid_placement_moves(current_color)
-            return valid_moves
-        else:
-            valid_moves = self._get_valid_rotation_moves(current_color)
-            return valid_moves
+            return self._get_valid_placement_moves(current_color)
+        return self._get_valid_rotation_moves(current_color)
+
+    def _build_hit_grid(self, valid_moves):
+        """Bucket moves by grid cell so a click only tests the moves next to it."""
+        grid = {}
+        for move in valid_moves:
+            cell_x = int(move.pos[0] // ROTATION_HIT_RADIUS)
+            cell_y = int(move.pos[1] // ROTATION_HIT_RADIUS)
+            grid.setdefault((cell_x, cell_y), []).append(move)
+        return grid
+
+    @staticmethod
+    def _hit_radius(move):
+        return PLACEMENT_HIT_RADIUS if isinstance(move, SmallCircle) else ROTATION_HIT_RADIUS
+
+    def _medium_contents(self):
+        """Pairs of (medium circle, small circles inside it) for the current positions."""
+        slot_index = self.system.color_manager.slot_index
+        if slot_index.refresh():
+            return [
+                (slot_index.medium_at[m], slot_index.members(m))
+                for m in range(slot_index.topology.medium_count)
+            ]
+        return [
+            (
+                medium_circle,
+                get_circles_inside_at_position(
+                    medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.system.small_circles
+                ),
+            )
+            for medium_circle in self.system.medium_circles
+        ]
 
     def _get_valid_placement_moves(self, current_color):
-        invalid_circles = []
-        for medium_circle in self.system.medium_circles:
-            circles_inside = get_circles_inside_at_position(
-                medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.system.small_circles
-            )
+        invalid_circles = set()
+        for _, circles_inside in self._medium_contents():
             if any(circle.color == current_color for circle in circles_inside):
-                invalid_circles.extend(circles_inside)
+                invalid_circles.update(circles_inside)
 
-        valid_moves = [
+        return [
             circle
             for circle in self.system.small_circles
             if circle not in invalid_circles and circle.color == GREY
         ]
 
-        if not valid_moves:
-            self.system.game_state.phase = "rotation"
-            print("No valid moves found. Changing phase to rotation for color ", current_color)
-
-        return valid_moves
-
     def _get_valid_rotation_moves(self, current_color):
         valid_moves = []
 
         # Check medium circles
-        for medium_circle in self.system.medium_circles:
-            if self._is_valid_medium_circle_rotation(medium_circle, current_color):
-                valid_moves.append(medium_circle)
+        valid_mediums = {
+            medium_circle
+            for medium_circle, circles_inside in self._medium_contents()
+            if any(circle.color == current_color for circle in circles_inside)
+        }
+        valid_moves.extend(
+            medium_circle
+            for medium_circle in self.system.medium_circles
+            if medium_circle in valid_mediums
+        )
 
         # Check large circles
-        for large_circle in self.system.circle_manager.large_circles:
-            if self._is_valid_large_circle_rotation(large_circle, current_color):
+        for index, large_circle in enumerate(self.system.circle_manager.large_circles):
+            if self._is_valid_large_circle_rotation(index, large_circle, current_color):
                 valid_moves.append(large_circle)
 
         return valid_moves
 
-    def _is_valid_medium_circle_rotation(self, medium_circle, current_color):
-        circles_inside = get_circles_inside_at_position(
-            medium_circle.pos, CIRCLE_MEDIUM_RADIUS, self.system.small_circles
-        )
-        return any(circle.color == current_color for circle in circles_inside)
-
-    def _is_valid_large_circle_rotation(self, large_circle, current_color):
-        medium_circles_inside = get_completely_contained_circles(
-            large_circle.pos, CIRCLE_LARGE_RADIUS, self.system.medium_circles, CIRCLE_MEDIUM_RADIUS
-        )
+    def _is_valid_large_circle_rotation(self, index, large_circle, current_color):
+        slot_index = self.system.color_manager.slot_index
+        if slot_index.refresh():
+            medium_circles_inside = slot_index.large_members(index)
+        else:
+            medium_circles_inside = get_completely_contained_circles(
+                large_circle.pos,
+                CIRCLE_LARGE_RADIUS,
+                self.system.medium_circles,
+                CIRCLE_MEDIUM_RADIUS,
+            )
 
         return any(circle.color == current_color for circle in medium_circles_inside)
@@ -1,4 +1,3 @@
-import pygame
 from enum import Enum
 from typing import Dict, Any, Optional
 
@@ -7,13 +6,19 @@ from typing import Dict, Any, Optional
 WIDTH = 600
 HEIGHT = 600
 FONT_SIZE = 32
-WINDOW = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Interactive Circle System")
 
 DRAW_CONNECTIONS = False
 DRAW_TURN_AND_PHASE = False
 DRAW_SAVE_LOAD_UI = False
 DRAW_SCORES = False
+DIRTY_RECT_UPDATES = True  # Push only the changed parts of the window; False flips every frame
+
+# Frame pacing
+TARGET_FPS = 60  # Frame rate of the main loop while anything is happening
+IDLE_FRAMES = 30  # Frames without input or changes before the main loop starts sleeping
+IDLE_WAIT_MS = 100  # Longest sleep per idle frame; input wakes the loop at once
+FRAME_STATS_WINDOW = 600  # Recent frames the frame-time statistics cover
+FRAME_STATS_LOG_INTERVAL = None  # Seconds between frame-time reports on the console, or None
 
 # Colors
 WHITE = (255, 255, 255)
@@ -42,7 +47,24 @@ VALID_COLORS = ["red", "blue"]
 
 AI_THINKING_TIME = 2000  # 2000  # AI thinking time in milliseconds
 AI_MAX_THINK_TIME = 2.0  # Maximum AI thinking time in seconds
+AI_NODE_BUDGET = None  # Evaluated positions per search; when set, replaces the think time limit
+AI_RANDOM_SEED = None  # Seed for the AI's move ordering and network, for reproducible play
+AI_STATS_LOG_PATH = None  # JSON-lines file receiving per-search statistics, e.g. "ai_stats.jsonl"
+AI_BACKEND = "auto"  # "strategic" (network search), "web" (pure Python) or "auto" by platform
+AI_SEARCH_SLICE_TIME = 0.008  # Seconds the AI searches per frame before handing back control
+WEB_AI_SLICE_TIME = AI_SEARCH_SLICE_TIME  # Slice length of the web AI, for the browser's frames
+WEB_AI_WEIGHTS_PATH = "assets/ai_weights.json"  # Placement weight table exported from the network
+ENDGAME_EMPTY_THRESHOLD = 10  # Switch to the exact endgame solver at or below this many grey circles
+ENDGAME_MAX_DEPTH = 6  # Maximum endgame search depth in plies (placements and rotations)
+ENDGAME_THINK_SHARE = 0.5  # Share of the think time or node budget the endgame solver may use
+EVAL_CACHE_ENABLED = False  # Reuse AI search results stored by earlier sessions (writes a file)
+EVAL_CACHE_PATH = "eval_cache.sqlite"  # Persistent AI evaluation cache file
+EVAL_CACHE_MEMORY_ENTRIES = 50000  # Positions kept in the in-memory LRU in front of the file
+SPRITE_CACHE_DIR = "sprite_cache"  # Pre-rendered sprites, rebuilt when a file is missing
+TEXT_CACHE_ENTRIES = 512  # Rendered text surfaces kept by the shared LRU of the UI renderers
 RESET_GAME_DELAY = 2000  # Delay before resetting the game in milliseconds
+FAST_FORWARD_SCALE = 10  # Simulated seconds per real second when training fast-forwards (2-100)
+FAST_FORWARD_FRAME_SKIP = 4  # Render every Nth frame while fast-forwarding
 
 SHOW_IDS = False  # Show circle IDs for debugging
 
@@ -0,0 +1,108 @@
+"""
+Perft counts and move generation of the board models checked against each other.
+
+The perft numbers pin the fast board's move generator; the live MoveValidator and the
+NumPy BatchBoard are compared with it move by move over random games.
+"""
+
+import contextlib
+import io
+import os
+import random
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from src.utils.board.fast_board import (  # noqa: E402
+    FastBoard,
+    LARGE_ROTATION,
+    PLACE,
+    fast_move_for,
+    find_live_circle,
+)
+from src.utils.board.perft import perft, starting_board  # noqa: E402
+
+PERFT_COUNTS = {
+    False: [272, 384, 104064],
+    True: [48, 64, 3008, 4000],
+}
+
+
+@pytest.mark.parametrize("reduced_version", [False, True], ids=["full", "reduced"])
+def test_perft_counts(reduced_version):
+    board = starting_board(reduced_version)
+    expected = PERFT_COUNTS[reduced_version]
+    assert [perft(board, depth).nodes for depth in range(1, len(expected) + 1)] == expected
+
+
+def _live_system(reduced_version):
+    from src.game import Game
+    from src.utils.settings import GameMode
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = Game()
+        game.set_game_mode(GameMode.OFFLINE, reduced_version)
+    return game.controller.systems["circle"]
+
+
+def _play_live(system, move):
+    circle = find_live_circle(system, move)
+    turn = system.game_state.turn
+    if move[0] == PLACE:
+        played = system.move_handler.make_placement_move(circle, turn, instant=True)
+    else:
+        played = system.move_handler.make_rotation_move(
+            circle, turn, contained_circles_only=move[0] == LARGE_ROTATION, instant=True
+        )
+    system.update()
+    return played
+
+
+@pytest.mark.parametrize(
+    "reduced_version, seed, plies", [(True, 1, 200), (False, 2, 60)], ids=["reduced", "full"]
+)
+def test_fast_board_moves_match_move_validator(reduced_version, seed, plies):
+    system = _live_system(reduced_version)
+    rng = random.Random(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(plies):
+            board = FastBoard.from_system(system)
+            if board.winner():
+                break
+            system.move_handler.skip_blocked_placement()
+            live_moves = {fast_move_for(system, c) for c in system.move_handler.get_valid_moves()}
+            fast_moves = board.valid_moves()
+            assert live_moves == set(fast_moves)
+            assert _play_live(system, rng.choice(fast_moves))
+
+
+@pytest.mark.parametrize("reduced_version", [False, True], ids=["full", "reduced"])
+def test_batch_board_matches_fast_board(reduced_version):
+    np = pytest.importorskip("numpy")
+    from src.utils.board.batch_board import BatchBoard
+
+    boards = [starting_board(reduced_version) for _ in range(16)]
+    batch = BatchBoard.from_boards(boards)
+    rng = np.random.default_rng(3)
+    for _ in range(150):
+        mask = batch.legal_move_mask()
+        for index, board in enumerate(boards):
+            legal = {batch.action_to_move(a) for a in np.flatnonzero(mask[index])}
+            assert legal == set(board.valid_moves())
+
+        actions = batch.random_actions(rng)
+        actions[batch.winners() != 0] = -1
+        batch.step(actions)
+        for index, (board, action) in enumerate(zip(boards, actions)):
+            if action >= 0:
+                board.play(batch.action_to_move(int(action)))
+            copied = batch.board(index)
+            assert (copied.small, copied.medium, copied.large, copied.turn) == (
+                board.small,
+                board.medium,
+                board.large,
+                board.turn,
+            )
+            assert set(copied.valid_moves()) == set(board.valid_moves())